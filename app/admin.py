@@ -0,0 +1,24 @@
+# app/admin.py
+import secrets
+from typing import Optional
+from fastapi import Header, HTTPException, status
+from app.config import settings
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """FastAPI dependency guarding admin endpoints; they are refused until settings.admin_token is configured"""
+    if not settings.admin_token:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                            detail="Admin endpoints are disabled; set ADMIN_TOKEN to enable them")
+    if not secrets.compare_digest(x_admin_token or "", settings.admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid or missing admin token")
+
+def require_known_version(registry, model_name: str, version: Optional[str]):
+    """Reject a requested model version unless the registry lists it"""
+    if version is None:
+        return
+    if registry is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="No model registry is configured; a version can't be selected")
+    if version not in registry.versions(model_name):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail=f"Version '{version}' of '{model_name}' does not exist")
@@ -0,0 +1,109 @@
+# app/batching.py
+import asyncio
+from collections import Counter
+from typing import Any, Callable, List, Optional, Sequence
+
+# Upper bounds of the batch-size histogram buckets reported by stats()
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+class MicroBatcher:
+    """
+    Gathers single predictions that arrive within a short window into one
+    batched model call.
+
+    Each caller awaits ``submit(value)``. The first pending item starts a
+    timer of ``window_ms``; when it fires, or as soon as ``max_batch_size``
+    items are pending, the whole batch is passed to ``predict_batch`` and
+    every caller's future is resolved with its own result. If an
+    ``executor`` (see app.executor.InferenceExecutor) is given, the batch
+    call runs on it instead of blocking the event loop.
+    """
+
+    def __init__(self, predict_batch: Callable[[Sequence[Any]], Sequence[Any]],
+                 window_ms: float = 2.0, max_batch_size: int = 256, executor: Optional[Any] = None):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.predict_batch = predict_batch
+        self.window = max(window_ms, 0) / 1000
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self._pending: List[tuple] = []
+        self._timer = None
+        self._batch_sizes = Counter()
+        self._tasks = set()
+
+    async def submit(self, value: Any) -> Any:
+        """Queue one input and wait for its prediction."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((value, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self._batch_sizes[len(batch)] += 1
+        if self.executor is None:
+            try:
+                predictions = self.predict_batch([value for value, _ in batch])
+            except Exception as e:
+                self._fail(batch, e)
+            else:
+                self._resolve(batch, predictions)
+        else:
+            task = asyncio.get_running_loop().create_task(self._run_on_executor(batch))
+            # Keep a reference so the task isn't garbage collected mid-flight
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_on_executor(self, batch):
+        try:
+            predictions = await self.executor.run(self.predict_batch, [value for value, _ in batch])
+        except Exception as e:
+            self._fail(batch, e)
+        else:
+            self._resolve(batch, predictions)
+
+    @staticmethod
+    def _resolve(batch, predictions):
+        for (_, future), prediction in zip(batch, predictions):
+            # A caller may have been cancelled (e.g. client disconnected)
+            if not future.done():
+                future.set_result(prediction)
+
+    @staticmethod
+    def _fail(batch, error):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def stats(self) -> dict:
+        """Batch-size distribution, for tuning the window and max size."""
+        batches = sum(self._batch_sizes.values())
+        requests = sum(size * count for size, count in self._batch_sizes.items())
+        histogram = {f"<={bound}": 0 for bound in BATCH_SIZE_BUCKETS}
+        histogram["+Inf"] = 0
+        for size, count in self._batch_sizes.items():
+            bucket = next((f"<={bound}" for bound in BATCH_SIZE_BUCKETS if size <= bound), "+Inf")
+            histogram[bucket] += count
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch_size": self.max_batch_size,
+            "batches": batches,
+            "requests": requests,
+            "mean_batch_size": round(requests / batches, 2) if batches else 0.0,
+            "largest_batch": max(self._batch_sizes, default=0),
+            "batch_size_histogram": histogram,
+        }
+
+    def reset_stats(self):
+        self._batch_sizes.clear()
@@ -1,10 +1,59 @@
 # app/config.py
-from pydantic import BaseSettings
+from typing import Dict, Optional
+try:
+    from pydantic_settings import BaseSettings
+except ImportError:
+    try:
+        from pydantic import BaseSettings  # Pydantic v1
+    except ImportError:
+        from pydantic.v1 import BaseSettings  # Pydantic v2 without pydantic-settings
 
 class Settings(BaseSettings):
     mongo_host: str = "localhost"
     mongo_port: str = "27017"
     database_name: str = "diabetes_monitoring"
+
+    # Micro-batching of single risk predictions: requests arriving within
+    # the window (or until the batch is full) share one model.predict call
+    risk_batch_window_ms: float = 2.0
+    risk_batch_max_size: int = 256
+
+    # Bounded pools that run blocking model inference off the event loop.
+    # The food regressor may use "process" to isolate it from the GIL.
+    inference_max_workers: int = 4
+    food_executor_kind: str = "thread"
+
+    # In-process LRU cache of food predictions (size 0 disables caching)
+    prediction_cache_size: int = 4096
+    prediction_cache_ttl_seconds: Optional[float] = None
+
+    # "pickle" loads the joblib/pickle models into each worker; "flat" memory-maps
+    # the arrays written by app.flat_forest so workers on a host share one copy
+    model_artifact_format: str = "pickle"
+    # "flat" evaluates a pickled food regressor with app.flat_forest.FlatForest
+    # (much lower single-row latency than sklearn's predict); "sklearn" keeps the
+    # model as loaded. Flat exports are always evaluated by FlatForest.
+    food_inference_backend: str = "sklearn"
+
+    # Versioned model registry (see app.model_registry). When unset, the local
+    # artifact files are served and their mtime/size act as the version.
+    # Services poll for a new version every model_registry_poll_seconds (0 disables
+    # polling; POST /admin/reload_model still works if admin_token is set).
+    model_registry_dir: Optional[str] = None
+    model_registry_poll_seconds: float = 30.0
+    # Required in the X-Admin-Token header of admin endpoints; they are
+    # disabled while it is unset
+    admin_token: Optional[str] = None
+
+    # Food service logging (see src.utils.setup_logging): the log file rotates
+    # at log_max_bytes, keeping log_backup_count old files. log_sample_rates
+    # keeps 1 in N records per log_type, e.g. the per-request "prediction" lines
+    # (LOG_SAMPLE_RATES='{"prediction": 1}' logs every request).
+    log_dir: str = "logs"
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_backup_count: int = 5
+    log_json: bool = False
+    log_sample_rates: Dict[str, int] = {"prediction": 100}
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,82 @@
+# app/executor.py
+import asyncio
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class InferenceExecutor:
+    """
+    Bounded pool that runs blocking model inference off the event loop.
+
+    ``kind="thread"`` suits sklearn/numpy calls that release the GIL;
+    ``kind="process"`` isolates heavier models in worker processes, where
+    ``initializer`` is expected to load the model once per worker.
+    Submissions beyond ``max_workers`` wait in the pool's queue; the current
+    and peak depth of that queue are reported by ``stats()``.
+    """
+
+    def __init__(self, max_workers: int = 4, kind: str = "thread",
+                 initializer: Optional[Callable] = None, initargs: tuple = ()):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind '{kind}'. Expected one of {EXECUTOR_KINDS}.")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.kind = kind
+        self.max_workers = max_workers
+        self._initializer = initializer
+        self._initargs = initargs
+        self._pool = None
+        self._in_flight = 0
+        self._peak_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+
+    def _get_pool(self):
+        # Created on first use so importing a service doesn't fork workers
+        if self._pool is None:
+            pool_class = ThreadPoolExecutor if self.kind == "thread" else ProcessPoolExecutor
+            self._pool = pool_class(
+                max_workers=self.max_workers,
+                initializer=self._initializer,
+                initargs=self._initargs
+            )
+        return self._pool
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted calls waiting for a free worker."""
+        return max(self._in_flight - self.max_workers, 0)
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        self._peak_queue_depth = max(self._peak_queue_depth, self.queue_depth)
+        try:
+            result = await loop.run_in_executor(self._get_pool(), functools.partial(fn, *args, **kwargs))
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+        self._completed += 1
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self._peak_queue_depth,
+            "completed": self._completed,
+            "failed": self._failed,
+        }
+
+    def shutdown(self, wait: bool = True):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
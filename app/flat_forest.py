@@ -0,0 +1,242 @@
+# app/flat_forest.py
+import argparse
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+FORMAT_VERSION = 1
+MANIFEST_FILENAME = "manifest.json"
+VECTORIZER_FILENAME = "vectorizer.json"
+FOREST_ARRAYS = ("roots", "left", "right", "feature", "threshold", "value")
+
+
+class FlatForest:
+    """
+    A fitted sklearn RandomForest (classifier or regressor) stored as flat,
+    contiguous node arrays.
+
+    All trees share one set of node arrays; ``roots[t]`` is the global node
+    id of tree t's root and ``left``/``right`` hold global child ids (-1 at
+    leaves). Loaded with ``mmap=True`` the arrays are read-only views of the
+    page cache, so every worker process on a host shares one physical copy.
+    """
+
+    # Levels advanced between compactions of the set of unfinished (row, tree) pairs
+    COMPACT_EVERY = 4
+
+    def __init__(self, manifest: dict, arrays: dict):
+        self.manifest = manifest
+        self.kind = manifest["kind"]
+        self.n_features_in_ = manifest["n_features"]
+        self.n_trees = manifest["n_trees"]
+        if self.kind == "classifier":
+            self.classes_ = np.asarray(manifest["classes"])
+        for name in FOREST_ARRAYS:
+            setattr(self, name, arrays[name])
+        self._traversal = None
+
+    def _traversal_arrays(self):
+        """
+        Arrays used by apply(), built on first use: children packed as
+        (n_nodes, 2) with leaves pointing at themselves, and leaf thresholds
+        set to +inf, so a finished pair can take extra steps without moving.
+        """
+        if self._traversal is None:
+            left, right = np.asarray(self.left), np.asarray(self.right)
+            is_leaf = left == -1
+            node_ids = np.arange(len(left))
+            children = np.stack([np.where(is_leaf, node_ids, left), np.where(is_leaf, node_ids, right)], axis=1)
+            self._traversal = (
+                children.astype(np.intp),
+                np.asarray(self.feature, dtype=np.intp),
+                np.where(is_leaf, np.inf, self.threshold),
+                is_leaf,
+                np.asarray(self.roots, dtype=np.intp),
+            )
+        return self._traversal
+
+    @property
+    def split_thresholds(self) -> np.ndarray:
+        """Thresholds of every internal node (used by app.risk_table)."""
+        return np.asarray(self.threshold[np.asarray(self.left) != -1])
+
+    def apply(self, X) -> np.ndarray:
+        """Global leaf node id reached by each row in each tree, shape (n_rows, n_trees)."""
+        X = _as_float32_dense(X)
+        n_rows, n_features = X.shape
+        children, feature, threshold, is_leaf, roots = self._traversal_arrays()
+        # sklearn compares the float32 input as a double
+        values = X.astype(np.float64).ravel()
+        row_offsets = np.repeat(np.arange(n_rows, dtype=np.intp) * n_features, self.n_trees)
+        nodes = np.tile(roots, n_rows)
+
+        # Level-by-level: every unfinished (row, tree) pair takes one step, going
+        # right when x > threshold. Pairs at a leaf stay put, so the unfinished
+        # set is only compacted every COMPACT_EVERY levels.
+        active = np.flatnonzero(~is_leaf[nodes])
+        while active.size:
+            for _ in range(self.COMPACT_EVERY):
+                current = nodes[active]
+                go_right = values[row_offsets[active] + feature[current]] > threshold[current]
+                nodes[active] = children[current, go_right.view(np.int8)]
+            active = active[~is_leaf[nodes[active]]]
+        return nodes.reshape(n_rows, self.n_trees)
+
+    def _accumulate(self, X, normalize: bool) -> np.ndarray:
+        leaves = self.apply(X)
+        # (n_rows, n_trees, n_outputs)
+        tree_values = np.asarray(self.value, dtype=np.float64)[leaves]
+        if normalize:
+            normalizer = tree_values.sum(axis=2, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+            tree_values /= normalizer
+        # cumsum adds tree by tree, in the same order and precision as sklearn
+        total = np.cumsum(tree_values, axis=1)[:, -1]
+        total /= self.n_trees
+        return total
+
+    def predict_proba(self, X) -> np.ndarray:
+        if self.kind != "classifier":
+            raise AttributeError("predict_proba is only available for classifiers")
+        return self._accumulate(X, normalize=True)
+
+    def predict(self, X) -> np.ndarray:
+        if self.kind == "classifier":
+            return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+        return self._accumulate(X, normalize=False)[:, 0]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in FOREST_ARRAYS)
+
+
+def _as_float32_dense(X) -> np.ndarray:
+    if hasattr(X, "toarray"):  # scipy.sparse input, e.g. a TF-IDF row
+        X = X.toarray()
+    X = np.asarray(X, dtype=np.float32)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+    return X
+
+
+def flatten_forest(model) -> FlatForest:
+    """Convert a fitted sklearn forest (or single tree) into a FlatForest."""
+    estimators = getattr(model, "estimators_", [model])
+    is_classifier = hasattr(model, "classes_")
+    if getattr(model, "n_outputs_", 1) != 1:
+        raise ValueError("Only single-output forests can be flattened.")
+
+    roots, lefts, rights, features, thresholds, values = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for estimator in estimators:
+        tree = estimator.tree_
+        left = tree.children_left.astype(np.int32)
+        right = tree.children_right.astype(np.int32)
+        leaf = left == -1
+        roots.append(offset)
+        lefts.append(np.where(leaf, -1, left + offset))
+        rights.append(np.where(leaf, -1, right + offset))
+        # Leaves get feature 0 so gathers stay in bounds; their result is never used
+        features.append(np.where(leaf, 0, tree.feature).astype(np.int32))
+        thresholds.append(tree.threshold.astype(np.float64))
+        values.append(tree.value[:, 0, :].astype(np.float64))
+        offset += tree.node_count
+        max_depth = max(max_depth, tree.max_depth)
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "kind": "classifier" if is_classifier else "regressor",
+        "n_features": int(model.n_features_in_),
+        "n_trees": len(estimators),
+        "n_nodes": int(offset),
+        "max_depth": int(max_depth),
+    }
+    if is_classifier:
+        manifest["classes"] = np.asarray(model.classes_).tolist()
+    arrays = {
+        "roots": np.asarray(roots, dtype=np.int64),
+        "left": np.concatenate(lefts),
+        "right": np.concatenate(rights),
+        "feature": np.concatenate(features),
+        "threshold": np.concatenate(thresholds),
+        "value": np.ascontiguousarray(np.concatenate(values)),
+    }
+    return FlatForest(manifest, arrays)
+
+
+def export_forest(model, directory) -> FlatForest:
+    """Write a fitted forest as .npy node arrays plus a manifest into ``directory``."""
+    flat = model if isinstance(model, FlatForest) else flatten_forest(model)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in FOREST_ARRAYS:
+        np.save(directory / f"{name}.npy", np.ascontiguousarray(getattr(flat, name)))
+    # The manifest is written last: its presence marks a complete export
+    with open(directory / MANIFEST_FILENAME, "w") as f:
+        json.dump(flat.manifest, f, indent=2)
+    return flat
+
+
+def load_forest(directory, mmap: bool = True) -> FlatForest:
+    """Load a forest written by export_forest, memory-mapped read-only by default."""
+    directory = Path(directory)
+    with open(directory / MANIFEST_FILENAME) as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported flat forest format version: {manifest.get('format_version')}")
+    mmap_mode = "r" if mmap else None
+    arrays = {name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode) for name in FOREST_ARRAYS}
+    return FlatForest(manifest, arrays)
+
+
+def export_vectorizer(vectorizer, directory):
+    """Write a fitted TfidfVectorizer's vocabulary, IDF weights and parameters into ``directory``."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    params = {
+        key: value for key, value in vectorizer.get_params().items()
+        if value is None or isinstance(value, (str, int, float, bool, tuple, list))
+    }
+    vocabulary = {term: int(index) for term, index in vectorizer.vocabulary_.items()}
+    np.save(directory / "idf.npy", np.asarray(vectorizer.idf_, dtype=np.float64))
+    with open(directory / VECTORIZER_FILENAME, "w") as f:
+        json.dump({"params": params, "vocabulary": vocabulary}, f)
+
+
+def load_vectorizer(directory):
+    """Rebuild a TfidfVectorizer from the files written by export_vectorizer."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    directory = Path(directory)
+    with open(directory / VECTORIZER_FILENAME) as f:
+        data = json.load(f)
+    params = data["params"]
+    if isinstance(params.get("ngram_range"), list):
+        params["ngram_range"] = tuple(params["ngram_range"])
+    vectorizer = TfidfVectorizer(**params)
+    vectorizer.vocabulary_ = data["vocabulary"]
+    vectorizer.idf_ = np.load(directory / "idf.npy")
+    return vectorizer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a pickled/joblib forest (and optional TF-IDF vectorizer) to the flat, memory-mappable format.")
+    parser.add_argument("model_path", help="Path to the joblib or pickle model file")
+    parser.add_argument("output_dir", help="Directory to write the flat artifacts to")
+    parser.add_argument("--vectorizer", help="Optional path to a pickled TfidfVectorizer to export alongside")
+    args = parser.parse_args(argv)
+
+    import joblib
+
+    flat = export_forest(joblib.load(args.model_path), args.output_dir)
+    if args.vectorizer:
+        export_vectorizer(joblib.load(args.vectorizer), args.output_dir)
+    print(f"Exported {flat.n_trees} trees ({flat.manifest['n_nodes']} nodes, "
+          f"{flat.nbytes / 1e6:.1f} MB of arrays) to {os.path.abspath(args.output_dir)}")
+
+
+if __name__ == "__main__":
+    main()
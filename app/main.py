@@ -1,6 +1,9 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Body
 from datetime import datetime
 from pydantic import BaseModel
+from app.config import settings
+from app.executor import InferenceExecutor
 
 # ==================== Diabetes Risk Prediction Service ====================
 
@@ -70,12 +73,21 @@ def get_diabetic_recommendation(glucose_content: float, food_name: str) -> dict:
 
 # ==================== FastAPI App Setup ====================
 
+# Model calls run on a bounded pool so they never block the event loop
+inference_executor = InferenceExecutor(max_workers=settings.inference_max_workers)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    inference_executor.shutdown(wait=False)
+
 app = FastAPI(
     title="Combined Diabetes Services API",
     description="API for diabetes risk prediction and food glucose content prediction",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # ==================== Diabetes Risk Endpoints ====================
@@ -83,7 +95,7 @@ app = FastAPI(
 @app.post("/api/v1/predict_risk_for_nodejs/", response_model=NodeJsPredictionResponse)
 async def predict_for_nodejs(payload: NodeJsPredictionRequest = Body(...)):
     try:
-        risk_level = predict_risk(payload.glucose_level)
+        risk_level = await inference_executor.run(predict_risk, payload.glucose_level)
         description = get_risk_description(risk_level)
         return NodeJsPredictionResponse(
             patient_id=payload.patient_id,
@@ -104,7 +116,7 @@ async def predict_glucose_content(food_input: FoodInput):
         if not food_name:
             raise ValueError("Food name cannot be empty.")
         
-        glucose_content = predict_glucose(food_name, model, vectorizer)
+        glucose_content = await inference_executor.run(predict_glucose, food_name, model, vectorizer)
         recommendation = get_diabetic_recommendation(glucose_content, food_name)
         glycemic_load = recommendation.get("glycemic_load")
         
@@ -132,6 +144,10 @@ async def health_check():
         "services": ["diabetes_risk", "food_glucose"]
     }
 
+@app.get("/metrics/inference")
+async def inference_metrics():
+    return inference_executor.stats()
+
 # ==================== Main Execution ====================
 
 if __name__ == "__main__":
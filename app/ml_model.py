@@ -1,18 +1,120 @@
 # app/ml_model.py
-import joblib
-import numpy as np
+import os
+import threading
 from app.schemas import RiskLevel
+from app.risk_table import compile_risk_table
+from app.config import settings
+from app.flat_forest import load_forest, MANIFEST_FILENAME
+from app.model_registry import ModelRegistry
 
-# Load the trained model
-try:
-    model = joblib.load("ml/diabetes_risk_model.joblib")
-except FileNotFoundError:
-    raise RuntimeError("Model file not found. Run ml/train_model.py first")
+MODEL_PATH = "ml/diabetes_risk_model.joblib"
+FLAT_MODEL_PATH = "ml/diabetes_risk_model_flat"
+REGISTRY_MODEL_NAME = "diabetes_risk"
+
+# Glucose levels scored once after loading, before a model version is served
+WARMUP_GLUCOSE_LEVELS = [50.0, 90.0, 130.0, 175.0, 230.0, 400.0]
+
+def _default_model_path():
+    return FLAT_MODEL_PATH if settings.model_artifact_format == "flat" else MODEL_PATH
+
+def _load_model(path=None):
+    path = path or _default_model_path()
+    try:
+        if os.path.isdir(path):
+            return load_forest(path)
+        import joblib  # Deferred: only needed once, at model load time
+        return joblib.load(path)
+    except FileNotFoundError:
+        raise RuntimeError("Model file not found. Run ml/train_model.py first")
+
+class RiskModel:
+    """One loaded version of the risk model: the forest and its compiled threshold table"""
+
+    def __init__(self, model, version: str):
+        self.model = model
+        self.version = version
+        # The model has a single feature, so its forest reduces to sorted glucose breakpoints
+        self.table = compile_risk_table(model)
+
+    def predict(self, glucose_level: float) -> RiskLevel:
+        return RiskLevel(int(self.table.predict_one(float(glucose_level))))
+
+    def predict_batch(self, glucose_levels) -> list:
+        return [RiskLevel(int(prediction)) for prediction in self.table.predict(glucose_levels)]
+
+# The model version currently being served. Set by load_model(), normally from
+# the service's lifespan hook, or lazily on the first prediction. Swapping it is
+# a single assignment; callers that already hold the previous RiskModel keep
+# using it until they finish.
+_served_model = None
+_load_lock = threading.Lock()
+
+def get_registry():
+    """The model registry, if one is configured"""
+    return ModelRegistry(settings.model_registry_dir) if settings.model_registry_dir else None
+
+def _local_version(path):
+    """Version label for an unregistered artifact, derived from its mtime and size"""
+    if os.path.isdir(path):
+        path = os.path.join(path, MANIFEST_FILENAME)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return f"local-{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+def resolve_model_version():
+    """The version that should be served: the registry's current version, or the local artifact's"""
+    registry = get_registry()
+    if registry is not None:
+        return registry.current_version(REGISTRY_MODEL_NAME)
+    return _local_version(_default_model_path())
+
+def load_risk_model(version=None) -> RiskModel:
+    """Load and warm up a model version without serving it"""
+    registry = get_registry()
+    if registry is not None:
+        version = version or registry.current_version(REGISTRY_MODEL_NAME)
+        if version is None:
+            raise RuntimeError(f"No versions of '{REGISTRY_MODEL_NAME}' in registry {registry.root}")
+        path = str(registry.artifact_path(REGISTRY_MODEL_NAME, version, "model"))
+    else:
+        path = _default_model_path()
+        version = _local_version(path) or "unversioned"
+    risk_model = RiskModel(_load_model(path), version)
+    risk_model.table.predict(WARMUP_GLUCOSE_LEVELS)
+    return risk_model
+
+def set_served_model(risk_model: RiskModel):
+    global _served_model
+    _served_model = risk_model
+
+def get_served_model() -> RiskModel:
+    """The model version currently being served, loading it on first use"""
+    if _served_model is None:
+        with _load_lock:
+            if _served_model is None:
+                set_served_model(load_risk_model())
+    return _served_model
+
+def served_model_version():
+    return _served_model.version if _served_model is not None else None
+
+def load_model(version=None) -> RiskModel:
+    """Load a model version (default: the current one) and start serving it"""
+    with _load_lock:
+        set_served_model(load_risk_model(version))
+    return _served_model
+
+reload_model = load_model
 
 def predict_risk(glucose_level: float) -> RiskLevel:
     """Predict diabetes risk from glucose level"""
-    prediction = model.predict(np.array([[glucose_level]]))[0]
-    return RiskLevel(int(prediction))
+    return get_served_model().predict(glucose_level)
+
+def predict_risk_batch(glucose_levels) -> list:
+    """Predict diabetes risk for an array of glucose levels"""
+    return get_served_model().predict_batch(glucose_levels)
 
 def get_risk_description(risk_level: RiskLevel) -> str:
     """Convert risk level to human-readable description"""
@@ -21,4 +123,4 @@ def get_risk_description(risk_level: RiskLevel) -> str:
         RiskLevel.low_risk: "Diabetic, Low Risk",
         RiskLevel.medium_risk: "Diabetic, Medium Risk", 
         RiskLevel.high_risk: "Diabetic, High Risk"
-    }.get(risk_level, "Unknown Risk Level")
\ No newline at end of file
+    }.get(risk_level, "Unknown Risk Level")
@@ -0,0 +1,228 @@
+# app/model_registry.py
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+MANIFEST_FILENAME = "manifest.json"
+CURRENT_FILENAME = "CURRENT"
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """
+    Versioned model artifacts on disk.
+
+    Layout::
+
+        <root>/<model_name>/<version>/manifest.json
+        <root>/<model_name>/<version>/<artifact files or directories>
+        <root>/<model_name>/CURRENT          # active version, optional
+
+    A version directory is only considered complete once its manifest exists
+    (it is written last). Without a CURRENT file the newest complete version
+    is active.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def versions(self, model_name: str) -> List[str]:
+        model_dir = self.root / model_name
+        if not model_dir.is_dir():
+            return []
+        return sorted(p.name for p in model_dir.iterdir() if (p / MANIFEST_FILENAME).is_file())
+
+    def current_version(self, model_name: str) -> Optional[str]:
+        pointer = self.root / model_name / CURRENT_FILENAME
+        if pointer.is_file():
+            version = pointer.read_text().strip()
+            if (self.root / model_name / version / MANIFEST_FILENAME).is_file():
+                return version
+            logger.warning(f"{pointer} names missing version '{version}'; falling back to the newest version.")
+        versions = self.versions(model_name)
+        return versions[-1] if versions else None
+
+    def _require_version(self, model_name: str, version: str):
+        # Only names listed by versions(), so a version can't point outside the registry
+        if version not in self.versions(model_name):
+            raise FileNotFoundError(f"Version '{version}' of '{model_name}' does not exist.")
+
+    def manifest(self, model_name: str, version: str) -> dict:
+        self._require_version(model_name, version)
+        with open(self.root / model_name / version / MANIFEST_FILENAME) as f:
+            return json.load(f)
+
+    def artifact_path(self, model_name: str, version: str, role: str) -> Path:
+        """Path of the artifact registered under ``role`` (e.g. "model", "vectorizer")."""
+        manifest = self.manifest(model_name, version)
+        try:
+            return self.root / model_name / version / manifest["artifacts"][role]["path"]
+        except KeyError:
+            raise KeyError(f"Version '{version}' of '{model_name}' has no '{role}' artifact.")
+
+    def publish(self, model_name: str, artifacts: Dict[str, str], version: Optional[str] = None,
+                activate: bool = True, metadata: Optional[dict] = None) -> str:
+        """
+        Copy artifact files (or directories) into a new version and write its manifest.
+        Args:
+            model_name: Registry entry, e.g. "diabetes_risk".
+            artifacts: Role -> source path, e.g. {"model": "ml/diabetes_risk_model.joblib"}.
+            version: Version name; defaults to a UTC timestamp, which sorts chronologically.
+            activate: Point CURRENT at the new version.
+        Returns:
+            str: The published version.
+        """
+        version = version or datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        version_dir = self.root / model_name / version
+        if version_dir.exists():
+            raise FileExistsError(f"Version '{version}' of '{model_name}' already exists.")
+        version_dir.mkdir(parents=True)
+
+        entries = {}
+        for role, source in artifacts.items():
+            source = Path(source)
+            target = version_dir / source.name
+            if source.is_dir():
+                shutil.copytree(source, target)
+            else:
+                shutil.copy2(source, target)
+            entries[role] = {"path": source.name, "sha256": _sha256(target)}
+
+        manifest = {
+            "model_name": model_name,
+            "version": version,
+            "created_at": datetime.utcnow().isoformat(),
+            "artifacts": entries,
+            **({"metadata": metadata} if metadata else {}),
+        }
+        _write_atomic(version_dir / MANIFEST_FILENAME, json.dumps(manifest, indent=2))
+        if activate:
+            self.activate(model_name, version)
+        return version
+
+    def activate(self, model_name: str, version: str):
+        self._require_version(model_name, version)
+        _write_atomic(self.root / model_name / CURRENT_FILENAME, version)
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    for file in files:
+        with open(file, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, text: str):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+class ModelReloader:
+    """
+    Background loading and atomic swapping of a served model.
+
+    ``resolve()`` returns the version that should be served, ``load(version)``
+    loads *and warms up* that version and returns the new served object, and
+    ``swap(obj)`` publishes it (a single reference assignment). Requests that
+    captured the previous object keep using it until they finish.
+    """
+
+    def __init__(self, resolve: Callable[[], Optional[str]], load: Callable[[Optional[str]], Any],
+                 swap: Callable[[Any], None], current_version: Callable[[], Optional[str]],
+                 poll_seconds: float = 0):
+        self.resolve = resolve
+        self.load = load
+        self.swap = swap
+        self.current_version = current_version
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._watcher = None
+        self.last_error = None
+
+    def reload_sync(self, version: Optional[str] = None) -> Optional[str]:
+        """Load ``version`` (default: the resolved one), then swap it in. Reloads are serialized."""
+        with self._lock:
+            self.swap(self.load(version))
+            return self.current_version()
+
+    async def reload(self, version: Optional[str] = None) -> Optional[str]:
+        """Like reload_sync, but loads on a worker thread so serving continues meanwhile."""
+        return await asyncio.to_thread(self.reload_sync, version)
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            try:
+                wanted = await asyncio.to_thread(self.resolve)
+                if wanted is not None and wanted != self.current_version():
+                    logger.info(f"Model version changed to '{wanted}'; reloading.")
+                    await self.reload(wanted)
+                self.last_error = None
+            except Exception as e:
+                # Keep serving the current version; try again on the next poll
+                self.last_error = str(e)
+                logger.error(f"Model reload failed: {e}")
+
+    def start(self):
+        if self.poll_seconds > 0 and self._watcher is None:
+            self._watcher = asyncio.get_running_loop().create_task(self._watch())
+
+    async def stop(self):
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the versioned model registry.")
+    parser.add_argument("--registry", default="models", help="Registry root directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    publish = sub.add_parser("publish", help="Publish artifacts as a new version")
+    publish.add_argument("model_name")
+    publish.add_argument("artifacts", nargs="+", metavar="ROLE=PATH",
+                         help="e.g. model=ml/diabetes_risk_model.joblib vectorizer=../food_vectorizer.pkl")
+    publish.add_argument("--version")
+    publish.add_argument("--no-activate", action="store_true")
+
+    activate = sub.add_parser("activate", help="Make an existing version current")
+    activate.add_argument("model_name")
+    activate.add_argument("version")
+
+    listing = sub.add_parser("list", help="List versions")
+    listing.add_argument("model_name")
+
+    args = parser.parse_args(argv)
+    registry = ModelRegistry(args.registry)
+    if args.command == "publish":
+        artifacts = dict(item.split("=", 1) for item in args.artifacts)
+        version = registry.publish(args.model_name, artifacts, version=args.version, activate=not args.no_activate)
+        print(f"Published {args.model_name} version {version}")
+    elif args.command == "activate":
+        registry.activate(args.model_name, args.version)
+        print(f"Activated {args.model_name} version {args.version}")
+    else:
+        current = registry.current_version(args.model_name)
+        for version in registry.versions(args.model_name):
+            print(f"{'*' if version == current else ' '} {version}")
+
+
+if __name__ == "__main__":
+    main()
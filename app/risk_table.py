@@ -0,0 +1,100 @@
+# app/risk_table.py
+import bisect
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+MODEL_PATH = BASE_DIR / "ml" / "diabetes_risk_model.joblib"
+TABLE_PATH = BASE_DIR / "ml" / "diabetes_risk_table.npz"
+
+
+class RiskThresholdTable:
+    """
+    Piecewise-constant equivalent of a single-feature tree ensemble.
+
+    ``breakpoints`` is sorted ascending and ``labels`` has one more entry than
+    ``breakpoints``. A glucose value x maps to ``labels[i]`` where i is the
+    number of breakpoints strictly below x, i.e. x falls in
+    (breakpoints[i-1], breakpoints[i]] - the same "x <= threshold goes left"
+    rule sklearn trees use.
+    """
+
+    def __init__(self, breakpoints, labels):
+        self.breakpoints = np.asarray(breakpoints, dtype=np.float64)
+        self.labels = np.asarray(labels)
+        if len(self.labels) != len(self.breakpoints) + 1:
+            raise ValueError("labels must have exactly one more entry than breakpoints")
+        # Plain lists keep the scalar path free of numpy call overhead
+        self._breakpoint_list = self.breakpoints.tolist()
+        self._label_list = self.labels.tolist()
+
+    def predict_one(self, glucose_level: float):
+        """Predict the class label for a single glucose value."""
+        # sklearn trees compare float32-cast inputs against float64 thresholds
+        x = float(np.float32(glucose_level))
+        return self._label_list[bisect.bisect_left(self._breakpoint_list, x)]
+
+    def predict(self, glucose_levels) -> np.ndarray:
+        """Predict class labels for an array of glucose values (or an (n, 1) feature matrix)."""
+        x = np.asarray(glucose_levels, dtype=np.float32).reshape(-1).astype(np.float64)
+        return self.labels[np.searchsorted(self.breakpoints, x, side="left")]
+
+    def save(self, path=TABLE_PATH):
+        np.savez(path, breakpoints=self.breakpoints, labels=self.labels)
+
+    @classmethod
+    def load(cls, path=TABLE_PATH):
+        with np.load(path) as data:
+            return cls(data["breakpoints"], data["labels"])
+
+    def __len__(self):
+        return len(self.labels)
+
+
+def _interval_representatives(thresholds: np.ndarray) -> np.ndarray:
+    """
+    Pick one float32-representable input inside every interval delimited by
+    the sorted unique ``thresholds``: (-inf, t0], (t0, t1], ..., (t_last, inf).
+    """
+    t32 = thresholds.astype(np.float32)
+    # Largest float32 <= t for each threshold
+    upper = np.where(t32.astype(np.float64) > thresholds, np.nextafter(t32, np.float32(-np.inf)), t32)
+    # Smallest float32 > the last threshold
+    last = t32[-1] if t32[-1].astype(np.float64) > thresholds[-1] else np.nextafter(t32[-1], np.float32(np.inf))
+    return np.append(upper, last).astype(np.float32)
+
+
+def compile_risk_table(model) -> RiskThresholdTable:
+    """
+    Extract the exact decision boundaries of a fitted single-feature tree
+    ensemble (e.g. the risk ``RandomForestClassifier``) into a threshold table.
+    """
+    if getattr(model, "n_features_in_", 1) != 1:
+        raise ValueError("Only single-feature models can be compiled into a threshold table.")
+
+    if hasattr(model, "split_thresholds"):  # app.flat_forest.FlatForest
+        thresholds = np.unique(model.split_thresholds)
+    else:
+        estimators = getattr(model, "estimators_", [model])
+        thresholds = np.unique(np.concatenate([
+            est.tree_.threshold[est.tree_.feature >= 0] for est in estimators
+        ]))
+    if thresholds.size == 0:
+        # Every tree is a single leaf: the prediction is constant
+        return RiskThresholdTable([], model.predict(np.zeros((1, 1), dtype=np.float32)))
+
+    points = _interval_representatives(thresholds)
+    labels = model.predict(points.reshape(-1, 1))
+
+    # Merge neighbouring intervals that predict the same class
+    changes = np.flatnonzero(labels[1:] != labels[:-1])
+    return RiskThresholdTable(thresholds[changes], labels[np.append(changes, len(labels) - 1)])
+
+
+if __name__ == "__main__":
+    import joblib
+
+    table = compile_risk_table(joblib.load(MODEL_PATH))
+    table.save(TABLE_PATH)
+    print(f"Compiled {MODEL_PATH.name} into {len(table.breakpoints)} breakpoints at {TABLE_PATH}")
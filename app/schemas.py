@@ -1,6 +1,6 @@
 #app/schemas.py
 from enum import Enum
-from typing import Optional, Union
+from typing import List, Optional, Union
 from pydantic import BaseModel, Field, validator  # Compatible with Pydantic v1 and v2
 
 class RiskLevel(int, Enum):
@@ -47,6 +47,7 @@ class NodeJsPredictionResponse(BaseModel):
     patient_id: str = Field(..., description="Patient identifier (echoed back from request or 'N/A' for direct prediction)")
     ml_predicted_risk_level: RiskLevel = Field(..., description="Diabetes risk level predicted by the ML model (0-3)")
     risk_description: Optional[str] = Field(None, description="Human-readable description of the risk level")
+    model_version: Optional[str] = Field(None, description="Version of the model that produced the prediction")
 
     @validator('ml_predicted_risk_level', pre=True)
     def validate_risk_level_int(cls, value: Union[int, RiskLevel]) -> RiskLevel:
@@ -64,4 +65,34 @@ class NodeJsPredictionResponse(BaseModel):
         json_encoders = {
             RiskLevel: lambda v: v.value  # Ensure enums are serialized as their integer values
         }
-        from_attributes = True  # For ORM compatibility
\ No newline at end of file
+        from_attributes = True  # For ORM compatibility
+        protected_namespaces = ()  # Allow the 'model_version' field under Pydantic v2
+
+class NodeJsBatchPredictionResult(BaseModel):
+    """
+    One entry of a batch prediction response, in the same position as the
+    corresponding request item. Exactly one of 'ml_predicted_risk_level' or
+    'error' is set, so a single invalid reading does not fail the batch.
+    """
+    index: int = Field(..., description="Position of the item in the request batch")
+    patient_id: Optional[str] = Field(None, description="Patient identifier echoed back from the request item, if present")
+    ml_predicted_risk_level: Optional[RiskLevel] = Field(None, description="Diabetes risk level predicted by the ML model (0-3)")
+    risk_description: Optional[str] = Field(None, description="Human-readable description of the risk level")
+    error: Optional[str] = Field(None, description="Validation or prediction error for this item")
+
+    class Config:
+        json_encoders = {
+            RiskLevel: lambda v: v.value
+        }
+
+class NodeJsBatchPredictionResponse(BaseModel):
+    """
+    Response model for batch predictions sent back to the Node.js backend.
+    """
+    results: List[NodeJsBatchPredictionResult] = Field(..., description="Per-item results, in request order")
+    succeeded: int = Field(..., description="Number of items scored successfully")
+    failed: int = Field(..., description="Number of items rejected by validation")
+    model_version: Optional[str] = Field(None, description="Version of the model that scored the batch")
+
+    class Config:
+        protected_namespaces = ()
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Throughput of the food dataset generators: the original per-row loop
+(generate_food_dataset) against the NumPy-vectorized chunked generator
+(iter_food_dataset_chunks), plus the streaming CSV writer and the sharded,
+multi-process writer at increasing worker counts.
+
+Usage:
+    python benchmarks/data_generation.py
+    python benchmarks/data_generation.py --rows 1000000 --chunk-size 100000
+    python benchmarks/data_generation.py --shards 16 --workers 1 2 4 8
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_generation import (
+    generate_food_dataset, iter_food_dataset_chunks, write_food_dataset, write_food_dataset_shards
+)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    rows = fn()
+    return rows, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows for the vectorized runs")
+    parser.add_argument("--loop-rows", type=int, default=200_000, help="Rows for the (slow) original loop")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--shards", type=int, default=8, help="Shards for the sharded runs")
+    parser.add_argument("--workers", type=int, nargs="*", default=[1, 2, 4],
+                        help="Worker counts for the sharded runs (output is identical for each)")
+    args = parser.parse_args()
+    logging.getLogger("FoodGlucoseApp").setLevel(logging.WARNING)
+
+    runs = [
+        ("loop", lambda: len(generate_food_dataset(args.loop_rows))),
+        ("vectorized", lambda: sum(len(chunk) for chunk in iter_food_dataset_chunks(args.rows, args.chunk_size, seed=0))),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "food.csv")
+        runs.append(("vectorized+csv", lambda: write_food_dataset(path, args.rows, args.chunk_size, seed=0)))
+        for workers in args.workers:
+            runs.append((f"sharded x{workers}", lambda workers=workers: write_food_dataset_shards(
+                os.path.join(tmp, f"shards-{workers}"), args.rows, args.shards, seed=0, workers=workers
+            )["n_samples"]))
+
+        print(f"{'generator':<16}{'rows':>12}{'seconds':>10}{'rows/s':>14}")
+        baseline = None
+        for name, fn in runs:
+            rows, seconds = _timed(fn)
+            rate = rows / seconds
+            baseline = baseline or rate
+            print(f"{name:<16}{rows:>12}{seconds:>10.2f}{rate:>14,.0f}  ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Memory of the food dataset as plain pandas loads it (object strings, float64)
+versus the compact schema of src.data_generation.food_dataset_dtypes
+(categoricals, float32), per column and per copy held by a session.
+
+Usage:
+    python benchmarks/dataset_memory.py
+    python benchmarks/dataset_memory.py --rows 50000 1000000 --sessions 1 10 50
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from src.data_generation import generate_food_dataset_vectorized, load_food_dataset, memory_report
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[50_000, 1_000_000])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50],
+                        help="Concurrent sessions each holding a copy (as before the shared cache)")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        csv = generate_food_dataset_vectorized(rows, seed=0).to_csv(index=False)
+        plain, plain_seconds = _timed(lambda: pd.read_csv(io.StringIO(csv)))
+        _, compact_seconds = _timed(lambda: load_food_dataset(io.StringIO(csv)))
+        report = memory_report(plain)
+        print(f"\n{rows:,} rows (CSV load {plain_seconds:.2f}s plain, {compact_seconds:.2f}s compact)")
+        print(report.assign(MB=report["bytes"] / 1e6, compact_MB=report["compact_bytes"] / 1e6)
+              [["dtype", "MB", "compact_dtype", "compact_MB", "saved_pct"]].to_string(float_format="{:.2f}".format))
+        saved = report.loc["Total", "bytes"] - report.loc["Total", "compact_bytes"]
+        for sessions in args.sessions:
+            print(f"  {sessions:>3} session(s): {saved * sessions / 1e6:,.1f} MB saved")
+
+
+if __name__ == "__main__":
+    main()
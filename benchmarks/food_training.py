@@ -0,0 +1,55 @@
+"""
+Training time, test R^2 and pickled model size of the food glucose regressor
+per training path of src.model_training.train_model: the hyperparameter
+search modes on every row, and the deduplicated (one weighted row per food
+name) path.
+
+Usage:
+    python benchmarks/food_training.py
+    python benchmarks/food_training.py --rows 50000 --modes halving grid dedup
+"""
+import argparse
+import logging
+import os
+import pickle
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_generation import generate_food_dataset_vectorized
+from src.model_training import SEARCH_MODES, train_model
+
+
+def _test_r2(model, vectorizer, df):
+    from sklearn.model_selection import train_test_split
+
+    # Same split as train_model
+    _, test = train_test_split(df, test_size=0.2, random_state=42)
+    return model.score(vectorizer.transform(test["Food_Name"]), test["Glucose_g_per_100g"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    modes = list(SEARCH_MODES) + ["dedup"]
+    parser.add_argument("--modes", nargs="+", default=modes, choices=modes)
+    parser.add_argument("--time-budget", type=float, default=None, help="Seconds, for the halving search")
+    args = parser.parse_args()
+    logging.getLogger("FoodGlucoseApp").setLevel(logging.WARNING)
+
+    df = generate_food_dataset_vectorized(args.rows, seed=0)
+    print(f"{'mode':<10}{'seconds':>10}{'test R^2':>10}{'model MB':>10}")
+    for mode in args.modes:
+        start = time.perf_counter()
+        if mode == "dedup":
+            model, vectorizer = train_model(df, time_budget_seconds=args.time_budget, deduplicate=True)
+        else:
+            model, vectorizer = train_model(df, search=mode, time_budget_seconds=args.time_budget)
+        seconds = time.perf_counter() - start
+        size_mb = len(pickle.dumps(model)) / 1e6
+        print(f"{mode:<10}{seconds:>10.1f}{_test_r2(model, vectorizer, df):>10.4f}{size_mb:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
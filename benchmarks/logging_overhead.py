@@ -0,0 +1,87 @@
+"""
+Caller-side cost of the two per-request log lines in predict_glucose: the old
+setup (FileHandler and StreamHandler called synchronously) against
+src.utils.setup_logging's queue handler, with and without sampling of the
+"prediction" log type. Console output goes to os.devnull; the file goes to a
+temporary directory.
+
+Usage:
+    python benchmarks/logging_overhead.py
+    python benchmarks/logging_overhead.py --requests 50000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from src.utils import LOGGER_NAME, LOG_FILENAME, TEXT_FORMAT, setup_logging, shutdown_logging
+
+PREDICTION = {"log_type": "prediction"}
+
+
+def _log_requests(logger, n):
+    shape, prediction = (1, 500), np.array([12.34])
+    start = time.perf_counter()
+    for i in range(n):
+        logger.info("Food vector shape for '%s': %s", "injera", shape, extra=PREDICTION)
+        logger.info("Raw prediction for '%s': %s", "injera", prediction, extra=PREDICTION)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def _synchronous(log_dir, n):
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(logging.INFO)
+    handlers = [logging.FileHandler(os.path.join(log_dir, LOG_FILENAME)), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        logger.addHandler(handler)
+    try:
+        return _log_requests(logger, n), None
+    finally:
+        for handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def _queued(log_dir, n, sample_rates):
+    logger = setup_logging(log_dir=log_dir, sample_rates=sample_rates)
+    per_request = _log_requests(logger, n)
+    start = time.perf_counter()
+    shutdown_logging()
+    return per_request, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    shutdown_logging()
+    stderr, sys.stderr = sys.stderr, open(os.devnull, "w")
+    try:
+        results = []
+        for label, run in [("synchronous file + console", lambda d: _synchronous(d, args.requests)),
+                           ("queue, every request", lambda d: _queued(d, args.requests, {})),
+                           ("queue, 1 in 100 sampled", lambda d: _queued(d, args.requests, {"prediction": 100}))]:
+            with tempfile.TemporaryDirectory() as log_dir:
+                per_request, drain = run(log_dir)
+                lines = sum(1 for _ in open(os.path.join(log_dir, LOG_FILENAME)))
+                results.append((label, per_request, drain, lines))
+    finally:
+        sys.stderr.close()
+        sys.stderr = stderr
+
+    print(f"{args.requests:,} requests, 2 log lines each")
+    print(f"  {'setup':<28}{'us/request':>12}{'drain s':>9}{'lines':>9}")
+    for label, per_request, drain, lines in results:
+        drain = "-" if drain is None else f"{drain:.2f}"
+        print(f"  {label:<28}{per_request:>12.1f}{drain:>9}{lines:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compare per-host memory of N worker processes that each load the risk (or
+food) forest from its joblib/pickle file versus from a memory-mapped flat
+export (app.flat_forest).
+
+Usage:
+    python benchmarks/model_memory.py --workers 4
+    python benchmarks/model_memory.py --model ../food_glucose_model.pkl --workers 8
+
+Memory is read from /proc/self/smaps_rollup (Linux): PSS splits shared pages
+between the processes mapping them, so the PSS sum is the real host cost.
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+
+def _memory_kb():
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def _worker(mode, path, loaded, measured, results):
+    import joblib
+    from app.flat_forest import load_forest
+
+    baseline = _memory_kb()
+    start = time.perf_counter()
+    model = load_forest(path) if mode == "flat" else joblib.load(path)
+    # Touch the model the way serving does so lazily mapped pages are counted
+    X = np.zeros((64, model.n_features_in_))
+    X[:, 0] = np.linspace(0, 400, 64)
+    model.predict(X)
+    load_seconds = time.perf_counter() - start
+
+    loaded.wait()  # every worker holds its model before anyone measures
+    memory = _memory_kb()
+    results.put({
+        "load_seconds": load_seconds,
+        **{key: memory[key] - baseline[key] for key in memory},
+    })
+    measured.wait()
+
+
+def run(mode, path, workers):
+    ctx = mp.get_context("spawn")
+    loaded, measured = ctx.Barrier(workers), ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(mode, path, loaded, measured, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return {
+        "mode": mode,
+        "workers": workers,
+        "load_seconds": float(np.mean([r["load_seconds"] for r in rows])),
+        "rss_mb": sum(r["rss"] for r in rows) / 1024,
+        "pss_mb": sum(r["pss"] for r in rows) / 1024,
+        "uss_mb": sum(r["uss"] for r in rows) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="ml/diabetes_risk_model.joblib", help="joblib/pickle forest to benchmark")
+    parser.add_argument("--flat", help="Existing flat export of the model (exported to a temp dir if omitted)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    import joblib
+    from app.flat_forest import export_forest
+
+    flat_dir = args.flat
+    if flat_dir is None:
+        flat_dir = tempfile.mkdtemp(prefix="flat_forest_")
+        export_forest(joblib.load(args.model), flat_dir)
+
+    print(f"{'mode':<8}{'workers':>8}{'load s':>10}{'RSS MB':>10}{'PSS MB':>10}{'USS MB':>10}")
+    for workers in args.workers:
+        for mode, path in (("pickle", args.model), ("flat", flat_dir)):
+            r = run(mode, path, workers)
+            print(f"{r['mode']:<8}{r['workers']:>8}{r['load_seconds']:>10.3f}"
+                  f"{r['rss_mb']:>10.1f}{r['pss_mb']:>10.1f}{r['uss_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Measure cold-start cost of each service entry point in a fresh interpreter:
+module import time, lifespan startup (model loading) and time to the first
+successful prediction.
+
+Usage:
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --runs 5
+
+Each run is a separate subprocess so nothing is warm in sys.modules. The food
+service resolves its model paths relative to the working directory, so it is
+started from src/ like it is in deployment.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+ENTRY_POINTS = [
+    # (module, working directory, method, path, payload)
+    ("data.main", ROOT, "POST", "/api/v1/predict_risk_for_nodejs/", {"patient_id": "bench", "glucose_level": 130}),
+    ("app.main", ROOT, "POST", "/api/v1/predict_risk_for_nodejs/", {"patient_id": "bench", "glucose_level": 130}),
+    ("src.api", os.path.join(ROOT, "src"), "POST", "/predict", {"food_name": "Injera"}),
+]
+
+PROBE = r"""
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import importlib
+module = importlib.import_module({module!r})
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(module.app) as client:
+    started = time.perf_counter()
+    response = client.request({method!r}, {path!r}, json={payload!r})
+    predicted = time.perf_counter()
+print(json.dumps({{
+    "status": response.status_code,
+    "import_s": imported - start,
+    "lifespan_s": started - imported,
+    "first_prediction_s": predicted - start,
+}}))
+"""
+
+
+def probe(module, cwd, method, path, payload):
+    code = PROBE.format(root=ROOT, module=module, method=method, path=path, payload=payload)
+    result = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per entry point (median reported)")
+    args = parser.parse_args()
+
+    print(f"{'entry point':<12}{'import s':>10}{'lifespan s':>12}{'1st pred s':>12}{'status':>8}")
+    for module, cwd, method, path, payload in ENTRY_POINTS:
+        runs = [probe(module, cwd, method, path, payload) for _ in range(args.runs)]
+        ok = [r for r in runs if "error" not in r]
+        if not ok:
+            print(f"{module:<12}  failed: {runs[0]['error']}")
+            continue
+        median = {key: statistics.median(r[key] for r in ok) for key in ("import_s", "lifespan_s", "first_prediction_s")}
+        print(f"{module:<12}{median['import_s']:>10.3f}{median['lifespan_s']:>12.3f}"
+              f"{median['first_prediction_s']:>12.3f}{ok[0]['status']:>8}")
+
+
+if __name__ == "__main__":
+    main()
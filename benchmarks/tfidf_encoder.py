@@ -0,0 +1,59 @@
+"""
+Per-call cost of encoding one food name with TfidfVectorizer.transform versus
+src.tfidf_encoder.TfidfQueryEncoder, and of the uncached model call that
+follows in predict_glucose.
+
+Usage:
+    python benchmarks/tfidf_encoder.py
+    python benchmarks/tfidf_encoder.py --model ../food_glucose_model.pkl --vectorizer ../food_vectorizer.pkl
+"""
+import argparse
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.flat_forest import flatten_forest
+from src.tfidf_encoder import TfidfQueryEncoder
+
+QUERIES = ["injera", "Doro Wat", "pizza margherita", "spicy injera pizza with extra cheese"]
+
+
+def _per_call_us(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="food_glucose_model.pkl")
+    parser.add_argument("--vectorizer", default="food_vectorizer.pkl")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(args.vectorizer, "rb") as f:
+        vectorizer = pickle.load(f)
+    encoder = TfidfQueryEncoder.from_vectorizer(vectorizer)
+
+    print(f"{'query':<40}{'transform us':>14}{'encode us':>11}{'dense us':>10}")
+    for query in QUERIES:
+        before = _per_call_us(lambda: vectorizer.transform([query.lower()]), args.number)
+        encode = _per_call_us(lambda: encoder.encode(query), args.number)
+        dense = _per_call_us(lambda: encoder.encode_dense(query), args.number)
+        print(f"{query:<40}{before:>14.1f}{encode:>11.1f}{dense:>10.1f}  ({before / dense:.0f}x)")
+
+    if os.path.exists(args.model):
+        with open(args.model, "rb") as f:
+            model = pickle.load(f)
+        flat = flatten_forest(model)
+        query = QUERIES[-1]
+        number = max(args.number // 20, 10)
+        print(f"\nEncode + predict, '{query}':")
+        print(f"  transform + sklearn predict  {_per_call_us(lambda: model.predict(vectorizer.transform([query.lower()])), number):>9.1f} us")
+        print(f"  encoder + sklearn predict    {_per_call_us(lambda: model.predict(encoder.encode_dense(query)), number):>9.1f} us")
+        print(f"  encoder + FlatForest         {_per_call_us(lambda: flat.predict(encoder.encode_dense(query)), number):>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Build time and per-query latency of src.typeahead.TypeaheadIndex at several
+catalog sizes. Beyond the ~100 real catalog foods, names are synthesized from
+catalog words plus a variant number ("spicy doro wat 4821").
+
+Usage:
+    python benchmarks/typeahead.py
+    python benchmarks/typeahead.py --sizes 100 10000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.typeahead import TypeaheadIndex
+from src.data_generation import get_catalog_food_names
+
+MODIFIERS = ["spicy", "mild", "fresh", "homemade", "baked", "fried", "grilled", "vegan", "mini", "classic"]
+# (label, query): full-name prefixes, a later-word prefix, a typo and a miss
+QUERIES = [("prefix 1 char", "i"), ("prefix 3 chars", "inj"), ("prefix 6 chars", "doro w"),
+           ("word prefix", "wat"), ("typo", "injra"), ("no match", "qqqq")]
+
+
+def synthetic_names(n, seed=0):
+    names = list(get_catalog_food_names())[:n]
+    words = " ".join(names).split() + MODIFIERS
+    rng = random.Random(seed)
+    while len(names) < n:
+        base = rng.choice(names[:100])
+        names.append(f"{rng.choice(MODIFIERS)} {base} {rng.choice(words)} {rng.randrange(10000)}")
+    return names
+
+
+def _latencies_us(index, query, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        index.search(query, 10)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.median(times) * 1e6, times[int(len(times) * 0.99) - 1] * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        names = synthetic_names(size)
+        start = time.perf_counter()
+        index = TypeaheadIndex(names, [float(i) for i in range(len(names))])
+        build = time.perf_counter() - start
+        print(f"\n{len(index):,} names (built in {build:.2f}s)")
+        print(f"  {'query':<26}{'median us':>11}{'p99 us':>10}{'matches':>9}")
+        for label, query in QUERIES:
+            median, p99 = _latencies_us(index, query, args.repeats)
+            print(f"  {label + ' ' + repr(query):<26}{median:>11.1f}{p99:>10.1f}{len(index.search(query, 10)):>9}")
+
+
+if __name__ == "__main__":
+    main()
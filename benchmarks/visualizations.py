@@ -0,0 +1,63 @@
+"""
+Figure build time and JSON payload of the "Data Visualizations" charts drawn
+from the raw rows with plotly express versus from src.aggregation summaries.
+
+Usage:
+    python benchmarks/visualizations.py
+    python benchmarks/visualizations.py --rows 50000 1000000 --skip-raw-above 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import plotly.express as px
+
+from src.aggregation import box_figure, histogram_figure, summarize_dataset
+from src.data_generation import generate_food_dataset_vectorized
+
+COLUMN = "Glucose_g_per_100g"
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _render(figures):
+    """Seconds to serialize, and bytes sent to the browser."""
+    payload, seconds = _timed(lambda: sum(len(fig.to_json()) for fig in figures))
+    return seconds, payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[50_000, 1_000_000, 5_000_000])
+    parser.add_argument("--skip-raw-above", type=int, default=1_000_000,
+                        help="Don't build the raw-row figures for larger datasets")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}  {'approach':<12}{'precompute s':>13}{'render s':>10}{'payload KB':>12}")
+    for rows in args.rows:
+        df = generate_food_dataset_vectorized(rows, seed=0)
+        if rows <= args.skip_raw_above:
+            figures, build = _timed(lambda: [
+                px.histogram(df, x=COLUMN, color="Category", nbins=50),
+                px.box(df, x="Category", y=COLUMN),
+            ])
+            seconds, payload = _render(figures)
+            print(f"{rows:>10,}  {'raw rows':<12}{'-':>13}{build + seconds:>10.3f}{payload / 1024:>12.0f}")
+        summaries, precompute = _timed(lambda: summarize_dataset(df))
+        figures, build = _timed(lambda: [
+            histogram_figure(summaries[COLUMN]["histogram"], COLUMN),
+            box_figure(summaries[COLUMN]["box"], COLUMN),
+        ])
+        seconds, payload = _render(figures)
+        print(f"{rows:>10,}  {'summaries':<12}{precompute:>13.3f}{build + seconds:>10.3f}{payload / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,76 @@
 # app/main.py
-from fastapi import FastAPI, HTTPException, status, Body
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, status, Body, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
+from typing import Any, List, Optional
 from datetime import datetime
-from app.schemas import NodeJsPredictionRequest, NodeJsPredictionResponse
-from app.ml_model import predict_risk, get_risk_description
+from pydantic import ValidationError
+from app.schemas import (
+    NodeJsPredictionRequest,
+    NodeJsPredictionResponse,
+    NodeJsBatchPredictionResult,
+    NodeJsBatchPredictionResponse,
+)
+from app.ml_model import (
+    REGISTRY_MODEL_NAME,
+    get_registry,
+    get_risk_description,
+    get_served_model,
+    load_risk_model,
+    resolve_model_version,
+    served_model_version,
+    set_served_model,
+)
+from app.model_registry import ModelReloader
+from app.admin import require_admin_token, require_known_version
+from app.batching import MicroBatcher
+from app.executor import InferenceExecutor
+from app.config import settings
+
+# Upper bound on readings per batch request, to keep a single request from
+# monopolising the worker
+MAX_BATCH_SIZE = 10000
+
+# Model calls run on a bounded pool so they never block the event loop
+inference_executor = InferenceExecutor(max_workers=settings.inference_max_workers)
+
+def _predict_versioned_batch(glucose_levels):
+    # Capture the served model once so the whole batch uses (and reports) one version
+    served = get_served_model()
+    return [(risk_level, served.version) for risk_level in served.predict_batch(glucose_levels)]
+
+# Concurrent single predictions are coalesced into one vectorized model call
+risk_batcher = MicroBatcher(
+    _predict_versioned_batch,
+    window_ms=settings.risk_batch_window_ms,
+    max_batch_size=settings.risk_batch_max_size,
+    executor=inference_executor
+)
+
+# Loads new model versions in the background and swaps them in atomically
+model_reloader = ModelReloader(
+    resolve=resolve_model_version,
+    load=load_risk_model,
+    swap=set_served_model,
+    current_version=served_model_version,
+    poll_seconds=settings.model_registry_poll_seconds
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the model before serving, off the event loop (unpickling imports sklearn)
+    await model_reloader.reload()
+    model_reloader.start()
+    yield
+    await model_reloader.stop()
+    inference_executor.shutdown(wait=False)
 
 app = FastAPI(
     title="Diabetes Risk Prediction ML Service",
     version="1.2.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS Configuration
@@ -25,21 +85,94 @@ app.add_middleware(
 @app.post("/api/v1/predict_risk_for_nodejs/", response_model=NodeJsPredictionResponse)
 async def predict_for_nodejs(payload: NodeJsPredictionRequest = Body(...)):
     try:
-        risk_level = predict_risk(payload.glucose_level)
+        risk_level, model_version = await risk_batcher.submit(payload.glucose_level)
         description = get_risk_description(risk_level)
         return NodeJsPredictionResponse(
             patient_id=payload.patient_id,
             ml_predicted_risk_level=risk_level,
-            risk_description=description
+            risk_description=description,
+            model_version=model_version
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc']) or 'item'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+@app.post("/api/v1/predict_risk_batch_for_nodejs/", response_model=NodeJsBatchPredictionResponse)
+async def predict_batch_for_nodejs(payload: List[Any] = Body(...)):
+    if len(payload) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch contains {len(payload)} items; the maximum is {MAX_BATCH_SIZE}."
+        )
+
+    # Validate each item on its own so one bad reading doesn't reject the batch
+    results = []
+    valid = []
+    for index, item in enumerate(payload):
+        patient_id = item.get("patient_id") if isinstance(item, dict) else None
+        result = NodeJsBatchPredictionResult(
+            index=index,
+            patient_id=patient_id if isinstance(patient_id, str) else None
+        )
+        results.append(result)
+        if not isinstance(item, dict):
+            result.error = "item: Input should be an object with patient_id and glucose_level"
+            continue
+        try:
+            valid.append((result, NodeJsPredictionRequest(**item)))
+        except ValidationError as e:
+            result.error = _format_validation_error(e)
+
+    try:
+        served = get_served_model()
+        if valid:
+            risk_levels = await inference_executor.run(
+                served.predict_batch, [request.glucose_level for _, request in valid]
+            )
+            for (result, request), risk_level in zip(valid, risk_levels):
+                result.patient_id = request.patient_id
+                result.ml_predicted_risk_level = risk_level
+                result.risk_description = get_risk_description(risk_level)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return NodeJsBatchPredictionResponse(
+        results=results,
+        succeeded=len(valid),
+        failed=len(results) - len(valid),
+        model_version=served.version
+    )
+
+@app.get("/api/v1/metrics/risk_batching")
+async def risk_batching_metrics():
+    return risk_batcher.stats()
+
+@app.get("/api/v1/metrics/inference")
+async def inference_metrics():
+    return inference_executor.stats()
+
+@app.post("/admin/reload_model", dependencies=[Depends(require_admin_token)])
+async def reload_model(version: Optional[str] = None):
+    """Load a model version (default: the current registry version) in the background and swap it in"""
+    require_known_version(get_registry(), REGISTRY_MODEL_NAME, version)
+    previous_version = served_model_version()
+    try:
+        model_version = await model_reloader.reload(version)
+    except (FileNotFoundError, KeyError, RuntimeError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return {"previous_version": previous_version, "model_version": model_version}
+
 @app.get("/health")
 async def health_check():
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.utcnow().isoformat(),
+        "model_version": served_model_version()
     }
\ No newline at end of file
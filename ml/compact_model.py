@@ -0,0 +1,211 @@
+# ml/compact_model.py
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), 'diabetes_risk_model.joblib')
+DEFAULT_TOLERANCE = 0.005
+
+
+def _truncated_forest(model, n_trees):
+    """The first ``n_trees`` trees of a fitted forest, without retraining."""
+    from copy import copy
+
+    subset = copy(model)
+    subset.estimators_ = model.estimators_[:n_trees]
+    subset.n_estimators = n_trees
+    return subset
+
+
+def candidate_factories(baseline, seed=42) -> dict:
+    """
+    {name: (description, factory)} for every compaction candidate: fewer trees,
+    depth limits, merged leaves and a single tree distilled from the baseline's
+    own predictions. ``factory(X_train, y_train)`` builds just that candidate.
+    """
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.tree import DecisionTreeClassifier
+
+    def forest(X_train, y_train, **params):
+        return RandomForestClassifier(n_estimators=25, random_state=seed, n_jobs=-1, **params).fit(X_train, y_train)
+
+    # One feature: a single tree fitted on the teacher's labels is a set of glucose intervals.
+    # The labels are shared by the distilled candidates built on the same rows.
+    teacher = {}
+
+    def distilled(X_train, y_train, max_leaves):
+        if teacher.get('X') is not X_train:
+            teacher.update(X=X_train, labels=baseline.predict(X_train))
+        tree = DecisionTreeClassifier(max_leaf_nodes=max_leaves, random_state=seed)
+        return tree.fit(X_train, teacher['labels'])
+
+    factories = {"baseline": ("current serving model", lambda X_train, y_train: baseline)}
+    for n_trees in (10, 25, 50):
+        if n_trees < len(baseline.estimators_):
+            factories[f"trees_{n_trees}"] = (f"first {n_trees} trees of the baseline",
+                                             lambda X_train, y_train, n=n_trees: _truncated_forest(baseline, n))
+    for depth in (4, 6, 8, 12):
+        factories[f"depth_{depth}"] = (f"25 trees, max_depth={depth}",
+                                       lambda X_train, y_train, d=depth: forest(X_train, y_train, max_depth=d))
+    for min_leaf in (50, 200):
+        factories[f"leaf_{min_leaf}"] = (f"25 trees, min_samples_leaf={min_leaf}",
+                                         lambda X_train, y_train, m=min_leaf: forest(X_train, y_train, min_samples_leaf=m))
+    for max_leaves in (8, 32):
+        factories[f"distilled_{max_leaves}"] = (f"single tree, {max_leaves} leaves, fit on baseline predictions",
+                                                lambda X_train, y_train, m=max_leaves: distilled(X_train, y_train, m))
+    return factories
+
+
+def build_candidates(baseline, X_train, y_train, seed=42):
+    """Yield (name, description, fitted model) for every compaction candidate (see candidate_factories)."""
+    for name, (description, factory) in candidate_factories(baseline, seed).items():
+        yield name, description, factory(X_train, y_train)
+
+
+def measure(model, X_test, y_test, baseline_predictions, repeats=3, single_calls=200) -> dict:
+    """Artifact size, load time, prediction latency and accuracy of one candidate."""
+    import joblib
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.joblib')
+        joblib.dump(model, path)
+        size_bytes = os.path.getsize(path)
+        load_times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            joblib.load(path)
+            load_times.append(time.perf_counter() - start)
+
+    single_times = []
+    for value in X_test[:single_calls]:
+        start = time.perf_counter()
+        model.predict(value.reshape(1, -1))
+        single_times.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    predictions = model.predict(X_test)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        'size_bytes': size_bytes,
+        'load_ms': min(load_times) * 1000,
+        'single_prediction_us': statistics.median(single_times) * 1e6,
+        'batch_prediction_us_per_row': batch_seconds / len(X_test) * 1e6,
+        'accuracy': float(np.mean(predictions == y_test)),
+        'agreement_with_baseline': float(np.mean(predictions == baseline_predictions)),
+        'n_nodes': int(sum(tree.tree_.node_count for tree in getattr(model, 'estimators_', [model]))),
+    }
+
+
+def choose_candidate(report, tolerance=DEFAULT_TOLERANCE) -> str:
+    """Smallest artifact whose accuracy is within ``tolerance`` of the baseline's."""
+    floor = report['baseline']['accuracy'] - tolerance
+    eligible = [name for name, row in report.items() if row['accuracy'] >= floor]
+    return min(eligible, key=lambda name: report[name]['size_bytes'])
+
+
+def score_on_test(model, X_test, y_test, baseline_predictions) -> dict:
+    predictions = model.predict(X_test)
+    return {
+        'accuracy': float(np.mean(predictions == y_test)),
+        'agreement_with_baseline': float(np.mean(predictions == baseline_predictions)),
+    }
+
+
+def build_candidate(baseline, X_train, y_train, name, seed=42):
+    """Build only the candidate called ``name`` (see candidate_factories)."""
+    factories = candidate_factories(baseline, seed)
+    if name not in factories:
+        raise KeyError(f"No candidate named '{name}'")
+    return factories[name][1](X_train, y_train)
+
+
+def compact_model(model_path=MODEL_PATH, tolerance=DEFAULT_TOLERANCE):
+    """
+    Choose a candidate on a validation split of the training rows, then build
+    it on the full training split. Only the chosen model and the baseline are
+    scored on the test split. Returns (validation report, chosen name, chosen
+    model, {"baseline": test scores, "chosen": test scores}).
+    """
+    import joblib
+    from sklearn.base import clone
+    from sklearn.model_selection import train_test_split
+    from ml.train_model import load_training_arrays
+
+    baseline = joblib.load(model_path)
+    X, y = load_training_arrays()
+    # Same split as ml/train_model.py
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    # The serving model trained on every row of X_train, so selection compares
+    # candidates against the same configuration refit without the validation rows
+    X_fit, X_val, y_fit, y_val = train_test_split(X_train, y_train, test_size=0.2, random_state=42)
+    reference = clone(baseline).fit(X_fit, y_fit)
+    reference_predictions = reference.predict(X_val)
+
+    report = {}
+    for name, description, model in build_candidates(reference, X_fit, y_fit):
+        report[name] = {'description': description, **measure(model, X_val, y_val, reference_predictions)}
+    chosen = choose_candidate(report, tolerance)
+
+    model = build_candidate(baseline, X_train, y_train, chosen)
+    baseline_test_predictions = baseline.predict(X_test)
+    test = {role: score_on_test(candidate, X_test, y_test, baseline_test_predictions)
+            for role, candidate in (('baseline', baseline), ('chosen', model))}
+    return report, chosen, model, test
+
+
+def format_report(report, chosen) -> str:
+    lines = [f"{'candidate':<14}{'size KB':>12}{'load ms':>10}{'1 pred us':>11}{'batch us/row':>14}"
+             f"{'accuracy':>10}{'agree':>8}{'nodes':>10}"]
+    for name, row in report.items():
+        marker = ' *' if name == chosen else ''
+        lines.append(f"{name:<14}{row['size_bytes'] / 1024:>12.1f}{row['load_ms']:>10.1f}"
+                     f"{row['single_prediction_us']:>11.0f}{row['batch_prediction_us_per_row']:>14.2f}"
+                     f"{row['accuracy']:>10.4f}{row['agreement_with_baseline']:>8.4f}{row['n_nodes']:>10}{marker}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Try smaller versions of the risk forest and save the smallest one within an accuracy tolerance.")
+    parser.add_argument("--model", default=MODEL_PATH, help="Model to compact")
+    parser.add_argument("--output", help="Where to save the chosen candidate, e.g. ml/diabetes_risk_model.joblib "
+                                         "to replace the serving artifact. Without it, only the report is printed.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Maximum accuracy drop below the baseline")
+    parser.add_argument("--report", help="Also write the report as JSON to this path")
+    parser.add_argument("--dry-run", action="store_true", help="Only print the report")
+    args = parser.parse_args(argv)
+
+    report, chosen, model, test = compact_model(args.model, args.tolerance)
+    print("Validation split:")
+    print(format_report(report, chosen))
+    print(f"\nChosen: {chosen} ({report[chosen]['description']}), test accuracy "
+          f"{test['chosen']['accuracy']:.4f} vs baseline {test['baseline']['accuracy']:.4f}, "
+          f"agreement with baseline {test['chosen']['agreement_with_baseline']:.4f}")
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({'chosen': chosen, 'tolerance': args.tolerance, 'validation': report, 'test': test}, f, indent=2)
+
+    if args.dry_run or not args.output:
+        print("Dry run; pass --output to save the chosen candidate.")
+        return
+    if chosen == 'baseline' and os.path.abspath(args.output) == os.path.abspath(args.model):
+        print("Baseline kept; nothing to save.")
+        return
+    import joblib
+    tmp = args.output + '.tmp'
+    joblib.dump(model, tmp)
+    os.replace(tmp, args.output)
+    print(f"Saved {chosen} to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
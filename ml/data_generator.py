@@ -9,46 +9,69 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report
 import joblib
 
-def generate_synthetic_data(num_samples=100000):
-    """Generate synthetic diabetes dataset with glucose levels and risk labels"""
-    np.random.seed(42)
-    
-    # Calculate sample size for each class (25% each)
-    class_size = num_samples // 4
+def generate_synthetic_data(num_samples=100000, seed=42):
+    """Generate synthetic diabetes dataset with glucose levels and risk labels.
+
+    An int seed reproduces the original ``np.random.seed(42)`` output without
+    touching the global RNG; a ``SeedSequence`` (as used for shards) drives a
+    ``numpy.random.Generator``.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        rng = np.random.default_rng(seed)
+    else:
+        rng = np.random.RandomState(seed)
+    
+    # Calculate sample size for each class (25% each, remainder to the first classes)
+    base, extra = divmod(num_samples, 4)
+    class_sizes = [base + (1 if i < extra else 0) for i in range(4)]
     
     # Class distributions
     # Class 0: No Diabetes (70-99 mg/dL fasting, <140 postprandial)
-    glucose_class0 = np.random.normal(90, 10, class_size)
+    glucose_class0 = rng.normal(90, 10, class_sizes[0])
     glucose_class0 = np.clip(glucose_class0, 70, 140)
     
     # Class 1: Diabetic, Low Risk (100-150 mg/dL)
-    glucose_class1 = np.random.normal(130, 15, class_size)
+    glucose_class1 = rng.normal(130, 15, class_sizes[1])
     glucose_class1 = np.clip(glucose_class1, 100, 180)
     
     # Class 2: Diabetic, Medium Risk (151-200 mg/dL)
-    glucose_class2 = np.random.normal(175, 20, class_size)
+    glucose_class2 = rng.normal(175, 20, class_sizes[2])
     glucose_class2 = np.clip(glucose_class2, 150, 250)
     
     # Class 3: Diabetic, High Risk (>200 mg/dL)
-    glucose_class3 = np.random.normal(230, 30, class_size)
+    glucose_class3 = rng.normal(230, 30, class_sizes[3])
     glucose_class3 = np.clip(glucose_class3, 200, 350)
     
     # Combine all classes
     glucose = np.concatenate([glucose_class0, glucose_class1, glucose_class2, glucose_class3])
     labels = np.concatenate([
-        np.zeros(class_size),
-        np.ones(class_size),
-        np.ones(class_size) * 2,
-        np.ones(class_size) * 3
+        np.zeros(class_sizes[0]),
+        np.ones(class_sizes[1]),
+        np.ones(class_sizes[2]) * 2,
+        np.ones(class_sizes[3]) * 3
     ])
     
     # Add some noise and shuffle
-    glucose += np.random.normal(0, 5, num_samples)
+    glucose += rng.normal(0, 5, num_samples)
     data = pd.DataFrame({'glucose_level': glucose, 'risk_level': labels})
-    data = data.sample(frac=1).reset_index(drop=True)
+    data = data.sample(frac=1, random_state=rng).reset_index(drop=True)
     
     return data
 
+def _write_synthetic_shard(path, num_samples, seed_sequence, file_format):
+    data = generate_synthetic_data(num_samples, seed=seed_sequence)
+    if file_format == "parquet":
+        data.to_parquet(path, index=False)
+    else:
+        data.to_csv(path, index=False)
+    return len(data)
+
+def write_synthetic_data_shards(output_dir, num_samples=100000, n_shards=8, seed=42, workers=None, file_format="csv"):
+    """Generate the dataset in parallel as a directory of shard files (see ml.sharded_generation)"""
+    from ml.sharded_generation import generate_shards
+    
+    return generate_shards(_write_synthetic_shard, output_dir, num_samples, n_shards, seed, workers, file_format)
+
 def train_model(data):
     """Train and evaluate a RandomForest classifier"""
     X = data[['glucose_level']].values
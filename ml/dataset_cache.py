@@ -0,0 +1,161 @@
+# ml/dataset_cache.py
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_CSV_PATH = Path(__file__).parent.parent / 'data' / 'diabetes_dataset.csv'
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / 'data' / '.cache'
+META_FILENAME = 'meta.json'
+CACHE_FORMAT_VERSION = 1
+
+# CSV column -> on-disk dtype of its cached .npy file
+COLUMNS = {
+    'glucose_level': np.float32,
+    'risk_level': np.int8,
+}
+
+
+def _sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_path(csv_path) -> str:
+    return str(Path(csv_path).resolve())
+
+
+def cache_dir_for(csv_path, cache_root=None) -> Path:
+    """
+    Cache directory for ``csv_path``: ``<cache_root>/<csv stem>-<hash of its
+    resolved path>``, so same-named CSVs in different directories don't share one.
+    """
+    path_hash = hashlib.sha256(_source_path(csv_path).encode()).hexdigest()[:16]
+    return Path(cache_root or DEFAULT_CACHE_DIR) / f'{Path(csv_path).stem}-{path_hash}'
+
+
+def _read_meta(cache_dir: Path):
+    try:
+        with open(cache_dir / META_FILENAME) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(cache_dir: Path, meta: dict):
+    tmp = cache_dir / (META_FILENAME + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp, cache_dir / META_FILENAME)
+
+
+def is_cache_valid(csv_path, cache_dir) -> bool:
+    """
+    A cache is valid when its recorded source hash matches the CSV. The hash is
+    only recomputed when the CSV's mtime or size changed since the cache was
+    written; a touched but unchanged file just gets its recorded mtime refreshed.
+    """
+    cache_dir = Path(cache_dir)
+    meta = _read_meta(cache_dir)
+    if not meta or meta.get('format_version') != CACHE_FORMAT_VERSION:
+        return False
+    if meta.get('source') != _source_path(csv_path):
+        return False
+    if not all((cache_dir / f'{column}.npy').is_file() for column in COLUMNS):
+        return False
+    stat = os.stat(csv_path)
+    if meta['source_mtime_ns'] == stat.st_mtime_ns and meta['source_size'] == stat.st_size:
+        return True
+    if meta['source_size'] != stat.st_size or meta['source_sha256'] != _sha256(csv_path):
+        return False
+    meta['source_mtime_ns'] = stat.st_mtime_ns
+    _write_meta(cache_dir, meta)
+    return True
+
+
+def build_cache(csv_path, cache_dir) -> dict:
+    """Parse the CSV once and write each column as a typed .npy file."""
+    import pandas as pd
+
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    stat = os.stat(csv_path)
+    start = time.perf_counter()
+    data = pd.read_csv(csv_path, usecols=list(COLUMNS), dtype={column: np.float64 for column in COLUMNS})
+    parse_seconds = time.perf_counter() - start
+
+    for column, dtype in COLUMNS.items():
+        tmp = cache_dir / f'{column}.tmp.npy'
+        np.save(tmp, data[column].to_numpy().astype(dtype))
+        os.replace(tmp, cache_dir / f'{column}.npy')
+    meta = {
+        'format_version': CACHE_FORMAT_VERSION,
+        'source': _source_path(csv_path),
+        'source_sha256': _sha256(csv_path),
+        'source_mtime_ns': stat.st_mtime_ns,
+        'source_size': stat.st_size,
+        'rows': len(data),
+        'dtypes': {column: np.dtype(dtype).name for column, dtype in COLUMNS.items()},
+        'parse_seconds': parse_seconds,
+    }
+    # Written last: the arrays are only trusted once the metadata names their source
+    _write_meta(cache_dir, meta)
+    return meta
+
+
+def load_dataset_arrays(csv_path=DEFAULT_CSV_PATH, cache_root=None, mmap=True):
+    """
+    Load (glucose float32, risk_level int8) for ``csv_path`` from the binary
+    cache, building it first if missing or stale. Arrays are read-only
+    memory maps unless ``mmap`` is False.
+    """
+    cache_dir = cache_dir_for(csv_path, cache_root)
+    if not is_cache_valid(csv_path, cache_dir):
+        build_cache(csv_path, cache_dir)
+    mmap_mode = 'r' if mmap else None
+    return tuple(np.load(cache_dir / f'{column}.npy', mmap_mode=mmap_mode) for column in COLUMNS)
+
+
+def compare_load_times(csv_path=DEFAULT_CSV_PATH, cache_root=None, repeats=5) -> dict:
+    """Best-of-``repeats`` seconds for a CSV parse versus a cached (memory-mapped) load."""
+    import pandas as pd
+
+    load_dataset_arrays(csv_path, cache_root)  # make sure the cache exists
+
+    def best(fn):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    # Touch every page so the mmap load isn't measured as free
+    parse = best(lambda: pd.read_csv(csv_path))
+    load = best(lambda: [float(np.asarray(a).sum()) for a in load_dataset_arrays(csv_path, cache_root)])
+    return {'parse_seconds': parse, 'load_seconds': load, 'speedup': parse / load if load else float('inf')}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the binary columnar cache of a diabetes dataset CSV and report parse vs load time.")
+    parser.add_argument("csv_path", nargs="?", default=str(DEFAULT_CSV_PATH))
+    parser.add_argument("--cache-root", default=None, help=f"Cache root (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild even if the cache is valid")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        build_cache(args.csv_path, cache_dir_for(args.csv_path, args.cache_root))
+    timings = compare_load_times(args.csv_path, args.cache_root)
+    print(f"CSV parse:   {timings['parse_seconds'] * 1000:8.2f} ms")
+    print(f"Cache load:  {timings['load_seconds'] * 1000:8.2f} ms  ({timings['speedup']:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
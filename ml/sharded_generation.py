@@ -0,0 +1,81 @@
+# ml/sharded_generation.py
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+
+MANIFEST_FILENAME = "manifest.json"
+SHARD_FORMATS = ("csv", "parquet")
+
+
+def shard_sizes(n_samples: int, n_shards: int) -> List[int]:
+    """Split ``n_samples`` rows into ``n_shards`` near-equal, deterministic shard sizes."""
+    if n_shards < 1:
+        raise ValueError("n_shards must be at least 1")
+    base, extra = divmod(n_samples, n_shards)
+    return [base + (1 if i < extra else 0) for i in range(n_shards)]
+
+
+def shard_filename(index: int, file_format: str) -> str:
+    return f"part-{index:05d}.{file_format}"
+
+
+def _write_one(write_shard, path, n_rows, seed_sequence, file_format):
+    return write_shard(path, n_rows, seed_sequence, file_format)
+
+
+def generate_shards(write_shard: Callable, output_dir, n_samples: int, n_shards: int,
+                    seed: Optional[int] = None, workers: Optional[int] = None,
+                    file_format: str = "csv") -> dict:
+    """
+    Generate a dataset as a directory of independently seeded shard files.
+
+    ``write_shard(path, n_rows, seed_sequence, file_format)`` must be a
+    module-level (picklable) function that writes one shard and returns its
+    row count. Shard i always gets child i of ``SeedSequence(seed)`` and a
+    fixed row count, so the files are byte-identical for a given seed and
+    shard count however many ``workers`` produce them.
+    """
+    if file_format not in SHARD_FORMATS:
+        raise ValueError(f"Unsupported format '{file_format}'. Use one of {SHARD_FORMATS}.")
+    if seed is None:
+        # Record the drawn entropy so the run can be reproduced from the manifest
+        seed = np.random.SeedSequence().entropy
+    sizes = shard_sizes(n_samples, n_shards)
+    children = np.random.SeedSequence(seed).spawn(n_shards)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = [str(output_dir / shard_filename(i, file_format)) for i in range(n_shards)]
+
+    workers = min(workers or os.cpu_count() or 1, n_shards)
+    if workers == 1:
+        rows = [_write_one(write_shard, *args, file_format) for args in zip(paths, sizes, children)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_write_one, [write_shard] * n_shards, paths, sizes, children,
+                                 [file_format] * n_shards))
+
+    manifest = {
+        "seed": int(seed),
+        "n_samples": int(sum(rows)),
+        "format": file_format,
+        "shards": [{"path": os.path.basename(path), "rows": int(count)} for path, count in zip(paths, rows)],
+    }
+    # Written last: its presence marks a complete dataset
+    with open(output_dir / MANIFEST_FILENAME, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_shards(directory):
+    """Load a sharded dataset back into one DataFrame, in shard order."""
+    import pandas as pd
+
+    directory = Path(directory)
+    with open(directory / MANIFEST_FILENAME) as f:
+        manifest = json.load(f)
+    reader = pd.read_parquet if manifest["format"] == "parquet" else pd.read_csv
+    return pd.concat([reader(directory / shard["path"]) for shard in manifest["shards"]], ignore_index=True)
@@ -0,0 +1,211 @@
+# ml/streaming_train.py
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+FEATURE_COLUMN = 'glucose_level'
+LABEL_COLUMN = 'risk_level'
+RISK_CLASSES = np.arange(4, dtype=np.int8)
+
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def row_hash(row_ids, seed=42) -> np.ndarray:
+    """SplitMix64 hash of global row numbers; stable across chunk sizes and runs."""
+    offset = np.uint64(((seed + 1) * _GOLDEN) % (1 << 64))
+    z = np.asarray(row_ids, dtype=np.uint64) + offset
+    z = (z ^ (z >> np.uint64(30))) * _MIX1
+    z = (z ^ (z >> np.uint64(27))) * _MIX2
+    return z ^ (z >> np.uint64(31))
+
+
+def in_test_split(row_ids, test_size=0.2, seed=42) -> np.ndarray:
+    """True for rows assigned to the test split (a ``test_size`` fraction of rows)."""
+    # Top 53 bits as a uniform float in [0, 1)
+    return (row_hash(row_ids, seed) >> np.uint64(11)).astype(np.float64) / float(1 << 53) < test_size
+
+
+def iter_dataset_chunks(path, chunk_size=50000):
+    """
+    Yield (glucose float32, risk_level int8) chunks from a dataset CSV or a
+    sharded dataset directory (see ml.sharded_generation), holding one
+    chunk in memory at a time.
+    """
+    import pandas as pd
+
+    path = Path(path)
+    if path.is_dir():
+        with open(path / 'manifest.json') as f:
+            manifest = json.load(f)
+        files = [path / shard['path'] for shard in manifest['shards']]
+    else:
+        files = [path]
+
+    for file in files:
+        if file.suffix == '.parquet':
+            import pyarrow.parquet as pq
+            batches = (batch.to_pandas() for batch in
+                       pq.ParquetFile(file).iter_batches(batch_size=chunk_size, columns=[FEATURE_COLUMN, LABEL_COLUMN]))
+        else:
+            batches = pd.read_csv(file, usecols=[FEATURE_COLUMN, LABEL_COLUMN], dtype=np.float64, chunksize=chunk_size)
+        for batch in batches:
+            yield batch[FEATURE_COLUMN].to_numpy(np.float32), batch[LABEL_COLUMN].to_numpy().astype(np.int8)
+
+
+def iter_split_chunks(path, chunk_size=50000, test_size=0.2, seed=42, split='train'):
+    """Like iter_dataset_chunks, restricted to the rows of one row-hash split."""
+    offset = 0
+    for glucose, labels in iter_dataset_chunks(path, chunk_size):
+        is_test = in_test_split(np.arange(offset, offset + len(labels)), test_size, seed)
+        offset += len(labels)
+        keep = is_test if split == 'test' else ~is_test
+        yield glucose[keep], labels[keep]
+
+
+class TreeReservoir:
+    """Keeps a uniform random sample of at most ``capacity`` trees from a stream."""
+
+    def __init__(self, capacity, rng):
+        self.capacity = capacity
+        self.rng = rng
+        self.trees = []
+        self.seen = 0
+
+    def add(self, tree):
+        self.seen += 1
+        if len(self.trees) < self.capacity:
+            self.trees.append(tree)
+        else:
+            slot = self.rng.integers(self.seen)
+            if slot < self.capacity:
+                self.trees[slot] = tree
+
+
+def _assemble_forest(trees, classes):
+    """Wrap independently fitted trees in a fitted RandomForestClassifier."""
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.tree import DecisionTreeClassifier
+
+    forest = RandomForestClassifier(n_estimators=len(trees))
+    forest.estimator_ = DecisionTreeClassifier()
+    forest.estimators_ = trees
+    forest.classes_ = np.asarray(classes)
+    forest.n_classes_ = len(classes)
+    forest.n_outputs_ = 1
+    forest.n_features_in_ = 1
+    return forest
+
+
+def train_streaming_forest(path, chunk_size=50000, n_estimators=100, trees_per_chunk=20,
+                           max_samples_per_tree=None, test_size=0.2, seed=42, classes=RISK_CLASSES):
+    """
+    Train a random forest on a dataset of any size, one chunk at a time.
+
+    Every training chunk contributes ``trees_per_chunk`` trees, each fitted on a
+    bootstrap sample of that chunk; a reservoir keeps at most ``n_estimators``
+    of them. Memory is bounded by one chunk plus the kept trees, regardless of
+    the number of rows. Chunks that don't contain every class are skipped, so
+    all trees agree on ``classes``.
+    """
+    from sklearn.tree import DecisionTreeClassifier
+
+    rng = np.random.default_rng(seed)
+    reservoir = TreeReservoir(n_estimators, rng)
+    classes = np.asarray(classes)
+    skipped = 0
+    for glucose, labels in iter_split_chunks(path, chunk_size, test_size, seed, split='train'):
+        if not np.array_equal(np.unique(labels), classes):
+            skipped += 1
+            continue
+        X = glucose.reshape(-1, 1)
+        n_draw = min(max_samples_per_tree or len(labels), len(labels))
+        for _ in range(trees_per_chunk):
+            sample = rng.integers(len(labels), size=n_draw)
+            tree = DecisionTreeClassifier(random_state=int(rng.integers(2**31 - 1)))
+            reservoir.add(tree.fit(X[sample], labels[sample]))
+    if not reservoir.trees:
+        raise ValueError("No training chunk contained every class; increase chunk_size.")
+    if skipped:
+        print(f"Skipped {skipped} chunk(s) missing a class")
+    return _assemble_forest(reservoir.trees, classes)
+
+
+def evaluate_streaming(model, path, chunk_size=50000, test_size=0.2, seed=42) -> dict:
+    """Accuracy and confusion matrix on the row-hash test split, one chunk at a time."""
+    classes = list(model.classes_)
+    confusion = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    for glucose, labels in iter_split_chunks(path, chunk_size, test_size, seed, split='test'):
+        if not len(labels):
+            continue
+        predicted = model.predict(glucose.reshape(-1, 1))
+        np.add.at(confusion, (np.searchsorted(classes, labels), np.searchsorted(classes, predicted)), 1)
+    total = confusion.sum()
+    return {
+        'rows': int(total),
+        'accuracy': float(np.trace(confusion) / total) if total else 0.0,
+        'confusion_matrix': confusion.tolist(),
+    }
+
+
+def train_in_memory(path, test_size=0.2, seed=42):
+    """The in-memory baseline on the same row-hash split, for parity checks."""
+    from sklearn.ensemble import RandomForestClassifier
+
+    parts = list(iter_split_chunks(path, chunk_size=1_000_000, test_size=test_size, seed=seed, split='train'))
+    X = np.concatenate([glucose for glucose, _ in parts]).reshape(-1, 1)
+    y = np.concatenate([labels for _, labels in parts])
+    return RandomForestClassifier(n_estimators=100, random_state=seed).fit(X, y)
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return float('nan')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the risk classifier out-of-core from a CSV or sharded dataset directory.")
+    parser.add_argument("dataset", nargs="?", default=str(Path(__file__).parent.parent / 'data' / 'diabetes_dataset.csv'))
+    parser.add_argument("--output", help="Where to save the trained model (joblib)")
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--trees-per-chunk", type=int, default=20)
+    parser.add_argument("--max-samples-per-tree", type=int, default=None)
+    parser.add_argument("--test-size", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--compare", action="store_true", help="Also train the in-memory baseline and report accuracy parity")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    model = train_streaming_forest(args.dataset, args.chunk_size, args.n_estimators, args.trees_per_chunk,
+                                   args.max_samples_per_tree, args.test_size, args.seed)
+    streaming = evaluate_streaming(model, args.dataset, args.chunk_size, args.test_size, args.seed)
+    print(f"Streaming forest: {len(model.estimators_)} trees, accuracy {streaming['accuracy']:.4f} "
+          f"on {streaming['rows']} test rows ({time.perf_counter() - start:.1f}s, peak RSS {_peak_rss_mb():.0f} MB)")
+
+    if args.compare:
+        start = time.perf_counter()
+        baseline = evaluate_streaming(train_in_memory(args.dataset, args.test_size, args.seed),
+                                      args.dataset, args.chunk_size, args.test_size, args.seed)
+        print(f"In-memory forest: accuracy {baseline['accuracy']:.4f} ({time.perf_counter() - start:.1f}s)")
+        print(f"Accuracy difference: {streaming['accuracy'] - baseline['accuracy']:+.4f}")
+
+    if args.output:
+        import joblib
+        joblib.dump(model, args.output)
+        print(f"Model saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,23 @@
-import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report
 import joblib
 import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ml.dataset_cache import load_dataset_arrays
 
-def load_data():
-    """Load the synthetic dataset"""
-    # Go up one level from ml/ to access data/
-    data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'diabetes_dataset.csv')
-    return pd.read_csv(data_path)
+# Go up one level from ml/ to access data/
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'diabetes_dataset.csv')
+
+def load_training_arrays():
+    """Load features and labels from the binary dataset cache (float32 glucose, int8 labels)"""
+    glucose, labels = load_dataset_arrays(DATA_PATH)
+    return glucose.reshape(-1, 1), labels
 
 def train_and_save_model():
     """Train model and save it"""
-    data = load_data()
-    X = data[['glucose_level']].values
-    y = data['risk_level'].values
+    X, y = load_training_arrays()
     
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42
@@ -33,5 +35,20 @@ def train_and_save_model():
     joblib.dump(model, model_path)
     print(f"Model trained and saved successfully at: {model_path}")
 
+def train_and_save_model_streaming(chunk_size=50000):
+    """Train out-of-core (see ml/streaming_train.py) and save the model"""
+    from ml.streaming_train import evaluate_streaming, train_streaming_forest
+    
+    model = train_streaming_forest(DATA_PATH, chunk_size=chunk_size)
+    report = evaluate_streaming(model, DATA_PATH, chunk_size=chunk_size)
+    print(f"Streaming model accuracy: {report['accuracy']:.4f} on {report['rows']} test rows")
+    
+    model_path = os.path.join(os.path.dirname(__file__), 'diabetes_risk_model.joblib')
+    joblib.dump(model, model_path)
+    print(f"Model trained and saved successfully at: {model_path}")
+
 if __name__ == "__main__":
-    train_and_save_model()
\ No newline at end of file
+    if "--streaming" in sys.argv:
+        train_and_save_model_streaming()
+    else:
+        train_and_save_model()
\ No newline at end of file
@@ -0,0 +1,155 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.express as px
+from src.data_generation import to_float64
+
+# Columns offered on the "Data Visualizations" page
+NUTRIENT_COLUMNS = [
+    "Glucose_g_per_100g",
+    "Carbohydrate_g_per_100g",
+    "Glycemic_Index",
+    "Calories_kcal_per_100g",
+    "Protein_g_per_100g",
+    "Fat_g_per_100g"
+]
+HISTOGRAM_BINS = 50
+
+def _histogram(values, codes, categories, by, nbins):
+    low, high = float(np.nanmin(values)), float(np.nanmax(values))
+    edges = np.linspace(low, high if high > low else low + 1.0, nbins + 1)
+    # Same bin assignment as np.histogram: half-open bins, the last one closed
+    valid = ~np.isnan(values)
+    bins = np.clip(np.searchsorted(edges, values[valid], side="right") - 1, 0, nbins - 1)
+    counts = np.bincount(codes[valid] * nbins + bins, minlength=len(categories) * nbins)
+    return pd.DataFrame({
+        by: np.repeat(np.asarray(categories), nbins),
+        "bin_start": np.tile(edges[:-1], len(categories)),
+        "bin_end": np.tile(edges[1:], len(categories)),
+        "count": counts
+    })
+
+def _box_stats(values, codes, categories, by, grouped_order=None):
+    # Rows grouped by category (shared by every column), then each group sorted on its own
+    if grouped_order is None:
+        grouped_order = np.argsort(codes, kind="stable")
+    values = values[grouped_order]
+    sizes = np.bincount(codes, minlength=len(categories))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    rows = []
+    for category, start, size in zip(categories, starts, sizes):
+        group = np.sort(values[start:start + size])
+        group = group[~np.isnan(group)]
+        size = len(group)
+        if not size:
+            continue
+        # Linear interpolation between order statistics, like pandas' quantile
+        q1, median, q3 = (np.interp(q * (size - 1), np.arange(size), group) for q in (0.25, 0.5, 0.75))
+        iqr = q3 - q1
+        lower = group[np.searchsorted(group, q1 - 1.5 * iqr, side="left")]
+        upper = group[np.searchsorted(group, q3 + 1.5 * iqr, side="right") - 1]
+        rows.append({by: category, "q1": q1, "median": median, "q3": q3, "mean": group.mean(),
+                     "count": int(size), "lowerfence": lower, "upperfence": upper})
+    return pd.DataFrame(rows, columns=[by, "q1", "median", "q3", "mean", "count", "lowerfence", "upperfence"])
+
+def _factorize(df, by):
+    codes, categories = pd.factorize(df[by], sort=True)
+    return codes, np.asarray(categories)
+
+def histogram_bins(df, column, by="Category", nbins=HISTOGRAM_BINS):
+    """
+    Count rows per category in equal-width bins shared by all categories.
+    Args:
+        df (pd.DataFrame): Dataset.
+        column (str): Numeric column to bin.
+        by (str): Column to group by.
+        nbins (int): Number of bins over the column's full range.
+    Returns:
+        pd.DataFrame: One row per (category, bin) with bin_start, bin_end and count.
+    """
+    codes, categories = _factorize(df, by)
+    return _histogram(to_float64(df[column]), codes, categories, by, nbins)
+
+def box_stats(df, column, by="Category"):
+    """
+    Box-plot statistics per category: quartiles, mean and Tukey whiskers (the
+    most extreme values within 1.5 IQR of the quartiles).
+    Args:
+        df (pd.DataFrame): Dataset.
+        column (str): Numeric column to summarize.
+        by (str): Column to group by.
+    Returns:
+        pd.DataFrame: One row per category.
+    """
+    codes, categories = _factorize(df, by)
+    return _box_stats(to_float64(df[column]), codes, categories, by)
+
+def summarize_dataset(df, columns=NUTRIENT_COLUMNS, by="Category", nbins=HISTOGRAM_BINS):
+    """
+    Precompute everything the visualizations need, so figures never see the raw rows.
+    Args:
+        df (pd.DataFrame): Dataset.
+        columns (list): Numeric columns to summarize.
+        by (str): Column to group by.
+        nbins (int): Histogram bins per column.
+    Returns:
+        dict: Column -> {"histogram": DataFrame, "box": DataFrame}.
+    """
+    codes, categories = _factorize(df, by)
+    grouped_order = np.argsort(codes, kind="stable")
+    summaries = {}
+    for column in columns:
+        values = to_float64(df[column])
+        summaries[column] = {
+            "histogram": _histogram(values, codes, categories, by, nbins),
+            "box": _box_stats(values, codes, categories, by, grouped_order)
+        }
+    return summaries
+
+def _label(column):
+    return column.replace("_", " ").title()
+
+def _category_colors(categories):
+    palette = px.colors.qualitative.Plotly
+    return {category: palette[i % len(palette)] for i, category in enumerate(categories)}
+
+def histogram_figure(histogram, column, by="Category", title=None, label=None):
+    """
+    Stacked histogram from histogram_bins output; its size depends on the
+    number of bins and categories, not rows.
+    """
+    label = label or _label(column)
+    categories = histogram[by].unique()
+    colors = _category_colors(categories)
+    fig = go.Figure()
+    for category in categories:
+        rows = histogram[(histogram[by] == category) & (histogram["count"] > 0)]
+        fig.add_trace(go.Bar(
+            x=(rows["bin_start"] + rows["bin_end"]) / 2,
+            y=rows["count"],
+            width=rows["bin_end"] - rows["bin_start"],
+            name=str(category),
+            marker_color=colors[category]
+        ))
+    fig.update_layout(barmode="stack", bargap=0, title=title, xaxis_title=label, yaxis_title="count", legend_title=by)
+    return fig
+
+def box_figure(stats, column, by="Category", title=None, label=None):
+    """Box plot from box_stats output, with precomputed quartiles and whiskers instead of raw points."""
+    label = label or _label(column)
+    fig = go.Figure(go.Box(
+        x=stats[by],
+        q1=stats["q1"],
+        median=stats["median"],
+        q3=stats["q3"],
+        mean=stats["mean"],
+        lowerfence=stats["lowerfence"],
+        upperfence=stats["upperfence"],
+        boxpoints=False,
+        name=label
+    ))
+    fig.update_layout(title=title, xaxis_title=by, yaxis_title=label)
+    return fig
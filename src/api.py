@@ -1,28 +1,150 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from typing import Optional
+from fastapi import FastAPI, HTTPException, Depends, Query
 from pydantic import BaseModel
-import pickle
-from src.model_training import predict_glucose, get_diabetic_recommendation
+from src.food_index import build_food_search_index, get_food_index
+from src.model_training import (
+    get_known_food_table,
+    get_known_food_table_in_worker,
+    get_prediction_cache,
+    load_model_artifacts,
+    predict_glucose,
+    predict_glucose_in_worker,
+    init_prediction_worker,
+    get_diabetic_recommendation,
+)
 from src.utils import setup_logging
-
-# Initialize FastAPI app
-app = FastAPI(title="Food Glucose Predictor API", description="API for predicting glucose content and diabetic recommendations.")
+from app.config import settings
+from app.executor import InferenceExecutor
+from app.model_registry import ModelRegistry, ModelReloader
+from app.admin import require_admin_token, require_known_version
 
 # Set up logging
 logger = setup_logging()
 
-# Load model and vectorizer
-try:
-    with open("../food_glucose_model.pkl", "rb") as f:
-        model = pickle.load(f)
-    with open("../food_vectorizer.pkl", "rb") as f:
-        vectorizer = pickle.load(f)
-    logger.info("Model and vectorizer loaded successfully.")
-except FileNotFoundError as e:
-    logger.error(f"Model or vectorizer file not found: {e}")
-    raise FileNotFoundError("Ensure food_glucose_model.pkl and food_vectorizer.pkl exist.")
+if settings.model_artifact_format == "flat":
+    # Memory-mapped export shared by all workers: python -m app.flat_forest ../food_glucose_model.pkl ../food_glucose_model_flat --vectorizer ../food_vectorizer.pkl
+    MODEL_PATH = VECTORIZER_PATH = os.path.abspath("../food_glucose_model_flat")
+else:
+    MODEL_PATH = os.path.abspath("../food_glucose_model.pkl")
+    VECTORIZER_PATH = os.path.abspath("../food_vectorizer.pkl")
+
+# Registry entry for versioned food models: a "model" and a "vectorizer" artifact
+REGISTRY_MODEL_NAME = "food_glucose"
+registry = ModelRegistry(settings.model_registry_dir) if settings.model_registry_dir else None
+
+class FoodModelVersion:
+    """One loaded version of the food model. In process mode only the paths are held here."""
+    def __init__(self, version, model_path, vectorizer_path, model=None, vectorizer=None, search_index=None):
+        self.version = version
+        self.model_path = model_path
+        self.vectorizer_path = vectorizer_path
+        self.model = model
+        self.vectorizer = vectorizer
+        # Typeahead index with this version's glucose predictions (see get_search_index)
+        self.search_index = search_index
+
+# The version currently being served; swapped atomically by model_reloader
+served_model = None
+
+def _local_version():
+    try:
+        stats = [os.stat(os.path.join(path, "manifest.json") if os.path.isdir(path) else path)
+                 for path in (MODEL_PATH, VECTORIZER_PATH)]
+    except FileNotFoundError:
+        return None
+    return "local-" + "-".join(f"{s.st_mtime_ns:x}" for s in stats)
+
+def resolve_model_version():
+    """The version that should be served: the registry's current version, or the local files'"""
+    if registry is not None:
+        return registry.current_version(REGISTRY_MODEL_NAME)
+    return _local_version()
+
+def load_food_model(version=None):
+    """Load and warm up a model version without serving it."""
+    if registry is not None:
+        version = version or registry.current_version(REGISTRY_MODEL_NAME)
+        if version is None:
+            raise FileNotFoundError(f"No versions of '{REGISTRY_MODEL_NAME}' in registry {registry.root}")
+        model_path = str(registry.artifact_path(REGISTRY_MODEL_NAME, version, "model"))
+        vectorizer_path = str(registry.artifact_path(REGISTRY_MODEL_NAME, version, "vectorizer"))
+    else:
+        model_path, vectorizer_path = MODEL_PATH, VECTORIZER_PATH
+        version = _local_version() or "unversioned"
+
+    if food_executor.kind == "process":
+        # Worker processes load their own copy on first use of these paths
+        if not (os.path.exists(model_path) and os.path.exists(vectorizer_path)):
+            raise FileNotFoundError(f"Missing {model_path} or {vectorizer_path}")
+        return FoodModelVersion(version, model_path, vectorizer_path)
+
+    # Loading builds the known-food table; one prediction warms up the rest of the path
+    model, vectorizer = load_model_artifacts(model_path, vectorizer_path)
+    predict_glucose("injera", model, vectorizer)
+    search_index = build_food_search_index(get_known_food_table(model, vectorizer))
+    return FoodModelVersion(version, model_path, vectorizer_path, model, vectorizer, search_index)
+
+def set_served_model(food_model):
+    global served_model
+    served_model = food_model
+    logger.info(f"Serving food model version '{food_model.version}'.")
+
+def served_model_version():
+    return served_model.version if served_model is not None else None
+
+async def get_search_index(food_model):
+    """The typeahead index of a model version; in process mode it's built on first use from a worker's predictions."""
+    if food_model.search_index is None:
+        known_foods = await food_executor.run(get_known_food_table_in_worker, food_model.model_path, food_model.vectorizer_path)
+        food_model.search_index = build_food_search_index(known_foods)
+    return food_model.search_index
+
+# Inference runs on a bounded pool so it never blocks the event loop. With
+# food_executor_kind="process" each worker process loads its own model copy.
+if settings.food_executor_kind == "process":
+    food_executor = InferenceExecutor(
+        max_workers=settings.inference_max_workers,
+        kind="process",
+        initializer=init_prediction_worker,
+        initargs=(MODEL_PATH, VECTORIZER_PATH)
+    )
+else:
+    food_executor = InferenceExecutor(max_workers=settings.inference_max_workers)
+
+# Loads new model versions in the background and swaps them in atomically
+model_reloader = ModelReloader(
+    resolve=resolve_model_version,
+    load=load_food_model,
+    swap=set_served_model,
+    current_version=served_model_version,
+    poll_seconds=settings.model_registry_poll_seconds
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load model and vectorizer before serving, off the event loop (unpickling imports sklearn)
+    try:
+        await model_reloader.reload()
+        # Build the food index now rather than on the first /predict
+        get_food_index()
+        if food_executor.kind == "process":
+            # Worker processes load their own copy; start them now instead of on the first request
+            await food_executor.run(init_prediction_worker, served_model.model_path, served_model.vectorizer_path)
+        logger.info("Model and vectorizer loaded successfully.")
+    except FileNotFoundError as e:
+        logger.error(f"Model or vectorizer file not found: {e}")
+        raise FileNotFoundError("Ensure food_glucose_model.pkl and food_vectorizer.pkl exist.")
+    model_reloader.start()
+    yield
+    await model_reloader.stop()
+    food_executor.shutdown(wait=False)
+
+# Initialize FastAPI app
+app = FastAPI(title="Food Glucose Predictor API", description="API for predicting glucose content and diabetic recommendations.", lifespan=lifespan)
 
 # Define request body schema
 class FoodInput(BaseModel):
@@ -31,7 +153,65 @@ class FoodInput(BaseModel):
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {"status": "healthy", "model_version": served_model_version()}
+
+# Inference pool saturation
+@app.get("/metrics/inference")
+async def inference_metrics():
+    return food_executor.stats()
+
+# Prediction cache effectiveness for the currently loaded model
+@app.get("/metrics/cache")
+async def cache_metrics():
+    if food_executor.kind == "process":
+        # Each worker process holds its own cache; they are not aggregated here
+        return {"enabled": settings.prediction_cache_size > 0, "scope": "per-worker process"}
+    current = served_model
+    return {
+        "model_version": current.version,
+        "known_foods": len(get_known_food_table(current.model, current.vectorizer)),
+        **get_prediction_cache(current.model, current.vectorizer).stats()
+    }
+
+# Load a model version (default: the current registry version) in the background and swap it in
+@app.post("/admin/reload_model", dependencies=[Depends(require_admin_token)])
+async def reload_model(version: Optional[str] = None):
+    require_known_version(registry, REGISTRY_MODEL_NAME, version)
+    previous_version = served_model_version()
+    try:
+        model_version = await model_reloader.reload(version)
+    except (FileNotFoundError, KeyError) as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"previous_version": previous_version, "model_version": model_version}
+
+# Typeahead endpoint
+@app.get("/search")
+async def search_foods(q: str = Query(..., max_length=100), limit: int = Query(10, ge=1, le=50)):
+    """
+    Autocomplete catalog food names.
+    Args:
+        q (str): Partial food name as typed (e.g., "inj" or "wat").
+        limit (int): Maximum number of matches.
+    Returns:
+        dict: Ranked matches with their category and precomputed glucose content.
+    """
+    current = served_model
+    search_index = await get_search_index(current)
+    foods = get_food_index()
+    return {
+        "query": q,
+        "results": [
+            {
+                "food_name": match["name"],
+                "category": foods.get(match["name"]).category,
+                "glucose_content_g_per_100g": match["value"],
+                "match": match["match"],
+                "score": match["score"]
+            }
+            for match in search_index.search(q, limit)
+        ],
+        "model_version": current.version
+    }
 
 # Prediction endpoint
 @app.post("/predict")
@@ -48,8 +228,15 @@ async def predict_glucose_content(food_input: FoodInput):
         if not food_name:
             raise ValueError("Food name cannot be empty.")
         
-        # Predict glucose content
-        glucose_content = predict_glucose(food_name, model, vectorizer)
+        # Predict glucose content. The served version is captured once, so a
+        # concurrent reload doesn't affect this request.
+        current = served_model
+        if food_executor.kind == "process":
+            glucose_content = await food_executor.run(
+                predict_glucose_in_worker, food_name, current.model_path, current.vectorizer_path
+            )
+        else:
+            glucose_content = await food_executor.run(predict_glucose, food_name, current.model, current.vectorizer)
         
         # Get diabetic recommendation
         recommendation = get_diabetic_recommendation(glucose_content, food_name)
@@ -57,7 +244,8 @@ async def predict_glucose_content(food_input: FoodInput):
         # Extract glycemic load
         glycemic_load = recommendation.get("glycemic_load")
         
-        logger.info(f"Prediction for '{food_name}': {glucose_content:.2f} g/100g, GL: {glycemic_load}, {recommendation}")
+        logger.info("Prediction for '%s': %.2f g/100g, GL: %s, %s", food_name, glucose_content, glycemic_load,
+                    recommendation, extra={"log_type": "prediction"})
         return {
             "food_name": food_name,
             "glucose_content_g_per_100g": glucose_content,
@@ -65,7 +253,8 @@ async def predict_glucose_content(food_input: FoodInput):
             "diabetic_recommendation": {
                 "recommendation": recommendation["recommendation"],
                 "details": recommendation["details"]
-            }
+            },
+            "model_version": current.version
         }
     
     except Exception as e:
@@ -2,12 +2,21 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import streamlit as st
-import pandas as pd
 import pickle
 import os
-import plotly.express as px
-from src.data_generation import generate_food_dataset
-from src.model_training import train_model, predict_glucose
+from src.app_resources import (
+    DATASET_PATH,
+    EXPORT_CACHE_DIR,
+    MODEL_PATH,
+    VECTORIZER_PATH,
+    TrainingJob,
+    content_digest,
+    ensure_dataset,
+)
+from src.aggregation import NUTRIENT_COLUMNS, box_figure, histogram_figure, summarize_dataset
+from src.data_generation import load_food_dataset
+from src.dataset_explorer import DatasetIndex, get_export, get_page, page_count
+from src.model_training import predict_glucose
 from src.utils import setup_logging
 
 # Set up logging
@@ -16,42 +25,74 @@ logger = setup_logging()
 # Streamlit page configuration
 st.set_page_config(page_title="Food Glucose Predictor", layout="wide")
 
-# Initialize session state
-if "model" not in st.session_state:
-    st.session_state.model = None
-    st.session_state.vectorizer = None
-    st.session_state.df = None
+# Initialize session state. The data and model themselves are process-wide
+# cached resources shared by all sessions; a session only records that it loaded them.
+if "loaded" not in st.session_state:
+    st.session_state.loaded = False
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_dataset(path, digest):
+    """
+    Dataset shared read-only by all sessions; `digest` (its content hash) keys the cache.
+    Loaded with categorical names/categories and float32 nutrients (see load_food_dataset).
+    """
+    logger.info(f"Loaded dataset version {digest[:12]}.")
+    return load_food_dataset(path)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_summaries(path, digest):
+    """Per-category histogram bins and box statistics of a dataset version, computed once and shared by all sessions."""
+    return summarize_dataset(load_dataset(path, digest))
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_explorer_index(path, digest):
+    """Filter index of a dataset version for the Dataset Explorer, built once and shared by all sessions."""
+    return DatasetIndex(load_dataset(path, digest))
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_model(model_path, vectorizer_path, digest):
+    """Model and vectorizer shared read-only by all sessions; `digest` (their content hash) keys the cache."""
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+    with open(vectorizer_path, "rb") as f:
+        vectorizer = pickle.load(f)
+    logger.info(f"Loaded model version {digest[:12]}.")
+    return model, vectorizer
+
+@st.cache_resource
+def get_training_job():
+    """The process-wide training job, so sessions never train concurrently."""
+    return TrainingJob()
 
 def load_data_and_model():
-    """Load or generate dataset and model."""
+    """
+    Load the shared dataset and model, generating or training them first if missing.
+    Returns:
+        tuple: (df, model, vectorizer), or None if loading failed.
+    """
     try:
         # Load or generate dataset
-        if os.path.exists("../food_carbohydrate_dataset.csv"):
-            st.session_state.df = pd.read_csv("../food_carbohydrate_dataset.csv")
-            logger.info("Loaded existing dataset.")
-        else:
-            st.session_state.df = generate_food_dataset()
-            st.session_state.df.to_csv("../food_carbohydrate_dataset.csv", index=False)
-            logger.info("Generated and saved new dataset.")
+        ensure_dataset(DATASET_PATH)
+        df = load_dataset(DATASET_PATH, content_digest(DATASET_PATH))
         
         # Load or train model
-        if os.path.exists("../food_glucose_model.pkl") and os.path.exists("../food_vectorizer.pkl"):
-            with open("../food_glucose_model.pkl", "rb") as f:
-                st.session_state.model = pickle.load(f)
-            with open("../food_vectorizer.pkl", "rb") as f:
-                st.session_state.vectorizer = pickle.load(f)
-            logger.info("Loaded existing model and vectorizer.")
-        else:
-            st.session_state.model, st.session_state.vectorizer = train_model(st.session_state.df)
-            with open("../food_glucose_model.pkl", "wb") as f:
-                pickle.dump(st.session_state.model, f)
-            with open("../food_vectorizer.pkl", "wb") as f:
-                pickle.dump(st.session_state.vectorizer, f)
-            logger.info("Trained and saved new model and vectorizer.")
+        digest = content_digest(MODEL_PATH, VECTORIZER_PATH)
+        if digest is None:
+            job = get_training_job()
+            if job.start(df):
+                logger.info("Started background model training.")
+            else:
+                logger.info("Waiting for model training started by another session.")
+            job.wait()
+            digest = content_digest(MODEL_PATH, VECTORIZER_PATH)
+        model, vectorizer = load_model(MODEL_PATH, VECTORIZER_PATH, digest)
+        st.session_state.loaded = True
+        return df, model, vectorizer
     
     except Exception as e:
         logger.error(f"Error loading data/model: {e}")
         st.error(f"Error loading data/model: {e}")
+        return None
 
 def get_diabetic_recommendation(glucose_content):
     """
@@ -74,12 +115,19 @@ def main():
     st.markdown("Explore nutritional data and predict glucose content for Ethiopian and European foods, with recommendations for diabetic patients.")
     
     # Load data and model
+    resources = None
     if st.button("Load/Generate Data and Model"):
         with st.spinner("Loading data and model..."):
-            load_data_and_model()
-        st.success("Data and model loaded successfully!")
+            resources = load_data_and_model()
+        if resources is not None:
+            st.success("Data and model loaded successfully!")
+    elif st.session_state.loaded:
+        # Cache hits unless the files changed on disk
+        resources = load_data_and_model()
     
-    if st.session_state.df is not None:
+    if resources is not None:
+        df, model, vectorizer = resources
+        
         # Sidebar for navigation
         st.sidebar.header("Navigation")
         page = st.sidebar.radio("Select a page:", ["Dataset Explorer", "Glucose Predictor", "Data Visualizations"])
@@ -88,15 +136,42 @@ def main():
         if page == "Dataset Explorer":
             st.header("Dataset Explorer")
             st.write("Browse the generated dataset of foods and their nutritional content.")
-            st.dataframe(st.session_state.df)
+            digest = content_digest(DATASET_PATH)
+            index = load_explorer_index(DATASET_PATH, digest)
+            
+            # Filters
+            col1, col2 = st.columns(2)
+            categories = col1.multiselect("Category", index.categories)
+            name_contains = col2.text_input("Food name contains", placeholder="e.g., wat")
+            ranges = {}
+            with st.expander("Nutrient ranges"):
+                for column, (low, high) in index.bounds.items():
+                    if high > low:
+                        ranges[column] = st.slider(column.replace("_", " "), low, high, (low, high))
+            rows = index.query(categories, name_contains, ranges)
+            
+            # Only the current page is sent to the browser
+            col1, col2 = st.columns(2)
+            page_size = col1.selectbox("Rows per page", [25, 50, 100, 500], index=2)
+            pages = page_count(len(rows), page_size)
+            page_number = col2.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1)
+            st.caption(f"{len(rows):,} of {index.n_rows:,} rows match.")
+            st.dataframe(get_page(df, rows, page_number, page_size))
+            
+            # Download dataset. The export is written on the first click and
+            # reused for this dataset version.
+            compress = st.checkbox("Gzip-compress download")
+            file_name = "food_carbohydrate_dataset.csv" + (".gz" if compress else "")
+            
+            def read_export():
+                with open(get_export(df, digest, EXPORT_CACHE_DIR, compress), "rb") as f:
+                    return f.read()
             
-            # Download dataset
-            csv = st.session_state.df.to_csv(index=False)
             st.download_button(
                 label="Download Dataset as CSV",
-                data=csv,
-                file_name="food_carbohydrate_dataset.csv",
-                mime="text/csv"
+                data=read_export,
+                file_name=file_name,
+                mime="application/gzip" if compress else "text/csv"
             )
         
         # Glucose Predictor
@@ -106,41 +181,41 @@ def main():
             food_name = st.text_input("Food Name", placeholder="e.g., Injera, Pasta")
             
             if st.button("Predict"):
-                if food_name and st.session_state.model and st.session_state.vectorizer:
+                if food_name:
                     try:
-                        prediction = predict_glucose(food_name, st.session_state.model, st.session_state.vectorizer)
+                        prediction = predict_glucose(food_name, model, vectorizer)
                         recommendation, color = get_diabetic_recommendation(prediction)
                         st.success(f"Predicted glucose content for '{food_name}': **{prediction} g/100g**")
                         st.markdown(f"<p style='color:{color};'>{recommendation}</p>", unsafe_allow_html=True)
                     except Exception as e:
                         st.error(f"Error predicting: {e}")
                 else:
-                    st.error("Please enter a food name and ensure model is loaded.")
+                    st.error("Please enter a food name.")
         
         # Data Visualizations
         elif page == "Data Visualizations":
             st.header("Data Visualizations")
             st.write("Explore nutritional data distributions.")
             
+            # Figures are drawn from precomputed summaries, so neither the
+            # rendering time nor the payload sent to the browser grow with the dataset
+            summaries = load_summaries(DATASET_PATH, content_digest(DATASET_PATH))
+            
             # Glucose distribution by category
-            fig = px.histogram(
-                st.session_state.df,
-                x="Glucose_g_per_100g",
-                color="Category",
+            fig = histogram_figure(
+                summaries["Glucose_g_per_100g"]["histogram"],
+                "Glucose_g_per_100g",
                 title="Glucose Content Distribution by Food Category",
-                labels={"Glucose_g_per_100g": "Glucose (g/100g)"},
-                nbins=50
+                label="Glucose (g/100g)"
             )
             st.plotly_chart(fig, use_container_width=True)
             
             # Nutritional comparison
-            nutrient = st.selectbox("Select Nutrient to Visualize", ["Glucose_g_per_100g", "Carbohydrate_g_per_100g", "Glycemic_Index", "Calories_kcal_per_100g", "Protein_g_per_100g", "Fat_g_per_100g"])
-            fig2 = px.box(
-                st.session_state.df,
-                x="Category",
-                y=nutrient,
-                title=f"{nutrient.replace('_', ' ').title()} by Food Category",
-                labels={nutrient: nutrient.replace('_', ' ').title()}
+            nutrient = st.selectbox("Select Nutrient to Visualize", NUTRIENT_COLUMNS)
+            fig2 = box_figure(
+                summaries[nutrient]["box"],
+                nutrient,
+                title=f"{nutrient.replace('_', ' ').title()} by Food Category"
             )
             st.plotly_chart(fig2, use_container_width=True)
 
@@ -0,0 +1,161 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import hashlib
+import pickle
+import threading
+import time
+from src.data_generation import generate_food_dataset
+from src.model_training import train_model
+from src.utils import setup_logging
+
+# Set up logging
+logger = setup_logging()
+
+DATASET_PATH = "../food_carbohydrate_dataset.csv"
+MODEL_PATH = "../food_glucose_model.pkl"
+VECTORIZER_PATH = "../food_vectorizer.pkl"
+# CSV exports of the dataset, one per dataset version
+EXPORT_CACHE_DIR = "../.cache/exports"
+
+# (path, mtime_ns, size) -> sha256 of the file's contents
+_digests = {}
+_digests_lock = threading.Lock()
+_dataset_lock = threading.Lock()
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def content_digest(*paths):
+    """
+    Hash the contents of one or more files, for use as a cache key.
+    A file is only re-read when its mtime or size changes.
+    Args:
+        *paths (str): Files to hash.
+    Returns:
+        str: Combined sha256 of the files, or None if any of them is missing.
+    """
+    digests = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        with _digests_lock:
+            digest = _digests.get(key)
+        if digest is None:
+            digest = _sha256(path)
+            with _digests_lock:
+                _digests[key] = digest
+        digests.append(digest)
+    return hashlib.sha256("".join(digests).encode()).hexdigest()
+
+def _replace_atomic(path, write):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def ensure_dataset(path=DATASET_PATH):
+    """
+    Generate and save the food dataset if it doesn't exist yet. Concurrent
+    callers wait for a single generation instead of each writing the file.
+    Args:
+        path (str): CSV path of the dataset.
+    """
+    if os.path.exists(path):
+        return
+    with _dataset_lock:
+        if os.path.exists(path):
+            return
+        df = generate_food_dataset()
+        _replace_atomic(path, lambda tmp: df.to_csv(tmp, index=False))
+        logger.info("Generated and saved new dataset.")
+
+def save_model_artifacts(model, vectorizer, model_path=MODEL_PATH, vectorizer_path=VECTORIZER_PATH):
+    """
+    Pickle the model and vectorizer, replacing each file atomically so readers
+    never see a partial file. The model is written last, as content_digest
+    only reports the pair once both exist.
+    """
+    def dump(obj):
+        def write(tmp):
+            with open(tmp, "wb") as f:
+                pickle.dump(obj, f)
+        return write
+    _replace_atomic(vectorizer_path, dump(vectorizer))
+    _replace_atomic(model_path, dump(model))
+
+def train_and_save_model(df, model_path=MODEL_PATH, vectorizer_path=VECTORIZER_PATH):
+    model, vectorizer = train_model(df)
+    save_model_artifacts(model, vectorizer, model_path, vectorizer_path)
+    logger.info("Trained and saved new model and vectorizer.")
+
+class TrainingJob:
+    """
+    A background job of which at most one run is in progress at a time.
+    start() while a run is in progress does nothing, so concurrent callers
+    share that run and wait() for it rather than starting their own.
+    """
+    def __init__(self, target=train_and_save_model):
+        self._target = target
+        self._lock = threading.Lock()
+        self._thread = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def running(self):
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def start(self, *args, **kwargs):
+        """
+        Start a run unless one is already in progress.
+        Returns:
+            bool: True if this call started the run.
+        """
+        with self._lock:
+            if self.running:
+                return False
+            self.error = None
+            self.started_at, self.finished_at = time.time(), None
+            self._thread = threading.Thread(target=self._run, args=args, kwargs=kwargs,
+                                            name="food-model-training", daemon=True)
+            self._thread.start()
+            return True
+
+    def _run(self, *args, **kwargs):
+        try:
+            self._target(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Background training failed: {e}")
+            self.error = e
+        finally:
+            self.finished_at = time.time()
+
+    def wait(self, timeout=None):
+        """
+        Wait for the current run, re-raising its error if it failed.
+        Args:
+            timeout (float): Seconds to wait; None waits until the run ends.
+        Returns:
+            bool: True if no run is in progress anymore.
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                return False
+        if self.error is not None:
+            raise self.error
+        return True
@@ -2,146 +2,158 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import pandas as pd
 import numpy as np
 import random
 from src.utils import setup_logging
 
 logger = setup_logging()
 
+# Ethiopian foods dataset (63 foods, including 20 breads)
+ETHIOPIAN_FOODS = [
+    {"name": "Injera", "category": "Bread", "carb_range": (50, 60), "calorie_range": (200, 250), "protein_range": (4, 7), "fat_range": (1, 3), "gi_range": (50, 57)},
+    {"name": "Doro Wat", "category": "Stew", "carb_range": (5, 15), "calorie_range": (150, 200), "protein_range": (10, 15), "fat_range": (8, 12), "gi_range": (40, 50)},
+    {"name": "Tibs", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (180, 220), "protein_range": (20, 25), "fat_range": (10, 15), "gi_range": (0, 10)},
+    {"name": "Shiro", "category": "Stew", "carb_range": (20, 30), "calorie_range": (120, 160), "protein_range": (8, 12), "fat_range": (5, 8), "gi_range": (45, 55)},
+    {"name": "Kitfo", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (200, 250), "protein_range": (18, 22), "fat_range": (15, 20), "gi_range": (0, 10)},
+    {"name": "Misir Wat", "category": "Stew", "carb_range": (25, 35), "calorie_range": (100, 140), "protein_range": (6, 10), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Gomen", "category": "Vegetable", "carb_range": (5, 10), "calorie_range": (50, 80), "protein_range": (2, 4), "fat_range": (1, 3), "gi_range": (30, 40)},
+    {"name": "Ayib", "category": "Cheese", "carb_range": (0, 3), "calorie_range": (100, 130), "protein_range": (8, 12), "fat_range": (7, 10), "gi_range": (0, 10)},
+    {"name": "Teff Porridge", "category": "Porridge", "carb_range": (40, 50), "calorie_range": (150, 180), "protein_range": (5, 8), "fat_range": (2, 4), "gi_range": (50, 60)},
+    {"name": "Fitfit", "category": "Bread", "carb_range": (45, 55), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (55, 65)},
+    {"name": "Atakilt Wat", "category": "Vegetable", "carb_range": (15, 25), "calorie_range": (80, 120), "protein_range": (2, 5), "fat_range": (3, 6), "gi_range": (35, 45)},
+    {"name": "Segwat", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (170, 210), "protein_range": (18, 23), "fat_range": (9, 14), "gi_range": (0, 10)},
+    {"name": "Fossolia", "category": "Vegetable", "carb_range": (10, 20), "calorie_range": (70, 100), "protein_range": (2, 4), "fat_range": (2, 5), "gi_range": (30, 40)},
+    {"name": "Chechebsa", "category": "Bread", "carb_range": (40, 50), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (6, 9), "gi_range": (50, 60)},
+    {"name": "Awaze Tibs", "category": "Meat Dish", "carb_range": (2, 8), "calorie_range": (190, 230), "protein_range": (20, 25), "fat_range": (12, 17), "gi_range": (10, 20)},
+    {"name": "Dulet", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (220, 260), "protein_range": (15, 20), "fat_range": (15, 20), "gi_range": (0, 10)},
+    {"name": "Alicha Wat", "category": "Stew", "carb_range": (10, 20), "calorie_range": (90, 130), "protein_range": (3, 6), "fat_range": (3, 6), "gi_range": (40, 50)},
+    {"name": "Minchet Abish", "category": "Meat Dish", "carb_range": (5, 10), "calorie_range": (180, 220), "protein_range": (15, 20), "fat_range": (10, 15), "gi_range": (10, 20)},
+    {"name": "Kikil", "category": "Soup", "carb_range": (10, 20), "calorie_range": (80, 120), "protein_range": (5, 8), "fat_range": (2, 5), "gi_range": (30, 40)},
+    {"name": "Timatim Fitfit", "category": "Salad", "carb_range": (30, 40), "calorie_range": (120, 160), "protein_range": (3, 6), "fat_range": (2, 5), "gi_range": (45, 55)},
+    {"name": "Buticha", "category": "Side Dish", "carb_range": (15, 25), "calorie_range": (100, 140), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (40, 50)},
+    {"name": "Azifa", "category": "Salad", "carb_range": (20, 30), "calorie_range": (90, 130), "protein_range": (5, 8), "fat_range": (2, 5), "gi_range": (45, 55)},
+    {"name": "Genfo", "category": "Porridge", "carb_range": (35, 45), "calorie_range": (140, 180), "protein_range": (4, 7), "fat_range": (2, 4), "gi_range": (50, 60)},
+    {"name": "Fatira", "category": "Bread", "carb_range": (40, 50), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (6, 10), "gi_range": (55, 65)},
+    {"name": "Key Wat", "category": "Stew", "carb_range": (5, 15), "calorie_range": (160, 200), "protein_range": (12, 17), "fat_range": (9, 13), "gi_range": (40, 50)},
+    {"name": "Dinich Wat", "category": "Stew", "carb_range": (20, 30), "calorie_range": (90, 130), "protein_range": (2, 5), "fat_range": (3, 6), "gi_range": (40, 50)},
+    {"name": "Suf Fitfit", "category": "Side Dish", "carb_range": (30, 40), "calorie_range": (140, 180), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Yetsom Beyaynetu", "category": "Vegetable", "carb_range": (25, 35), "calorie_range": (120, 160), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (40, 50)},
+    {"name": "Shorba", "category": "Soup", "carb_range": (10, 20), "calorie_range": (70, 100), "protein_range": (3, 6), "fat_range": (1, 3), "gi_range": (30, 40)},
+    {"name": "Anbabero", "category": "Bread", "carb_range": (45, 55), "calorie_range": (190, 230), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 60)},
+    {"name": "Bula", "category": "Porridge", "carb_range": (35, 45), "calorie_range": (130, 170), "protein_range": (3, 6), "fat_range": (1, 3), "gi_range": (50, 60)},
+    {"name": "Gored Gored", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (210, 250), "protein_range": (18, 23), "fat_range": (14, 18), "gi_range": (0, 10)},
+    {"name": "Sils", "category": "Stew", "carb_range": (10, 20), "calorie_range": (100, 140), "protein_range": (3, 6), "fat_range": (3, 6), "gi_range": (40, 50)},
+    {"name": "Tegabino", "category": "Stew", "carb_range": (20, 30), "calorie_range": (130, 170), "protein_range": (8, 12), "fat_range": (5, 8), "gi_range": (45, 55)},
+    {"name": "Beyaynetu", "category": "Mixed Dish", "carb_range": (30, 40), "calorie_range": (150, 200), "protein_range": (8, 12), "fat_range": (5, 8), "gi_range": (40, 50)},
+    {"name": "Duba Wat", "category": "Vegetable", "carb_range": (15, 25), "calorie_range": (80, 120), "protein_range": (2, 5), "fat_range": (2, 5), "gi_range": (35, 45)},
+    {"name": "Enqulal Firfir", "category": "Egg Dish", "carb_range": (5, 10), "calorie_range": (120, 160), "protein_range": (6, 9), "fat_range": (7, 10), "gi_range": (20, 30)},
+    {"name": "Defo Dabo", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Tire Siga", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (200, 240), "protein_range": (18, 23), "fat_range": (13, 17), "gi_range": (0, 10)},
+    {"name": "Shiro Fitfit", "category": "Side Dish", "carb_range": (35, 45), "calorie_range": (150, 190), "protein_range": (6, 10), "fat_range": (4, 7), "gi_range": (50, 60)},
+    {"name": "Kolo", "category": "Snack", "carb_range": (30, 40), "calorie_range": (150, 190), "protein_range": (4, 7), "fat_range": (5, 8), "gi_range": (50, 60)},
+    {"name": "Timatim Salad", "category": "Salad", "carb_range": (5, 10), "calorie_range": (40, 70), "protein_range": (1, 3), "fat_range": (1, 3), "gi_range": (20, 30)},
+    {"name": "Awaze", "category": "Condiment", "carb_range": (5, 10), "calorie_range": (50, 80), "protein_range": (1, 3), "fat_range": (3, 6), "gi_range": (20, 30)},
+    {"name": "Mesir Alicha", "category": "Stew", "carb_range": (25, 35), "calorie_range": (100, 140), "protein_range": (6, 10), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Ambasha", "category": "Bread", "carb_range": (40, 50), "calorie_range": (190, 230), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Qanta", "category": "Meat Dish", "carb_range": (0, 3), "calorie_range": (150, 190), "protein_range": (15, 20), "fat_range": (8, 12), "gi_range": (0, 10)},
+    {"name": "Gomen Be Siga", "category": "Vegetable", "carb_range": (5, 15), "calorie_range": (100, 140), "protein_range": (5, 8), "fat_range": (5, 8), "gi_range": (30, 40)},
+    {"name": "Injera Firfir", "category": "Bread", "carb_range": (45, 55), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Telba", "category": "Porridge", "carb_range": (30, 40), "calorie_range": (120, 160), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (45, 55)},
+    {"name": "Mitmita", "category": "Condiment", "carb_range": (2, 5), "calorie_range": (20, 50), "protein_range": (1, 2), "fat_range": (1, 3), "gi_range": (10, 20)},
+    {"name": "Kita", "category": "Bread", "carb_range": (40, 50), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 60)},
+    {"name": "Dabo Kolo", "category": "Bread", "carb_range": (35, 45), "calorie_range": (160, 200), "protein_range": (4, 6), "fat_range": (4, 7), "gi_range": (50, 60)},
+    {"name": "Himbasha", "category": "Bread", "carb_range": (40, 50), "calorie_range": (190, 230), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Mulmul", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Teff Dabo", "category": "Bread", "carb_range": (45, 55), "calorie_range": (190, 230), "protein_range": (5, 8), "fat_range": (2, 5), "gi_range": (50, 57)},
+    {"name": "Barley Injera", "category": "Bread", "carb_range": (48, 58), "calorie_range": (190, 230), "protein_range": (4, 7), "fat_range": (1, 3), "gi_range": (55, 62)},
+    {"name": "Sorghum Injera", "category": "Bread", "carb_range": (50, 60), "calorie_range": (200, 240), "protein_range": (4, 7), "fat_range": (1, 3), "gi_range": (55, 65)},
+    {"name": "Chornake", "category": "Bread", "carb_range": (40, 50), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 60)},
+    {"name": "Difo Dabo", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Enjera Alicha", "category": "Bread", "carb_range": (45, 55), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 57)},
+    {"name": "Qurt", "category": "Bread", "carb_range": (40, 50), "calorie_range": (170, 210), "protein_range": (4, 6), "fat_range": (2, 5), "gi_range": (50, 60)},
+    {"name": "Shamita", "category": "Bread", "carb_range": (35, 45), "calorie_range": (160, 200), "protein_range": (4, 6), "fat_range": (3, 6), "gi_range": (50, 60)},
+    {"name": "Teff Kita", "category": "Bread", "carb_range": (40, 50), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 57)}
+]
+
+# European foods dataset (50 foods, including ~20 bakery foods)
+EUROPEAN_FOODS = [
+    {"name": "Pasta", "category": "Pasta", "carb_range": (65, 75), "calorie_range": (300, 350), "protein_range": (10, 14), "fat_range": (1, 3), "gi_range": (40, 50)},
+    {"name": "Croissant", "category": "Pastry", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (6, 9), "fat_range": (20, 25), "gi_range": (65, 75)},
+    {"name": "Baguette", "category": "Bread", "carb_range": (50, 60), "calorie_range": (250, 300), "protein_range": (8, 12), "fat_range": (1, 3), "gi_range": (70, 80)},
+    {"name": "Pizza", "category": "Main Dish", "carb_range": (30, 40), "calorie_range": (250, 300), "protein_range": (10, 15), "fat_range": (10, 15), "gi_range": (45, 55)},
+    {"name": "Roast Beef", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (200, 250), "protein_range": (25, 30), "fat_range": (10, 15), "gi_range": (0, 10)},
+    {"name": "Mashed Potatoes", "category": "Side Dish", "carb_range": (15, 25), "calorie_range": (100, 140), "protein_range": (2, 4), "fat_range": (3, 6), "gi_range": (80, 90)},
+    {"name": "Paella", "category": "Main Dish", "carb_range": (20, 30), "calorie_range": (200, 250), "protein_range": (12, 18), "fat_range": (8, 12), "gi_range": (50, 60)},
+    {"name": "Tiramisu", "category": "Dessert", "carb_range": (30, 40), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)},
+    {"name": "Schnitzel", "category": "Meat Dish", "carb_range": (10, 20), "calorie_range": (250, 300), "protein_range": (20, 25), "fat_range": (12, 18), "gi_range": (30, 40)},
+    {"name": "Risotto", "category": "Main Dish", "carb_range": (25, 35), "calorie_range": (200, 250), "protein_range": (8, 12), "fat_range": (6, 10), "gi_range": (60, 70)},
+    {"name": "Cheeseburger", "category": "Fast Food", "carb_range": (30, 40), "calorie_range": (300, 350), "protein_range": (15, 20), "fat_range": (12, 18), "gi_range": (50, 60)},
+    {"name": "burger", "category": "Fast Food", "carb_range": (30, 40), "calorie_range": (300, 350), "protein_range": (15, 20), "fat_range": (12, 18), "gi_range": (50, 60)},
+    {"name": "French Fries", "category": "Fast Food", "carb_range": (35, 45), "calorie_range": (250, 300), "protein_range": (3, 5), "fat_range": (10, 15), "gi_range": (75, 85)},
+    {"name": "Doner Kebab", "category": "Fast Food", "carb_range": (25, 35), "calorie_range": (350, 400), "protein_range": (15, 20), "fat_range": (15, 20), "gi_range": (45, 55)},
+    {"name": "Fish and Chips", "category": "Fast Food", "carb_range": (40, 50), "calorie_range": (400, 450), "protein_range": (12, 18), "fat_range": (20, 25), "gi_range": (60, 70)},
+    {"name": "Chicken Nuggets", "category": "Fast Food", "carb_range": (10, 20), "calorie_range": (250, 300), "protein_range": (10, 15), "fat_range": (15, 20), "gi_range": (40, 50)},
+    {"name": "Black Forest Cake", "category": "Cake", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (4, 7), "fat_range": (15, 20), "gi_range": (55, 65)},
+    {"name": "Sacher Torte", "category": "Cake", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)},
+    {"name": "Cheesecake", "category": "Cake", "carb_range": (30, 40), "calorie_range": (300, 350), "protein_range": (6, 9), "fat_range": (20, 25), "gi_range": (45, 55)},
+    {"name": "Carrot Cake", "category": "Cake", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (4, 7), "fat_range": (15, 20), "gi_range": (50, 60)},
+    {"name": "Red Velvet Cake", "category": "Cake", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (4, 7), "fat_range": (15, 20), "gi_range": (55, 65)},
+    {"name": "Gyros", "category": "Fast Food", "carb_range": (25, 35), "calorie_range": (300, 350), "protein_range": (12, 18), "fat_range": (12, 18), "gi_range": (45, 55)},
+    {"name": "Fried Chicken Sandwich", "category": "Fast Food", "carb_range": (30, 40), "calorie_range": (350, 400), "protein_range": (12, 18), "fat_range": (15, 20), "gi_range": (50, 60)},
+    {"name": "Falafel", "category": "Fast Food", "carb_range": (30, 40), "calorie_range": (250, 300), "protein_range": (6, 10), "fat_range": (10, 15), "gi_range": (50, 60)},
+    {"name": "Bratwurst", "category": "Fast Food", "carb_range": (5, 15), "calorie_range": (250, 300), "protein_range": (10, 15), "fat_range": (15, 20), "gi_range": (40, 50)},
+    {"name": "Currywurst", "category": "Fast Food", "carb_range": (10, 20), "calorie_range": (300, 350), "protein_range": (10, 15), "fat_range": (15, 20), "gi_range": (45, 55)},
+    {"name": "Apple Strudel", "category": "Cake", "carb_range": (40, 50), "calorie_range": (300, 350), "protein_range": (4, 7), "fat_range": (12, 18), "gi_range": (55, 65)},
+    {"name": "Baklava", "category": "Dessert", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (4, 7), "fat_range": (15, 20), "gi_range": (60, 70)},
+    {"name": "Stollen", "category": "Cake", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (55, 65)},
+    {"name": "Panettone", "category": "Cake", "carb_range": (45, 55), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (10, 15), "gi_range": (50, 60)},
+    {"name": "Bienenstich", "category": "Cake", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)},
+    {"name": "Ciabatta", "category": "Bread", "carb_range": (50, 60), "calorie_range": (250, 300), "protein_range": (8, 12), "fat_range": (1, 3), "gi_range": (70, 80)},
+    {"name": "Focaccia", "category": "Bread", "carb_range": (45, 55), "calorie_range": (250, 300), "protein_range": (7, 10), "fat_range": (5, 8), "gi_range": (65, 75)},
+    {"name": "Sourdough Bread", "category": "Bread", "carb_range": (50, 60), "calorie_range": (200, 250), "protein_range": (6, 9), "fat_range": (1, 3), "gi_range": (50, 60)},
+    {"name": "Rye Bread", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 250), "protein_range": (6, 9), "fat_range": (1, 3), "gi_range": (50, 60)},
+    {"name": "Brioche", "category": "Pastry", "carb_range": (40, 50), "calorie_range": (300, 350), "protein_range": (6, 9), "fat_range": (15, 20), "gi_range": (60, 70)},
+    {"name": "Pain au Chocolat", "category": "Pastry", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (6, 9), "fat_range": (20, 25), "gi_range": (65, 75)},
+    {"name": "Pumpernickel", "category": "Bread", "carb_range": (40, 50), "calorie_range": (180, 220), "protein_range": (5, 8), "fat_range": (1, 3), "gi_range": (45, 55)},
+    {"name": "Danish Pastry", "category": "Pastry", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (60, 70)},
+    {"name": "Borscht", "category": "Soup", "carb_range": (10, 20), "calorie_range": (80, 120), "protein_range": (3, 6), "fat_range": (2, 5), "gi_range": (40, 50)},
+    {"name": "Spaghetti Bolognese", "category": "Main Dish", "carb_range": (60, 70), "calorie_range": (350, 400), "protein_range": (15, 20), "fat_range": (10, 15), "gi_range": (45, 55)},
+    {"name": "Beef Wellington", "category": "Meat Dish", "carb_range": (20, 30), "calorie_range": (300, 350), "protein_range": (20, 25), "fat_range": (15, 20), "gi_range": (40, 50)},
+    {"name": "Coq au Vin", "category": "Main Dish", "carb_range": (10, 20), "calorie_range": (200, 250), "protein_range": (15, 20), "fat_range": (8, 12), "gi_range": (40, 50)},
+    {"name": "Moussaka", "category": "Main Dish", "carb_range": (20, 30), "calorie_range": (250, 300), "protein_range": (12, 18), "fat_range": (12, 18), "gi_range": (45, 55)},
+    {"name": "Pierogi", "category": "Main Dish", "carb_range": (40, 50), "calorie_range": (200, 250), "protein_range": (6, 10), "fat_range": (5, 8), "gi_range": (50, 60)},
+    {"name": "Churros", "category": "Dessert", "carb_range": (35, 45), "calorie_range": (250, 300), "protein_range": (3, 6), "fat_range": (10, 15), "gi_range": (60, 70)},
+    {"name": "Crème Brûlée", "category": "Dessert", "carb_range": (20, 30), "calorie_range": (250, 300), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)},
+    {"name": "Rösti", "category": "Side Dish", "carb_range": (20, 30), "calorie_range": (150, 200), "protein_range": (2, 4), "fat_range": (5, 8), "gi_range": (70, 80)},
+    {"name": "Sauerkraut", "category": "Side Dish", "carb_range": (5, 10), "calorie_range": (40, 60), "protein_range": (1, 3), "fat_range": (0, 2), "gi_range": (30, 40)},
+    {"name": "Kaiser Roll", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 250), "protein_range": (6, 9), "fat_range": (2, 5), "gi_range": (65, 75)},
+    {"name": "Baba au Rhum", "category": "Cake", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (4, 7), "fat_range": (10, 15), "gi_range": (55, 65)},
+    {"name": "Opera Cake", "category": "Cake", "carb_range": (35, 45), "calorie_range": (350, 400), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)}
+]
+
+FOOD_CATALOG = ETHIOPIAN_FOODS + EUROPEAN_FOODS
+
+def get_catalog_food_names():
+    """
+    Get the names of all catalog foods, lowercased as they appear in the generated dataset.
+    Returns:
+        list: Food names.
+    """
+    return [food["name"].lower() for food in FOOD_CATALOG]
+
+
 def generate_food_dataset(n_samples=50000):
     """
     Generate a synthetic dataset of Ethiopian and European foods with nutritional data, including glucose content, glycemic index, and glycemic load.
     Args:
         n_samples (int): Number of dataset entries.
     Returns:
-        pd.DataFrame: Dataset with food names, categories, and nutritional info.
+        pd.DataFrame: Dataset with food names, categories, and nutritional info, in food_dataset_dtypes.
     """
+    import pandas as pd  # Deferred: importing the catalog shouldn't pull in pandas
+
     try:
-        # Ethiopian foods dataset (63 foods, including 20 breads)
-        ethiopian_foods = [
-            {"name": "Injera", "category": "Bread", "carb_range": (50, 60), "calorie_range": (200, 250), "protein_range": (4, 7), "fat_range": (1, 3), "gi_range": (50, 57)},
-            {"name": "Doro Wat", "category": "Stew", "carb_range": (5, 15), "calorie_range": (150, 200), "protein_range": (10, 15), "fat_range": (8, 12), "gi_range": (40, 50)},
-            {"name": "Tibs", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (180, 220), "protein_range": (20, 25), "fat_range": (10, 15), "gi_range": (0, 10)},
-            {"name": "Shiro", "category": "Stew", "carb_range": (20, 30), "calorie_range": (120, 160), "protein_range": (8, 12), "fat_range": (5, 8), "gi_range": (45, 55)},
-            {"name": "Kitfo", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (200, 250), "protein_range": (18, 22), "fat_range": (15, 20), "gi_range": (0, 10)},
-            {"name": "Misir Wat", "category": "Stew", "carb_range": (25, 35), "calorie_range": (100, 140), "protein_range": (6, 10), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Gomen", "category": "Vegetable", "carb_range": (5, 10), "calorie_range": (50, 80), "protein_range": (2, 4), "fat_range": (1, 3), "gi_range": (30, 40)},
-            {"name": "Ayib", "category": "Cheese", "carb_range": (0, 3), "calorie_range": (100, 130), "protein_range": (8, 12), "fat_range": (7, 10), "gi_range": (0, 10)},
-            {"name": "Teff Porridge", "category": "Porridge", "carb_range": (40, 50), "calorie_range": (150, 180), "protein_range": (5, 8), "fat_range": (2, 4), "gi_range": (50, 60)},
-            {"name": "Fitfit", "category": "Bread", "carb_range": (45, 55), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (55, 65)},
-            {"name": "Atakilt Wat", "category": "Vegetable", "carb_range": (15, 25), "calorie_range": (80, 120), "protein_range": (2, 5), "fat_range": (3, 6), "gi_range": (35, 45)},
-            {"name": "Segwat", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (170, 210), "protein_range": (18, 23), "fat_range": (9, 14), "gi_range": (0, 10)},
-            {"name": "Fossolia", "category": "Vegetable", "carb_range": (10, 20), "calorie_range": (70, 100), "protein_range": (2, 4), "fat_range": (2, 5), "gi_range": (30, 40)},
-            {"name": "Chechebsa", "category": "Bread", "carb_range": (40, 50), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (6, 9), "gi_range": (50, 60)},
-            {"name": "Awaze Tibs", "category": "Meat Dish", "carb_range": (2, 8), "calorie_range": (190, 230), "protein_range": (20, 25), "fat_range": (12, 17), "gi_range": (10, 20)},
-            {"name": "Dulet", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (220, 260), "protein_range": (15, 20), "fat_range": (15, 20), "gi_range": (0, 10)},
-            {"name": "Alicha Wat", "category": "Stew", "carb_range": (10, 20), "calorie_range": (90, 130), "protein_range": (3, 6), "fat_range": (3, 6), "gi_range": (40, 50)},
-            {"name": "Minchet Abish", "category": "Meat Dish", "carb_range": (5, 10), "calorie_range": (180, 220), "protein_range": (15, 20), "fat_range": (10, 15), "gi_range": (10, 20)},
-            {"name": "Kikil", "category": "Soup", "carb_range": (10, 20), "calorie_range": (80, 120), "protein_range": (5, 8), "fat_range": (2, 5), "gi_range": (30, 40)},
-            {"name": "Timatim Fitfit", "category": "Salad", "carb_range": (30, 40), "calorie_range": (120, 160), "protein_range": (3, 6), "fat_range": (2, 5), "gi_range": (45, 55)},
-            {"name": "Buticha", "category": "Side Dish", "carb_range": (15, 25), "calorie_range": (100, 140), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (40, 50)},
-            {"name": "Azifa", "category": "Salad", "carb_range": (20, 30), "calorie_range": (90, 130), "protein_range": (5, 8), "fat_range": (2, 5), "gi_range": (45, 55)},
-            {"name": "Genfo", "category": "Porridge", "carb_range": (35, 45), "calorie_range": (140, 180), "protein_range": (4, 7), "fat_range": (2, 4), "gi_range": (50, 60)},
-            {"name": "Fatira", "category": "Bread", "carb_range": (40, 50), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (6, 10), "gi_range": (55, 65)},
-            {"name": "Key Wat", "category": "Stew", "carb_range": (5, 15), "calorie_range": (160, 200), "protein_range": (12, 17), "fat_range": (9, 13), "gi_range": (40, 50)},
-            {"name": "Dinich Wat", "category": "Stew", "carb_range": (20, 30), "calorie_range": (90, 130), "protein_range": (2, 5), "fat_range": (3, 6), "gi_range": (40, 50)},
-            {"name": "Suf Fitfit", "category": "Side Dish", "carb_range": (30, 40), "calorie_range": (140, 180), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Yetsom Beyaynetu", "category": "Vegetable", "carb_range": (25, 35), "calorie_range": (120, 160), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (40, 50)},
-            {"name": "Shorba", "category": "Soup", "carb_range": (10, 20), "calorie_range": (70, 100), "protein_range": (3, 6), "fat_range": (1, 3), "gi_range": (30, 40)},
-            {"name": "Anbabero", "category": "Bread", "carb_range": (45, 55), "calorie_range": (190, 230), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 60)},
-            {"name": "Bula", "category": "Porridge", "carb_range": (35, 45), "calorie_range": (130, 170), "protein_range": (3, 6), "fat_range": (1, 3), "gi_range": (50, 60)},
-            {"name": "Gored Gored", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (210, 250), "protein_range": (18, 23), "fat_range": (14, 18), "gi_range": (0, 10)},
-            {"name": "Sils", "category": "Stew", "carb_range": (10, 20), "calorie_range": (100, 140), "protein_range": (3, 6), "fat_range": (3, 6), "gi_range": (40, 50)},
-            {"name": "Tegabino", "category": "Stew", "carb_range": (20, 30), "calorie_range": (130, 170), "protein_range": (8, 12), "fat_range": (5, 8), "gi_range": (45, 55)},
-            {"name": "Beyaynetu", "category": "Mixed Dish", "carb_range": (30, 40), "calorie_range": (150, 200), "protein_range": (8, 12), "fat_range": (5, 8), "gi_range": (40, 50)},
-            {"name": "Duba Wat", "category": "Vegetable", "carb_range": (15, 25), "calorie_range": (80, 120), "protein_range": (2, 5), "fat_range": (2, 5), "gi_range": (35, 45)},
-            {"name": "Enqulal Firfir", "category": "Egg Dish", "carb_range": (5, 10), "calorie_range": (120, 160), "protein_range": (6, 9), "fat_range": (7, 10), "gi_range": (20, 30)},
-            {"name": "Defo Dabo", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Tire Siga", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (200, 240), "protein_range": (18, 23), "fat_range": (13, 17), "gi_range": (0, 10)},
-            {"name": "Shiro Fitfit", "category": "Side Dish", "carb_range": (35, 45), "calorie_range": (150, 190), "protein_range": (6, 10), "fat_range": (4, 7), "gi_range": (50, 60)},
-            {"name": "Kolo", "category": "Snack", "carb_range": (30, 40), "calorie_range": (150, 190), "protein_range": (4, 7), "fat_range": (5, 8), "gi_range": (50, 60)},
-            {"name": "Timatim Salad", "category": "Salad", "carb_range": (5, 10), "calorie_range": (40, 70), "protein_range": (1, 3), "fat_range": (1, 3), "gi_range": (20, 30)},
-            {"name": "Awaze", "category": "Condiment", "carb_range": (5, 10), "calorie_range": (50, 80), "protein_range": (1, 3), "fat_range": (3, 6), "gi_range": (20, 30)},
-            {"name": "Mesir Alicha", "category": "Stew", "carb_range": (25, 35), "calorie_range": (100, 140), "protein_range": (6, 10), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Ambasha", "category": "Bread", "carb_range": (40, 50), "calorie_range": (190, 230), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Qanta", "category": "Meat Dish", "carb_range": (0, 3), "calorie_range": (150, 190), "protein_range": (15, 20), "fat_range": (8, 12), "gi_range": (0, 10)},
-            {"name": "Gomen Be Siga", "category": "Vegetable", "carb_range": (5, 15), "calorie_range": (100, 140), "protein_range": (5, 8), "fat_range": (5, 8), "gi_range": (30, 40)},
-            {"name": "Injera Firfir", "category": "Bread", "carb_range": (45, 55), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Telba", "category": "Porridge", "carb_range": (30, 40), "calorie_range": (120, 160), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (45, 55)},
-            {"name": "Mitmita", "category": "Condiment", "carb_range": (2, 5), "calorie_range": (20, 50), "protein_range": (1, 2), "fat_range": (1, 3), "gi_range": (10, 20)},
-            {"name": "Kita", "category": "Bread", "carb_range": (40, 50), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 60)},
-            {"name": "Dabo Kolo", "category": "Bread", "carb_range": (35, 45), "calorie_range": (160, 200), "protein_range": (4, 6), "fat_range": (4, 7), "gi_range": (50, 60)},
-            {"name": "Himbasha", "category": "Bread", "carb_range": (40, 50), "calorie_range": (190, 230), "protein_range": (4, 7), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Mulmul", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Teff Dabo", "category": "Bread", "carb_range": (45, 55), "calorie_range": (190, 230), "protein_range": (5, 8), "fat_range": (2, 5), "gi_range": (50, 57)},
-            {"name": "Barley Injera", "category": "Bread", "carb_range": (48, 58), "calorie_range": (190, 230), "protein_range": (4, 7), "fat_range": (1, 3), "gi_range": (55, 62)},
-            {"name": "Sorghum Injera", "category": "Bread", "carb_range": (50, 60), "calorie_range": (200, 240), "protein_range": (4, 7), "fat_range": (1, 3), "gi_range": (55, 65)},
-            {"name": "Chornake", "category": "Bread", "carb_range": (40, 50), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 60)},
-            {"name": "Difo Dabo", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 240), "protein_range": (5, 8), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Enjera Alicha", "category": "Bread", "carb_range": (45, 55), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 57)},
-            {"name": "Qurt", "category": "Bread", "carb_range": (40, 50), "calorie_range": (170, 210), "protein_range": (4, 6), "fat_range": (2, 5), "gi_range": (50, 60)},
-            {"name": "Shamita", "category": "Bread", "carb_range": (35, 45), "calorie_range": (160, 200), "protein_range": (4, 6), "fat_range": (3, 6), "gi_range": (50, 60)},
-            {"name": "Teff Kita", "category": "Bread", "carb_range": (40, 50), "calorie_range": (180, 220), "protein_range": (4, 7), "fat_range": (2, 5), "gi_range": (50, 57)}
-        ]
-
-        # European foods dataset (50 foods, including ~20 bakery foods)
-        european_foods = [
-            {"name": "Pasta", "category": "Pasta", "carb_range": (65, 75), "calorie_range": (300, 350), "protein_range": (10, 14), "fat_range": (1, 3), "gi_range": (40, 50)},
-            {"name": "Croissant", "category": "Pastry", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (6, 9), "fat_range": (20, 25), "gi_range": (65, 75)},
-            {"name": "Baguette", "category": "Bread", "carb_range": (50, 60), "calorie_range": (250, 300), "protein_range": (8, 12), "fat_range": (1, 3), "gi_range": (70, 80)},
-            {"name": "Pizza", "category": "Main Dish", "carb_range": (30, 40), "calorie_range": (250, 300), "protein_range": (10, 15), "fat_range": (10, 15), "gi_range": (45, 55)},
-            {"name": "Roast Beef", "category": "Meat Dish", "carb_range": (0, 5), "calorie_range": (200, 250), "protein_range": (25, 30), "fat_range": (10, 15), "gi_range": (0, 10)},
-            {"name": "Mashed Potatoes", "category": "Side Dish", "carb_range": (15, 25), "calorie_range": (100, 140), "protein_range": (2, 4), "fat_range": (3, 6), "gi_range": (80, 90)},
-            {"name": "Paella", "category": "Main Dish", "carb_range": (20, 30), "calorie_range": (200, 250), "protein_range": (12, 18), "fat_range": (8, 12), "gi_range": (50, 60)},
-            {"name": "Tiramisu", "category": "Dessert", "carb_range": (30, 40), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)},
-            {"name": "Schnitzel", "category": "Meat Dish", "carb_range": (10, 20), "calorie_range": (250, 300), "protein_range": (20, 25), "fat_range": (12, 18), "gi_range": (30, 40)},
-            {"name": "Risotto", "category": "Main Dish", "carb_range": (25, 35), "calorie_range": (200, 250), "protein_range": (8, 12), "fat_range": (6, 10), "gi_range": (60, 70)},
-            {"name": "Cheeseburger", "category": "Fast Food", "carb_range": (30, 40), "calorie_range": (300, 350), "protein_range": (15, 20), "fat_range": (12, 18), "gi_range": (50, 60)},
-            {"name": "burger", "category": "Fast Food", "carb_range": (30, 40), "calorie_range": (300, 350), "protein_range": (15, 20), "fat_range": (12, 18), "gi_range": (50, 60)},
-            {"name": "French Fries", "category": "Fast Food", "carb_range": (35, 45), "calorie_range": (250, 300), "protein_range": (3, 5), "fat_range": (10, 15), "gi_range": (75, 85)},
-            {"name": "Doner Kebab", "category": "Fast Food", "carb_range": (25, 35), "calorie_range": (350, 400), "protein_range": (15, 20), "fat_range": (15, 20), "gi_range": (45, 55)},
-            {"name": "Fish and Chips", "category": "Fast Food", "carb_range": (40, 50), "calorie_range": (400, 450), "protein_range": (12, 18), "fat_range": (20, 25), "gi_range": (60, 70)},
-            {"name": "Chicken Nuggets", "category": "Fast Food", "carb_range": (10, 20), "calorie_range": (250, 300), "protein_range": (10, 15), "fat_range": (15, 20), "gi_range": (40, 50)},
-            {"name": "Black Forest Cake", "category": "Cake", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (4, 7), "fat_range": (15, 20), "gi_range": (55, 65)},
-            {"name": "Sacher Torte", "category": "Cake", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)},
-            {"name": "Cheesecake", "category": "Cake", "carb_range": (30, 40), "calorie_range": (300, 350), "protein_range": (6, 9), "fat_range": (20, 25), "gi_range": (45, 55)},
-            {"name": "Carrot Cake", "category": "Cake", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (4, 7), "fat_range": (15, 20), "gi_range": (50, 60)},
-            {"name": "Red Velvet Cake", "category": "Cake", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (4, 7), "fat_range": (15, 20), "gi_range": (55, 65)},
-            {"name": "Gyros", "category": "Fast Food", "carb_range": (25, 35), "calorie_range": (300, 350), "protein_range": (12, 18), "fat_range": (12, 18), "gi_range": (45, 55)},
-            {"name": "Fried Chicken Sandwich", "category": "Fast Food", "carb_range": (30, 40), "calorie_range": (350, 400), "protein_range": (12, 18), "fat_range": (15, 20), "gi_range": (50, 60)},
-            {"name": "Falafel", "category": "Fast Food", "carb_range": (30, 40), "calorie_range": (250, 300), "protein_range": (6, 10), "fat_range": (10, 15), "gi_range": (50, 60)},
-            {"name": "Bratwurst", "category": "Fast Food", "carb_range": (5, 15), "calorie_range": (250, 300), "protein_range": (10, 15), "fat_range": (15, 20), "gi_range": (40, 50)},
-            {"name": "Currywurst", "category": "Fast Food", "carb_range": (10, 20), "calorie_range": (300, 350), "protein_range": (10, 15), "fat_range": (15, 20), "gi_range": (45, 55)},
-            {"name": "Apple Strudel", "category": "Cake", "carb_range": (40, 50), "calorie_range": (300, 350), "protein_range": (4, 7), "fat_range": (12, 18), "gi_range": (55, 65)},
-            {"name": "Baklava", "category": "Dessert", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (4, 7), "fat_range": (15, 20), "gi_range": (60, 70)},
-            {"name": "Stollen", "category": "Cake", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (55, 65)},
-            {"name": "Panettone", "category": "Cake", "carb_range": (45, 55), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (10, 15), "gi_range": (50, 60)},
-            {"name": "Bienenstich", "category": "Cake", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)},
-            {"name": "Ciabatta", "category": "Bread", "carb_range": (50, 60), "calorie_range": (250, 300), "protein_range": (8, 12), "fat_range": (1, 3), "gi_range": (70, 80)},
-            {"name": "Focaccia", "category": "Bread", "carb_range": (45, 55), "calorie_range": (250, 300), "protein_range": (7, 10), "fat_range": (5, 8), "gi_range": (65, 75)},
-            {"name": "Sourdough Bread", "category": "Bread", "carb_range": (50, 60), "calorie_range": (200, 250), "protein_range": (6, 9), "fat_range": (1, 3), "gi_range": (50, 60)},
-            {"name": "Rye Bread", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 250), "protein_range": (6, 9), "fat_range": (1, 3), "gi_range": (50, 60)},
-            {"name": "Brioche", "category": "Pastry", "carb_range": (40, 50), "calorie_range": (300, 350), "protein_range": (6, 9), "fat_range": (15, 20), "gi_range": (60, 70)},
-            {"name": "Pain au Chocolat", "category": "Pastry", "carb_range": (40, 50), "calorie_range": (350, 400), "protein_range": (6, 9), "fat_range": (20, 25), "gi_range": (65, 75)},
-            {"name": "Pumpernickel", "category": "Bread", "carb_range": (40, 50), "calorie_range": (180, 220), "protein_range": (5, 8), "fat_range": (1, 3), "gi_range": (45, 55)},
-            {"name": "Danish Pastry", "category": "Pastry", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (60, 70)},
-            {"name": "Borscht", "category": "Soup", "carb_range": (10, 20), "calorie_range": (80, 120), "protein_range": (3, 6), "fat_range": (2, 5), "gi_range": (40, 50)},
-            {"name": "Spaghetti Bolognese", "category": "Main Dish", "carb_range": (60, 70), "calorie_range": (350, 400), "protein_range": (15, 20), "fat_range": (10, 15), "gi_range": (45, 55)},
-            {"name": "Beef Wellington", "category": "Meat Dish", "carb_range": (20, 30), "calorie_range": (300, 350), "protein_range": (20, 25), "fat_range": (15, 20), "gi_range": (40, 50)},
-            {"name": "Coq au Vin", "category": "Main Dish", "carb_range": (10, 20), "calorie_range": (200, 250), "protein_range": (15, 20), "fat_range": (8, 12), "gi_range": (40, 50)},
-            {"name": "Moussaka", "category": "Main Dish", "carb_range": (20, 30), "calorie_range": (250, 300), "protein_range": (12, 18), "fat_range": (12, 18), "gi_range": (45, 55)},
-            {"name": "Pierogi", "category": "Main Dish", "carb_range": (40, 50), "calorie_range": (200, 250), "protein_range": (6, 10), "fat_range": (5, 8), "gi_range": (50, 60)},
-            {"name": "Churros", "category": "Dessert", "carb_range": (35, 45), "calorie_range": (250, 300), "protein_range": (3, 6), "fat_range": (10, 15), "gi_range": (60, 70)},
-            {"name": "Crème Brûlée", "category": "Dessert", "carb_range": (20, 30), "calorie_range": (250, 300), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)},
-            {"name": "Rösti", "category": "Side Dish", "carb_range": (20, 30), "calorie_range": (150, 200), "protein_range": (2, 4), "fat_range": (5, 8), "gi_range": (70, 80)},
-            {"name": "Sauerkraut", "category": "Side Dish", "carb_range": (5, 10), "calorie_range": (40, 60), "protein_range": (1, 3), "fat_range": (0, 2), "gi_range": (30, 40)},
-            {"name": "Kaiser Roll", "category": "Bread", "carb_range": (45, 55), "calorie_range": (200, 250), "protein_range": (6, 9), "fat_range": (2, 5), "gi_range": (65, 75)},
-            {"name": "Baba au Rhum", "category": "Cake", "carb_range": (35, 45), "calorie_range": (300, 350), "protein_range": (4, 7), "fat_range": (10, 15), "gi_range": (55, 65)},
-            {"name": "Opera Cake", "category": "Cake", "carb_range": (35, 45), "calorie_range": (350, 400), "protein_range": (5, 8), "fat_range": (15, 20), "gi_range": (50, 60)}
-        ]
-
-        all_foods = ethiopian_foods + european_foods
+        all_foods = FOOD_CATALOG
         data = {
             "Food_Name": [],
             "Category": [],
@@ -174,7 +186,7 @@ def generate_food_dataset(n_samples=50000):
             data["Protein_g_per_100g"].append(round(random.uniform(food["protein_range"][0], food["protein_range"][1]), 2))
             data["Fat_g_per_100g"].append(round(random.uniform(food["fat_range"][0], food["fat_range"][1]), 2))
 
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(data).astype(food_dataset_dtypes())
         logger.info("Dataset generated successfully.")
         return df
 
@@ -182,6 +194,259 @@ def generate_food_dataset(n_samples=50000):
         logger.error(f"Error generating dataset: {e}")
         raise
 
+DATASET_COLUMNS = [
+    "Food_Name",
+    "Category",
+    "Carbohydrate_g_per_100g",
+    "Glucose_g_per_100g",
+    "Glycemic_Index",
+    "Glycemic_Load",
+    "Calories_kcal_per_100g",
+    "Protein_g_per_100g",
+    "Fat_g_per_100g"
+]
+# Nutrient columns, all rounded to NUTRIENT_DECIMALS
+NUTRIENT_COLUMNS = DATASET_COLUMNS[2:]
+NUTRIENT_DECIMALS = 2
+
+def food_dataset_dtypes():
+    """
+    Compact in-memory dtypes of the food dataset. Food names (~100) and categories
+    (~15) are categoricals over the catalog's values, so their codes are the same
+    in every dataset. Nutrients are float32: below 65,536 it is within 0.004 of
+    any 2-decimal value, so to_float64 recovers the exact value.
+    Returns:
+        dict: Column -> dtype.
+    """
+    import pandas as pd
+
+    names = sorted({food["name"].lower() for food in FOOD_CATALOG})
+    categories = sorted({food["category"] for food in FOOD_CATALOG})
+    dtypes = {"Food_Name": pd.CategoricalDtype(names), "Category": pd.CategoricalDtype(categories)}
+    dtypes.update({column: np.dtype(np.float32) for column in NUTRIENT_COLUMNS})
+    return dtypes
+
+def compact_food_dataset(df):
+    """
+    Convert a food dataset to food_dataset_dtypes. Name or category columns with
+    values outside the catalog become categoricals of their own values instead.
+    Args:
+        df (pd.DataFrame): Dataset, e.g. as read from CSV.
+    Returns:
+        pd.DataFrame: Converted copy.
+    """
+    import pandas as pd
+
+    dtypes = {}
+    for column, dtype in food_dataset_dtypes().items():
+        if column not in df.columns:
+            continue
+        if isinstance(dtype, pd.CategoricalDtype) and not set(df[column].dropna().unique()) <= set(dtype.categories):
+            dtype = "category"
+        dtypes[column] = dtype
+    return df.astype(dtypes)
+
+def load_food_dataset(path):
+    """
+    Read a food dataset CSV straight into food_dataset_dtypes.
+    Args:
+        path (str): CSV file.
+    Returns:
+        pd.DataFrame: Dataset with categorical names and categories and float32 nutrients.
+    """
+    import pandas as pd
+
+    read_dtypes = {"Food_Name": "category", "Category": "category"}
+    read_dtypes.update({column: np.float32 for column in NUTRIENT_COLUMNS})
+    return compact_food_dataset(pd.read_csv(path, dtype=read_dtypes))
+
+def to_float64(values, decimals=NUTRIENT_DECIMALS):
+    """
+    Nutrient values as a float64 array. float32 columns are rounded back to the
+    decimals they were generated with, giving the same values as a float64 load.
+    Args:
+        values (array-like): Column values.
+        decimals (int): Decimals the values were rounded to.
+    Returns:
+        np.ndarray: float64 values.
+    """
+    values = np.asarray(values)
+    if values.dtype == np.float32:
+        return np.round(values.astype(np.float64), decimals)
+    return values.astype(np.float64)
+
+def memory_report(df):
+    """
+    Memory used by each column of a dataset as given and in food_dataset_dtypes.
+    Args:
+        df (pd.DataFrame): Dataset.
+    Returns:
+        pd.DataFrame: One row per column plus "Total", with dtype, bytes,
+        compact_dtype, compact_bytes and saved_pct.
+    """
+    import pandas as pd
+
+    compact = compact_food_dataset(df)
+    report = pd.DataFrame({
+        "dtype": df.dtypes.astype(str),
+        "bytes": df.memory_usage(index=False, deep=True),
+        "compact_dtype": compact.dtypes.astype(str),
+        "compact_bytes": compact.memory_usage(index=False, deep=True)
+    })
+    report.loc["Total"] = ["", report["bytes"].sum(), "", report["compact_bytes"].sum()]
+    report["saved_pct"] = (100 * (1 - report["compact_bytes"] / report["bytes"])).round(1)
+    return report
+
+# Independent random streams, one per drawn column, so the generated rows don't
+# depend on how they are split into chunks
+_RANDOM_STREAMS = ("food", "carb", "gi", "calorie", "protein", "fat")
+
+def _catalog_arrays():
+    """Catalog columns as NumPy arrays indexed by food position."""
+    dtypes = food_dataset_dtypes()
+    names = [food["name"].lower() for food in FOOD_CATALOG]
+    categories = [food["category"] for food in FOOD_CATALOG]
+    arrays = {
+        "dtypes": dtypes,
+        "name_code": dtypes["Food_Name"].categories.get_indexer(names),
+        "category_code": dtypes["Category"].categories.get_indexer(categories),
+    }
+    for key in ("carb", "gi", "calorie", "protein", "fat"):
+        ranges = np.array([food[f"{key}_range"] for food in FOOD_CATALOG], dtype=np.float64)
+        arrays[f"{key}_low"], arrays[f"{key}_high"] = ranges[:, 0], ranges[:, 1]
+    return arrays
+
+def _food_dataset_chunk(streams, catalog, size):
+    import pandas as pd
+
+    n_foods = len(catalog["name_code"])
+    food = np.minimum((streams["food"].random(size) * n_foods).astype(np.intp), n_foods - 1)
+
+    def draw(key):
+        return np.round(streams[key].uniform(catalog[f"{key}_low"][food], catalog[f"{key}_high"][food]), 2)
+
+    carb_content = draw("carb")
+    gi = draw("gi")
+    dtypes = catalog["dtypes"]
+    return pd.DataFrame({
+        "Food_Name": pd.Categorical.from_codes(catalog["name_code"][food], dtype=dtypes["Food_Name"]),
+        "Category": pd.Categorical.from_codes(catalog["category_code"][food], dtype=dtypes["Category"]),
+        "Carbohydrate_g_per_100g": carb_content,
+        # Same formulas as generate_food_dataset
+        "Glucose_g_per_100g": np.round(carb_content * (gi / 100), 2),
+        "Glycemic_Index": gi,
+        "Glycemic_Load": np.round((carb_content * gi) / 100, 2),
+        "Calories_kcal_per_100g": draw("calorie"),
+        "Protein_g_per_100g": draw("protein"),
+        "Fat_g_per_100g": draw("fat")
+    }, columns=DATASET_COLUMNS).astype({column: np.float32 for column in NUTRIENT_COLUMNS})
+
+def iter_food_dataset_chunks(n_samples=50000, chunk_size=100000, seed=None):
+    """
+    Generate the food dataset with NumPy, yielding fixed-size DataFrame chunks.
+    Same columns and dtypes as generate_food_dataset; for a given seed the rows are the same
+    whatever the chunk size.
+    Args:
+        n_samples (int): Total number of dataset entries.
+        chunk_size (int): Rows per yielded chunk (the last one may be smaller).
+        seed (int or np.random.SeedSequence): Seed for reproducible output.
+    Yields:
+        pd.DataFrame: Consecutive chunks of the dataset.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    streams = {
+        name: np.random.Generator(np.random.PCG64(child))
+        for name, child in zip(_RANDOM_STREAMS, seed_sequence.spawn(len(_RANDOM_STREAMS)))
+    }
+    catalog = _catalog_arrays()
+    for start in range(0, n_samples, chunk_size):
+        yield _food_dataset_chunk(streams, catalog, min(chunk_size, n_samples - start))
+
+def generate_food_dataset_vectorized(n_samples=50000, seed=None):
+    """
+    Vectorized equivalent of generate_food_dataset.
+    Args:
+        n_samples (int): Number of dataset entries.
+        seed (int): Seed for reproducible output.
+    Returns:
+        pd.DataFrame: Dataset with food names, categories, and nutritional info.
+    """
+    import pandas as pd
+
+    chunks = list(iter_food_dataset_chunks(n_samples, chunk_size=max(n_samples, 1), seed=seed))
+    if not chunks:
+        return pd.DataFrame(columns=DATASET_COLUMNS).astype(food_dataset_dtypes())
+    return pd.concat(chunks, ignore_index=True)
+
+def write_food_dataset(path, n_samples, chunk_size=100000, seed=None, file_format=None):
+    """
+    Stream a generated dataset to CSV or Parquet in constant memory.
+    Args:
+        path (str): Output file.
+        n_samples (int): Number of dataset entries.
+        chunk_size (int): Rows generated and written at a time.
+        seed (int): Seed for reproducible output.
+        file_format (str): "csv" or "parquet"; inferred from the extension if omitted.
+    Returns:
+        int: Number of rows written.
+    """
+    file_format = file_format or ("parquet" if str(path).endswith(".parquet") else "csv")
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported format '{file_format}'. Use 'csv' or 'parquet'.")
+
+    rows = 0
+    writer = None
+    try:
+        logger.info(f"Writing {n_samples} generated rows to {path} ({file_format})...")
+        for chunk in iter_food_dataset_chunks(n_samples, chunk_size, seed):
+            if file_format == "csv":
+                chunk.to_csv(path, mode="w" if rows == 0 else "a", header=rows == 0, index=False)
+            else:
+                try:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                except ImportError:
+                    raise ImportError("Writing Parquet requires pyarrow (pip install pyarrow).")
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+            rows += len(chunk)
+        if rows == 0 and file_format == "csv":
+            import pandas as pd
+            pd.DataFrame(columns=DATASET_COLUMNS).to_csv(path, index=False)
+        logger.info(f"Wrote {rows} rows to {path}.")
+        return rows
+    except Exception as e:
+        logger.error(f"Error writing dataset to {path}: {e}")
+        raise
+    finally:
+        if writer is not None:
+            writer.close()
+
+def _write_food_shard(path, n_samples, seed_sequence, file_format):
+    return write_food_dataset(path, n_samples, seed=seed_sequence, file_format=file_format)
+
+def write_food_dataset_shards(output_dir, n_samples, n_shards=8, seed=None, workers=None, file_format="csv"):
+    """
+    Generate the dataset in parallel as a directory of shard files (see ml.sharded_generation).
+    Args:
+        output_dir (str): Directory for the part-NNNNN files and manifest.json.
+        n_samples (int): Total number of dataset entries.
+        n_shards (int): Number of shards; together with the seed it fixes the output.
+        seed (int): Seed for reproducible output.
+        workers (int): Worker processes (default: one per CPU); doesn't change the output.
+        file_format (str): "csv" or "parquet".
+    Returns:
+        dict: The dataset manifest.
+    """
+    from ml.sharded_generation import generate_shards
+
+    logger.info(f"Generating {n_samples} rows in {n_shards} shards to {output_dir}...")
+    return generate_shards(_write_food_shard, output_dir, n_samples, n_shards, seed, workers, file_format)
+
 if __name__ == "__main__":
     df = generate_food_dataset()
     df.to_csv("../food_carbohydrate_dataset.csv", index=False)
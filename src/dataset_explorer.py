@@ -0,0 +1,161 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import glob
+import gzip
+import math
+import threading
+import numpy as np
+import pandas as pd
+from src.data_generation import to_float64
+from src.utils import setup_logging
+
+# Set up logging
+logger = setup_logging()
+
+RANGE_COLUMNS = [
+    "Carbohydrate_g_per_100g",
+    "Glucose_g_per_100g",
+    "Glycemic_Index",
+    "Glycemic_Load",
+    "Calories_kcal_per_100g",
+    "Protein_g_per_100g",
+    "Fat_g_per_100g"
+]
+EXPORT_CHUNK_ROWS = 50000
+
+class DatasetIndex:
+    """
+    Filter index over one version of the food dataset, built once and shared.
+    Categories and food names are stored as integer codes, so filtering on them
+    is a table lookup per row; each nutrient column keeps its values sorted, so
+    a range filter is two binary searches. Queries return row positions in
+    dataset order.
+    """
+    def __init__(self, df, range_columns=RANGE_COLUMNS):
+        self.n_rows = len(df)
+        self._category_codes, categories = pd.factorize(df["Category"], sort=True)
+        self._name_codes, names = pd.factorize(df["Food_Name"], sort=True)
+        self.categories = [str(category) for category in categories]
+        self.food_names = [str(name) for name in names]
+        self._food_names_lower = [name.lower() for name in self.food_names]
+        self._sorted = {}
+        self.bounds = {}
+        for column in range_columns:
+            values = to_float64(df[column])
+            order = np.argsort(values, kind="stable")
+            self._sorted[column] = (order, values[order])
+            if self.n_rows:
+                self.bounds[column] = (float(values[order[0]]), float(values[order[-1]]))
+
+    def query(self, categories=None, name_contains=None, ranges=None):
+        """
+        Find the rows matching all given filters.
+        Args:
+            categories (list): Categories to keep; None or empty keeps all.
+            name_contains (str): Case-insensitive substring of the food name.
+            ranges (dict): Column -> (low, high) inclusive bounds.
+        Returns:
+            np.ndarray: Matching row positions, in dataset order.
+        """
+        mask = None
+        if categories:
+            allowed = np.zeros(len(self.categories), dtype=bool)
+            for category in categories:
+                if category in self.categories:
+                    allowed[self.categories.index(category)] = True
+            mask = allowed[self._category_codes]
+        if name_contains and name_contains.strip():
+            needle = name_contains.strip().lower()
+            allowed = np.array([needle in name for name in self._food_names_lower], dtype=bool)
+            name_mask = allowed[self._name_codes]
+            mask = name_mask if mask is None else mask & name_mask
+        for column, (low, high) in (ranges or {}).items():
+            order, values = self._sorted[column]
+            start, stop = np.searchsorted(values, low, side="left"), np.searchsorted(values, high, side="right")
+            if start == 0 and stop == self.n_rows:
+                continue
+            range_mask = np.zeros(self.n_rows, dtype=bool)
+            range_mask[order[start:stop]] = True
+            mask = range_mask if mask is None else mask & range_mask
+        if mask is None:
+            return np.arange(self.n_rows)
+        return np.flatnonzero(mask)
+
+def page_count(n_rows, page_size):
+    return max(math.ceil(n_rows / page_size), 1)
+
+def get_page(df, rows, page, page_size):
+    """
+    Get one page of the matching rows.
+    Args:
+        df (pd.DataFrame): Dataset.
+        rows (np.ndarray): Row positions from DatasetIndex.query.
+        page (int): 1-based page number.
+        page_size (int): Rows per page.
+    Returns:
+        pd.DataFrame: At most page_size rows.
+    """
+    start = (page - 1) * page_size
+    return df.iloc[rows[start:start + page_size]]
+
+def iter_csv_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Serialize a DataFrame to CSV a chunk of rows at a time.
+    Args:
+        df (pd.DataFrame): Data to export.
+        chunk_rows (int): Rows per chunk.
+    Yields:
+        str: CSV text; the first chunk starts with the header.
+    """
+    if len(df) == 0:
+        yield df.to_csv(index=False)
+        return
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=start == 0)
+
+def write_export(df, path, compress=False, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Stream a DataFrame to a CSV (optionally gzip-compressed) file. Only one chunk
+    is serialized in memory at a time, and the file appears atomically.
+    Args:
+        df (pd.DataFrame): Data to export.
+        path (str): Destination file.
+        compress (bool): Write gzip-compressed CSV.
+        chunk_rows (int): Rows serialized per chunk.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        opener = gzip.open if compress else open
+        with opener(tmp, "wt", encoding="utf-8", newline="") as f:
+            for chunk in iter_csv_chunks(df, chunk_rows):
+                f.write(chunk)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def get_export(df, version, cache_dir, compress=False):
+    """
+    Get the CSV export of a dataset version, writing it on first request.
+    Exports of other versions in cache_dir are removed when a new one is written.
+    Args:
+        df (pd.DataFrame): Dataset.
+        version (str): Dataset version, e.g. its content hash.
+        cache_dir (str): Directory holding the exports.
+        compress (bool): Gzip-compressed export.
+    Returns:
+        str: Path of the export file.
+    """
+    path = os.path.join(cache_dir, f"food_dataset-{version}.csv" + (".gz" if compress else ""))
+    if os.path.exists(path):
+        return path
+    os.makedirs(cache_dir, exist_ok=True)
+    write_export(df, path, compress)
+    # Only finished exports; another process may be writing a .tmp file
+    for pattern in ("food_dataset-*.csv", "food_dataset-*.csv.gz"):
+        for old in glob.glob(os.path.join(cache_dir, pattern)):
+            if not os.path.basename(old).startswith(f"food_dataset-{version}."):
+                os.remove(old)
+    logger.info(f"Exported dataset version {version[:12]} to {path}.")
+    return path
@@ -0,0 +1,135 @@
+#src/food_index.py
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+import numpy as np
+from src.data_generation import FOOD_CATALOG
+from src.typeahead import TypeaheadIndex
+from src.utils import normalize_food_name
+
+# Used for foods outside the catalog
+DEFAULT_GI = 50.0
+DEFAULT_CARBS = 30.0
+
+# Recommendation tiers, in the order of the codes returned by FoodIndex.score
+RECOMMENDED = "Recommended"
+CAUTION = "Caution"
+NOT_RECOMMENDED = "Not Recommended"
+TIERS = (RECOMMENDED, CAUTION, NOT_RECOMMENDED)
+
+# Foods recommended regardless of their estimated glycemic load
+ALWAYS_RECOMMENDED = frozenset({"injera"})
+
+def glycemic_load(gi, carbs):
+    return round((carbs * gi) / 100, 2)
+
+def _food_tier(name, load):
+    """Tier from the food alone; the predicted glucose content can still lower it (see FoodIndex.recommend)."""
+    if name in ALWAYS_RECOMMENDED or load < 10:
+        return RECOMMENDED
+    if load == 10:
+        return CAUTION
+    return NOT_RECOMMENDED
+
+class FoodInfo(NamedTuple):
+    name: str
+    category: str
+    glycemic_index: float
+    carbohydrate_g_per_100g: float
+    glycemic_load: float
+    tier: str
+
+class FoodIndex:
+    """
+    Immutable lookup table of per-food glycemic data, built once from the catalog.
+    GI and carbohydrates are the midpoints of each food's catalog ranges. Lookups
+    are case and whitespace insensitive; unknown foods get DEFAULT_GI/DEFAULT_CARBS.
+    """
+
+    def __init__(self, catalog):
+        entries = {}
+        for food in catalog:
+            key = normalize_food_name(food["name"])
+            gi = sum(food["gi_range"]) / 2
+            carbs = sum(food["carb_range"]) / 2
+            load = glycemic_load(gi, carbs)
+            entries[key] = FoodInfo(food["name"], food["category"], gi, carbs, load, _food_tier(key, load))
+        self._entries = MappingProxyType(entries)
+        self._ids = MappingProxyType({key: i for i, key in enumerate(entries)})
+
+        # Column arrays for score(); the extra last row holds the defaults for unknown foods
+        default_load = glycemic_load(DEFAULT_GI, DEFAULT_CARBS)
+        self._loads = np.array([info.glycemic_load for info in entries.values()] + [default_load])
+        self._tier_codes = np.array(
+            [TIERS.index(info.tier) for info in entries.values()] + [TIERS.index(_food_tier("", default_load))],
+            dtype=np.int8,
+        )
+        for array in (self._loads, self._tier_codes):
+            array.flags.writeable = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, food_name):
+        return normalize_food_name(food_name) in self._entries
+
+    def get(self, food_name):
+        """FoodInfo for a food name, or None if it isn't in the catalog."""
+        return self._entries.get(normalize_food_name(food_name))
+
+    def names(self):
+        """Normalized names of all catalog foods."""
+        return list(self._entries)
+
+    def recommend(self, glucose_content, food_name):
+        """Recommendation tier and glycemic load for one (food, predicted glucose) pair."""
+        name = normalize_food_name(food_name)
+        info = self._entries.get(name)
+        load = info.glycemic_load if info is not None else self._loads[-1]
+        tier = info.tier if info is not None else TIERS[self._tier_codes[-1]]
+        if tier == RECOMMENDED or glucose_content < 10:
+            tier = RECOMMENDED
+        elif glucose_content == 10:
+            tier = CAUTION
+        return tier, float(load)
+
+    def score(self, food_names, glucose_contents):
+        """
+        Vectorized recommend() over arrays of (food, predicted glucose) pairs.
+        Args:
+            food_names (iterable): Food names.
+            glucose_contents (array-like): Predicted glucose content (g/100g) per food.
+        Returns:
+            np.ndarray: Tier codes (indices into TIERS), dtype int8.
+            np.ndarray: Glycemic load per food.
+        """
+        unknown = len(self._entries)
+        ids = np.fromiter((self._ids.get(normalize_food_name(name), unknown) for name in food_names), dtype=np.intp)
+        glucose = np.asarray(glucose_contents, dtype=np.float64)
+        if glucose.shape != ids.shape:
+            raise ValueError("food_names and glucose_contents must have the same length")
+        codes = self._tier_codes[ids].copy()
+        codes[glucose < 10] = TIERS.index(RECOMMENDED)
+        codes[(glucose == 10) & (codes == TIERS.index(NOT_RECOMMENDED))] = TIERS.index(CAUTION)
+        return codes, self._loads[ids]
+
+@lru_cache(maxsize=None)
+def get_food_index():
+    """The process-wide FoodIndex of FOOD_CATALOG, built on first use."""
+    return FoodIndex(FOOD_CATALOG)
+
+def build_food_search_index(known_foods):
+    """
+    Build the typeahead index served by /search over the catalog foods.
+    Args:
+        known_foods (dict): Normalized food name -> predicted glucose content, as
+            returned by src.model_training.get_known_food_table.
+    Returns:
+        TypeaheadIndex: Catalog display names, each with its predicted glucose (None if not predicted).
+    """
+    foods = get_food_index()
+    names = [foods.get(key).name for key in foods.names()]
+    return TypeaheadIndex(names, [known_foods.get(key) for key in foods.names()])
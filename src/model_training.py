@@ -1,34 +1,272 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import pandas as pd
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import train_test_split, GridSearchCV
+import math
 import pickle
-from src.utils import setup_logging
+import threading
+import time
+import weakref
+from src.data_generation import get_catalog_food_names, to_float64
+from src.food_index import get_food_index
+from src.tfidf_encoder import make_query_encoder
+from src.utils import normalize_food_name, setup_logging
+from app.cache import make_cache
+from app.config import settings
+from app.flat_forest import FlatForest, flatten_forest, load_forest, load_vectorizer, MANIFEST_FILENAME
 
 logger = setup_logging()
 
-def train_model(df):
+# Per-model serving state: the precomputed known-food table and an LRU cache
+# of other predictions. Keyed weakly on the model, so reloading a changed
+# pickle (a new model object) builds a fresh table and starts a clean cache.
+_model_states = weakref.WeakKeyDictionary()
+
+# (model, vectorizer) loaded by load_model_artifacts, keyed on file paths.
+# Only the most recently loaded paths are kept, so switching model versions
+# doesn't accumulate old models; callers holding them keep them alive.
+_loaded_artifacts = {}
+
+# Hyperparameter grid searched by train_model
+PARAM_GRID = {
+    'n_estimators': [50, 100, 200],
+    'max_depth': [None, 10, 20],
+    'min_samples_split': [2, 5]
+}
+SEARCH_MODES = ("halving", "grid")
+VECTORIZER_PARAMS = {"max_features": 500, "lowercase": True, "stop_words": "english"}
+# Deduplicated training fits without bootstrap (resampling ~100 unique names
+# would drop whole foods from a tree), so its trees only differ in tie-breaking
+# and more of them don't change predictions
+DEDUP_N_ESTIMATORS = 10
+
+def _halving_search(X_train, y_train, param_grid, time_budget_seconds=None, factor=3, random_state=42):
+    """
+    Successive halving over param_grid on a fixed validation split.
+    Each round scores the surviving candidates on a larger share of the rows
+    and keeps the best 1/factor. Candidates that differ only in n_estimators
+    share one warm-started forest that is grown tree by tree, so scoring 50,
+    100 and 200 trees costs one 200-tree fit (the trees are identical to fresh fits).
+    Args:
+        X_train: Feature matrix, already vectorized (reused by every candidate).
+        y_train: Targets.
+        param_grid (dict): RandomForestRegressor parameters to search.
+        time_budget_seconds (float): Stop starting new fits once exceeded.
+    Returns:
+        dict: Best parameters found.
+    """
+    import numpy as np
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.model_selection import ParameterGrid, train_test_split
+
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X_train, np.asarray(y_train), test_size=0.2, random_state=random_state
+    )
+    candidates = list(ParameterGrid(param_grid))
+    n_rounds = max(math.ceil(math.log(len(candidates), factor)), 1)
+    deadline = time.perf_counter() + time_budget_seconds if time_budget_seconds else None
+    best_params = None
+
+    for round_index in range(n_rounds):
+        n_rows = max(X_fit.shape[0] // factor ** (n_rounds - 1 - round_index), 1)
+        groups = {}
+        for params in candidates:
+            shared = tuple(sorted((k, v) for k, v in params.items() if k != "n_estimators"))
+            groups.setdefault(shared, []).append(params.get("n_estimators", 100))
+
+        results = []
+        out_of_time = False
+        for shared, sizes in groups.items():
+            model = RandomForestRegressor(random_state=random_state, warm_start=True, n_jobs=-1, **dict(shared))
+            for n_estimators in sorted(sizes):
+                if deadline is not None and time.perf_counter() > deadline:
+                    out_of_time = True
+                    break
+                params = {**dict(shared), "n_estimators": n_estimators}
+                start = time.perf_counter()
+                model.set_params(n_estimators=n_estimators)
+                model.fit(X_fit[:n_rows], y_fit[:n_rows])
+                fit_time = time.perf_counter() - start
+                score = model.score(X_val, y_val)
+                logger.info(f"Round {round_index + 1}/{n_rounds}, {n_rows} rows: {params} "
+                            f"R^2 {score:.4f}, fit time {fit_time:.2f}s")
+                results.append((score, params))
+            if out_of_time:
+                break
+
+        if results:
+            results.sort(key=lambda result: result[0], reverse=True)
+            best_params = results[0][1]
+        if out_of_time:
+            logger.info(f"Time budget of {time_budget_seconds}s reached in round {round_index + 1}.")
+            break
+        candidates = [params for _, params in results[:math.ceil(len(results) / factor)]]
+
+    if best_params is None:
+        raise TimeoutError("Time budget exhausted before any candidate was fitted.")
+    return best_params
+
+def group_food_rows(df):
+    """
+    Collapse rows with the same normalized food name.
+    Args:
+        df (pd.DataFrame): Dataset with Food_Name and Glucose_g_per_100g columns.
+    Returns:
+        list: Unique normalized food names (sorted).
+        np.ndarray: Mean glucose content per name.
+        np.ndarray: Number of rows per name.
+    """
+    import pandas as pd
+
+    glucose = pd.Series(to_float64(df["Glucose_g_per_100g"]), index=df.index)
+    grouped = glucose.groupby(df["Food_Name"].map(normalize_food_name), sort=True, observed=True).agg(["mean", "count"])
+    return [str(name) for name in grouped.index], grouped["mean"].to_numpy(), grouped["count"].to_numpy()
+
+def vectorize_food_names(food_names):
+    """
+    Fit the TF-IDF vectorizer on a column of food names and transform it.
+    A categorical column (see src.data_generation.food_dataset_dtypes) is
+    vectorized once per distinct name; the result equals fit_transform on the rows.
+    Args:
+        food_names (pd.Series): Food name per row.
+    Returns:
+        scipy.sparse.csr_matrix: One TF-IDF row per input row.
+        TfidfVectorizer: Fitted vectorizer.
+    """
+    import numpy as np
+    import pandas as pd
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    if not isinstance(food_names.dtype, pd.CategoricalDtype) or food_names.isna().any():
+        vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS)
+        return vectorizer.fit_transform(food_names), vectorizer
+    codes = food_names.cat.codes.to_numpy()
+    counts = np.bincount(codes, minlength=len(food_names.cat.categories))
+    # Unused categories must not contribute to the vocabulary
+    observed = np.flatnonzero(counts)
+    names = [str(name) for name in food_names.cat.categories[observed]]
+    vectorizer = fit_weighted_vectorizer(names, counts[observed], **VECTORIZER_PARAMS)
+    remap = np.cumsum(counts > 0) - 1
+    return vectorizer.transform(names)[remap[codes]], vectorizer
+
+def fit_weighted_vectorizer(names, counts, **params):
+    """
+    Fit a TF-IDF vectorizer on unique names as if each appeared ``counts`` times.
+    Vocabulary and IDF weights equal those of fitting on the repeated rows.
+    Args:
+        names (list): Unique food names.
+        counts (array-like): Number of rows per name.
+        **params: TfidfVectorizer parameters.
+    Returns:
+        TfidfVectorizer: Fitted vectorizer.
+    """
+    import numpy as np
+    from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(**params)
+    count_params = CountVectorizer().get_params()
+    counter = CountVectorizer(**{
+        key: value for key, value in vectorizer.get_params().items()
+        if key in count_params and key not in ("max_features", "dtype")
+    })
+    term_counts = counter.fit_transform(names)
+    counts = np.asarray(counts, dtype=np.int64)
+    term_freq = term_counts.T @ counts
+    doc_freq = (term_counts > 0).astype(np.int64).T @ counts
+    terms = counter.get_feature_names_out()
+    if vectorizer.max_features is not None and len(terms) > vectorizer.max_features:
+        keep = np.sort(np.argsort(-term_freq, kind="stable")[:vectorizer.max_features])
+        terms, doc_freq = terms[keep], doc_freq[keep]
+
+    n_documents = counts.sum()
+    if vectorizer.smooth_idf:
+        idf = np.log((1 + n_documents) / (1 + doc_freq)) + 1
+    else:
+        idf = np.log(n_documents / doc_freq) + 1
+    vectorizer.vocabulary_ = {term: index for index, term in enumerate(terms)}
+    vectorizer.fixed_vocabulary_ = False
+    vectorizer.idf_ = idf
+    return vectorizer
+
+def _train_deduplicated(df, time_budget_seconds=None):
+    """
+    Fit on one row per normalized food name, weighted by its row count, against
+    the per-name mean target. For squared error the weighted group loss differs
+    from the row-level loss by a constant, so candidates rank the same while
+    fit time and model size scale with the number of names, not rows.
+    n_estimators is fixed to DEDUP_N_ESTIMATORS; the rest of PARAM_GRID is searched.
+    """
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.model_selection import ParameterGrid, train_test_split
+
+    names, _, counts = group_food_rows(df)
+    vectorizer = fit_weighted_vectorizer(names, counts, **VECTORIZER_PARAMS)
+    logger.info(f"Deduplicated {len(df)} rows into {len(names)} unique food names.")
+
+    # Same row split as the full path, then a validation split of the training rows
+    train_df, test_df = train_test_split(df, test_size=0.2, random_state=42)
+    fit_df, val_df = train_test_split(train_df, test_size=0.2, random_state=42)
+    fit_names, fit_y, fit_weight = group_food_rows(fit_df)
+    val_names, val_y, val_weight = group_food_rows(val_df)
+    X_fit, X_val = vectorizer.transform(fit_names), vectorizer.transform(val_names)
+
+    # Fits on ~100 rows are cheap enough to try the whole grid
+    deadline = time.perf_counter() + time_budget_seconds if time_budget_seconds else None
+    results = []
+    param_grid = {**PARAM_GRID, "n_estimators": [DEDUP_N_ESTIMATORS]}
+    for params in ParameterGrid(param_grid):
+        if deadline is not None and time.perf_counter() > deadline:
+            logger.info(f"Time budget of {time_budget_seconds}s reached after {len(results)} candidates.")
+            break
+        start = time.perf_counter()
+        model = RandomForestRegressor(random_state=42, bootstrap=False, **params).fit(X_fit, fit_y, sample_weight=fit_weight)
+        fit_time = time.perf_counter() - start
+        score = model.score(X_val, val_y, sample_weight=val_weight)
+        logger.info(f"Deduplicated candidate {params}: weighted R^2 {score:.4f}, fit time {fit_time:.3f}s")
+        results.append((score, params))
+    if not results:
+        raise TimeoutError("Time budget exhausted before any candidate was fitted.")
+
+    best_params = max(results, key=lambda result: result[0])[1]
+    train_names, train_y, train_weight = group_food_rows(train_df)
+    best_model = RandomForestRegressor(random_state=42, bootstrap=False, **best_params)
+    best_model.fit(vectorizer.transform(train_names), train_y, sample_weight=train_weight)
+
+    score = best_model.score(vectorizer.transform(test_df["Food_Name"]), to_float64(test_df["Glucose_g_per_100g"]))
+    logger.info(f"Best model R^2 score: {score:.2f}")
+    logger.info(f"Best parameters: {best_params}")
+    return best_model, vectorizer
+
+def train_model(df, search="halving", time_budget_seconds=None, deduplicate=False):
     """
     Train a Random Forest Regressor to predict glucose content.
     Args:
         df (pd.DataFrame): Dataset with food names and nutritional data.
+        search (str): "halving" (successive halving with warm-started forests) or
+            "grid" (exhaustive GridSearchCV with 3-fold CV).
+        time_budget_seconds (float): Optional time limit for the search.
+        deduplicate (bool): Fit on one weighted row per unique food name instead of
+            every row (the whole grid is searched; ``search`` is ignored).
     Returns:
         model: Trained model.
         vectorizer: Fitted TF-IDF vectorizer.
     """
+    # Deferred so that serving (which only unpickles a fitted model) doesn't pay for them
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.model_selection import train_test_split, GridSearchCV
+
+    if search not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode '{search}'. Expected one of {SEARCH_MODES}.")
     try:
         logger.info("Starting model training...")
         if df.empty or "Food_Name" not in df.columns or "Glucose_g_per_100g" not in df.columns:
             raise ValueError("Invalid dataset: missing required columns or empty.")
 
-        # Feature extraction
-        vectorizer = TfidfVectorizer(max_features=500, lowercase=True, stop_words="english")
-        X = vectorizer.fit_transform(df["Food_Name"])
-        y = df["Glucose_g_per_100g"]
+        if deduplicate:
+            return _train_deduplicated(df, time_budget_seconds)
+
+        # Feature extraction. Compact (float32) targets are restored to their exact 2-decimal values.
+        X, vectorizer = vectorize_food_names(df["Food_Name"])
+        y = to_float64(df["Glucose_g_per_100g"])
         
         logger.info(f"Feature matrix shape: {X.shape}")
         if X.shape[0] == 0 or X.shape[1] == 0:
@@ -38,20 +276,21 @@ def train_model(df):
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
         # Hyperparameter tuning
-        param_grid = {
-            'n_estimators': [50, 100, 200],
-            'max_depth': [None, 10, 20],
-            'min_samples_split': [2, 5]
-        }
-        model = RandomForestRegressor(random_state=42)
-        grid_search = GridSearchCV(model, param_grid, cv=3, scoring='r2', n_jobs=-1)
-        grid_search.fit(X_train, y_train)
+        start = time.perf_counter()
+        if search == "grid":
+            model = RandomForestRegressor(random_state=42)
+            grid_search = GridSearchCV(model, PARAM_GRID, cv=3, scoring='r2', n_jobs=-1)
+            grid_search.fit(X_train, y_train)
+            best_model, best_params = grid_search.best_estimator_, grid_search.best_params_
+        else:
+            best_params = _halving_search(X_train, y_train, PARAM_GRID, time_budget_seconds)
+            best_model = RandomForestRegressor(random_state=42, **best_params).fit(X_train, y_train)
+        logger.info(f"{search} search finished in {time.perf_counter() - start:.1f}s")
         
         # Best model
-        best_model = grid_search.best_estimator_
         score = best_model.score(X_test, y_test)
         logger.info(f"Best model R^2 score: {score:.2f}")
-        logger.info(f"Best parameters: {grid_search.best_params_}")
+        logger.info(f"Best parameters: {best_params}")
         
         return best_model, vectorizer
     
@@ -59,6 +298,119 @@ def train_model(df):
         logger.error(f"Error training model: {e}")
         raise
 
+def build_known_food_table(model, vectorizer, food_names=None):
+    """
+    Precompute glucose predictions for known food names.
+    Args:
+        model: Trained model.
+        vectorizer: Fitted TF-IDF vectorizer.
+        food_names (list): Names to precompute. Defaults to the training catalog.
+    Returns:
+        dict: Normalized food name -> predicted glucose content (g/100g).
+    """
+    if food_names is None:
+        food_names = get_catalog_food_names()
+    names = sorted({normalize_food_name(name) for name in food_names})
+    predictions = model.predict(vectorizer.transform(names))
+    logger.info(f"Precomputed glucose predictions for {len(names)} known foods.")
+    return {name: round(float(prediction), 2) for name, prediction in zip(names, predictions)}
+
+def _get_model_state(model, vectorizer):
+    state = _model_states.get(model)
+    if state is None or state["vectorizer"]() is not vectorizer:
+        state = {
+            "vectorizer": weakref.ref(vectorizer),
+            "known_foods": build_known_food_table(model, vectorizer),
+            "cache": make_cache(settings.prediction_cache_size, settings.prediction_cache_ttl_seconds),
+            # Encodes single names without sklearn's analyzer; None if the vectorizer's settings aren't supported
+            "encoder": make_query_encoder(vectorizer),
+            # Per-thread (1, n_features) row reused by encode_dense
+            "rows": threading.local(),
+        }
+        _model_states[model] = state
+    return state
+
+def get_known_food_table(model, vectorizer):
+    """
+    Get the known-food table for a model/vectorizer pair, building it on first use.
+    Args:
+        model: Trained model.
+        vectorizer: Fitted TF-IDF vectorizer.
+    Returns:
+        dict: Normalized food name -> predicted glucose content (g/100g).
+    """
+    return _get_model_state(model, vectorizer)["known_foods"]
+
+def get_prediction_cache(model, vectorizer):
+    """
+    Get the LRU cache of predictions for names outside the known-food table.
+    Args:
+        model: Trained model.
+        vectorizer: Fitted TF-IDF vectorizer.
+    Returns:
+        LRUCache: Cache keyed on normalized food names (see app.cache).
+    """
+    return _get_model_state(model, vectorizer)["cache"]
+
+def _file_fingerprint(path):
+    if os.path.isdir(path):
+        # Flat exports write their manifest last
+        path = os.path.join(path, MANIFEST_FILENAME)
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+INFERENCE_BACKENDS = ("sklearn", "flat")
+
+def as_inference_backend(model, backend=None):
+    """
+    Return the model to serve predictions with for the given backend.
+    Args:
+        model: Trained sklearn forest or FlatForest.
+        backend (str): "sklearn" or "flat"; defaults to settings.food_inference_backend.
+    Returns:
+        The model itself, or a FlatForest with the same predictions for "flat".
+    """
+    backend = backend or settings.food_inference_backend
+    if backend not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unknown inference backend '{backend}'. Expected one of {INFERENCE_BACKENDS}.")
+    if backend == "flat" and not isinstance(model, FlatForest):
+        return flatten_forest(model)
+    return model
+
+def load_model_artifacts(model_path, vectorizer_path):
+    """
+    Load the model and vectorizer, reloading them only when either file changes.
+    A directory path is loaded as a memory-mapped flat export (see app.flat_forest);
+    a pickled model is served through settings.food_inference_backend.
+    Args:
+        model_path (str): Path to the pickled model or flat export directory.
+        vectorizer_path (str): Path to the pickled TF-IDF vectorizer or flat export directory.
+    Returns:
+        tuple: (model, vectorizer)
+    """
+    key = (model_path, vectorizer_path)
+    fingerprint = (_file_fingerprint(model_path), _file_fingerprint(vectorizer_path))
+    cached = _loaded_artifacts.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1], cached[2]
+
+    if os.path.isdir(model_path):
+        model = load_forest(model_path)
+    else:
+        with open(model_path, "rb") as f:
+            model = as_inference_backend(pickle.load(f))
+    if os.path.isdir(vectorizer_path):
+        vectorizer = load_vectorizer(vectorizer_path)
+    else:
+        with open(vectorizer_path, "rb") as f:
+            vectorizer = pickle.load(f)
+    # Build the known-food table now rather than on the first request
+    get_known_food_table(model, vectorizer)
+    _loaded_artifacts.clear()
+    _loaded_artifacts[key] = (fingerprint, model, vectorizer)
+    logger.info(f"Loaded model and vectorizer from {model_path} and {vectorizer_path}.")
+    return model, vectorizer
+
 def predict_glucose(food_name, model, vectorizer):
     """
     Predict glucose content for a given food name.
@@ -73,26 +425,81 @@ def predict_glucose(food_name, model, vectorizer):
         if not isinstance(food_name, str) or not food_name.strip():
             raise ValueError("Food name must be a non-empty string.")
         
+        # Catalog foods are served from the precomputed table, repeats of other names from the cache
+        state = _get_model_state(model, vectorizer)
+        key = normalize_food_name(food_name)
+        known = state["known_foods"].get(key)
+        if known is None:
+            known = state["cache"].get(key)
+        if known is not None:
+            return known
+        
         # Transform food name to vector
-        food_vector = vectorizer.transform([food_name.lower()])
-        logger.info(f"Food vector shape for '{food_name}': {food_vector.shape}")
+        encoder = state["encoder"]
+        if encoder is not None:
+            rows = state["rows"]
+            food_vector = rows.row = encoder.encode_dense(food_name, getattr(rows, "row", None))
+        else:
+            food_vector = vectorizer.transform([food_name.lower()])
+        logger.info("Food vector shape for '%s': %s", food_name, food_vector.shape, extra={"log_type": "prediction"})
         
         if food_vector.shape[1] == 0:
             raise ValueError(f"Vectorization produced an empty feature vector for '{food_name}'.")
         
         # Predict
         prediction = model.predict(food_vector)
-        logger.info(f"Raw prediction for '{food_name}': {prediction}")
+        logger.info("Raw prediction for '%s': %s", food_name, prediction, extra={"log_type": "prediction"})
         
         if len(prediction) == 0:
             raise ValueError(f"Model prediction returned an empty array for '{food_name}'.")
         
-        return round(float(prediction[0]), 2)
+        glucose_content = round(float(prediction[0]), 2)
+        state["cache"].put(key, glucose_content)
+        return glucose_content
     
     except Exception as e:
         logger.error(f"Error predicting for '{food_name}': {e}")
         raise
 
+# Artifact paths of an inference worker process (see app.executor.InferenceExecutor)
+_worker_paths = None
+
+def init_prediction_worker(model_path, vectorizer_path):
+    """
+    Load the model and vectorizer once per inference worker process.
+    Args:
+        model_path (str): Path to the pickled model.
+        vectorizer_path (str): Path to the pickled TF-IDF vectorizer.
+    """
+    global _worker_paths
+    _worker_paths = (model_path, vectorizer_path)
+    load_model_artifacts(model_path, vectorizer_path)
+
+def predict_glucose_in_worker(food_name, model_path=None, vectorizer_path=None):
+    """
+    Predict glucose content in an inference worker process.
+    Args:
+        food_name (str): Name of the food.
+        model_path (str): Model version to use. Defaults to the one loaded by init_prediction_worker.
+        vectorizer_path (str): Vectorizer to use. Defaults to the one loaded by init_prediction_worker.
+    Returns:
+        float: Predicted glucose content (g/100g).
+    """
+    model, vectorizer = load_model_artifacts(model_path or _worker_paths[0], vectorizer_path or _worker_paths[1])
+    return predict_glucose(food_name, model, vectorizer)
+
+def get_known_food_table_in_worker(model_path=None, vectorizer_path=None):
+    """
+    Get the known-food table of a model version in an inference worker process.
+    Args:
+        model_path (str): Model version to use. Defaults to the one loaded by init_prediction_worker.
+        vectorizer_path (str): Vectorizer to use. Defaults to the one loaded by init_prediction_worker.
+    Returns:
+        dict: Normalized food name -> predicted glucose content (g/100g).
+    """
+    model, vectorizer = load_model_artifacts(model_path or _worker_paths[0], vectorizer_path or _worker_paths[1])
+    return get_known_food_table(model, vectorizer)
+
 def get_diabetic_recommendation(glucose_content, food_name):
     """
     Determine if a food is recommended for diabetic patients based on glucose content and glycemic load.
@@ -103,72 +510,23 @@ def get_diabetic_recommendation(glucose_content, food_name):
         dict: Recommendation details with glycemic load.
     """
     try:
-        # Estimate glycemic load based on typical values
-        food_gi_ranges = {
-            "Injera": (50, 57),  # Teff injera, low GI
-            "Doro Wat": (40, 50),
-            "Tibs": (0, 10),
-            "Shiro": (45, 55),
-            "Kitfo": (0, 10),
-            "Misir Wat": (50, 60),
-            "Gomen": (30, 40),
-            "Ayib": (0, 10),
-            "Teff Porridge": (50, 60),
-            "Fitfit": (55, 65),
-            "Pasta": (40, 50),
-            "Croissant": (65, 75),
-            "Baguette": (70, 80),
-            "Pizza": (45, 55),
-            "Roast Beef": (0, 10),
-            "Mashed Potatoes": (80, 90),
-            "Paella": (50, 60),
-            "Tiramisu": (50, 60),
-            "Schnitzel": (30, 40),
-            "Risotto": (60, 70)
-        }
-        
-        food_carb_ranges = {
-            "Injera": (50, 60),
-            "Doro Wat": (5, 15),
-            "Tibs": (0, 5),
-            "Shiro": (20, 30),
-            "Kitfo": (0, 5),
-            "Misir Wat": (25, 35),
-            "Gomen": (5, 10),
-            "Ayib": (0, 3),
-            "Teff Porridge": (40, 50),
-            "Fitfit": (45, 55),
-            "Pasta": (65, 75),
-            "Croissant": (40, 50),
-            "Baguette": (50, 60),
-            "Pizza": (30, 40),
-            "Roast Beef": (0, 5),
-            "Mashed Potatoes": (15, 25),
-            "Paella": (20, 30),
-            "Tiramisu": (30, 40),
-            "Schnitzel": (10, 20),
-            "Risotto": (25, 35)
-        }
-        
-        # Use average GI and carbs for GL estimation
-        gi = sum(food_gi_ranges.get(food_name, (50, 50))) / 2
-        carbs = sum(food_carb_ranges.get(food_name, (30, 30))) / 2
-        glycemic_load = round((carbs * gi) / 100, 2)
+        # GI, carbs, glycemic load and the food's own tier are precomputed per catalog food
+        tier, glycemic_load = get_food_index().recommend(glucose_content, food_name)
         
         # Recommendation logic
-        if food_name.lower() == "injera":
+        if normalize_food_name(food_name) == "injera":
             return {
                 "recommendation": "Recommended",
                 "details": "Teff injera has a low glycemic index (~50–57) and moderate glycemic load, suitable for diabetic patients in controlled portions.",
                 "glycemic_load": glycemic_load
             }
-        elif glycemic_load < 10 or glucose_content < 10:
+        elif tier == "Recommended":
             return {
                 "recommendation": "Recommended",
                 "details": f"Low glycemic load or glucose content ({glucose_content:.2f} g/100g), safe for diabetic patients.",
                 "glycemic_load": glycemic_load
             }
-        elif (10 <= glycemic_load <= 10) or (10 <= glucose_content <= 10):
+        elif tier == "Caution":
             return {
                 "recommendation": "Caution",
                 "details": f"Moderate glycemic load or glucose content ({glucose_content:.2f} g/100g), consume in moderation for diabetic patients.",
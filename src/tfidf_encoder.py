@@ -0,0 +1,151 @@
+# src/tfidf_encoder.py
+import math
+import re
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+
+class TfidfQueryEncoder:
+    """
+    Precompiled replacement for ``TfidfVectorizer.transform`` on short queries
+    such as food names.
+
+    Built from a fitted vectorizer's vocabulary, IDF weights and text settings,
+    it tokenizes with the same regex and stop words, then produces the
+    normalized row directly as (indices, values) arrays, skipping sklearn's
+    analyzer chain, input validation and CSR matrix construction. Results are
+    bit-identical to ``transform`` for the supported settings (word analyzer,
+    no custom preprocessor/tokenizer, no accent stripping);
+    ``from_vectorizer`` raises ValueError for anything else.
+    """
+
+    def __init__(self, vocabulary: dict, idf: Optional[np.ndarray], token_pattern: str = r"(?u)\b\w\w+\b",
+                 lowercase: bool = True, stop_words: Optional[Iterable[str]] = None,
+                 ngram_range: Tuple[int, int] = (1, 1), norm: Optional[str] = "l2",
+                 sublinear_tf: bool = False, binary: bool = False):
+        if norm not in ("l1", "l2", None):
+            raise ValueError(f"Unsupported norm '{norm}'")
+        self.vocabulary = vocabulary
+        self.n_features = len(vocabulary)
+        self.idf = None if idf is None else np.asarray(idf, dtype=np.float64)
+        self._token_re = re.compile(token_pattern)
+        self.lowercase = lowercase
+        self.stop_words = frozenset(stop_words) if stop_words else None
+        self.ngram_range = tuple(ngram_range)
+        self.norm = norm
+        self.sublinear_tf = sublinear_tf
+        self.binary = binary
+
+    @classmethod
+    def from_vectorizer(cls, vectorizer) -> "TfidfQueryEncoder":
+        """Build an encoder reproducing a fitted TfidfVectorizer (or CountVectorizer-style) transform."""
+        if vectorizer.analyzer != "word" or callable(vectorizer.analyzer):
+            raise ValueError("Only the 'word' analyzer is supported")
+        if vectorizer.preprocessor is not None or vectorizer.tokenizer is not None or vectorizer.strip_accents:
+            raise ValueError("Custom preprocessors, tokenizers and accent stripping are not supported")
+        use_idf = getattr(vectorizer, "use_idf", False)
+        return cls(
+            vocabulary=vectorizer.vocabulary_,
+            idf=vectorizer.idf_ if use_idf else None,
+            token_pattern=vectorizer.token_pattern,
+            lowercase=vectorizer.lowercase,
+            stop_words=vectorizer.get_stop_words(),
+            ngram_range=vectorizer.ngram_range,
+            norm=getattr(vectorizer, "norm", None),
+            sublinear_tf=getattr(vectorizer, "sublinear_tf", False),
+            binary=vectorizer.binary,
+        )
+
+    def _terms(self, text: str):
+        if self.lowercase:
+            text = text.lower()
+        tokens = self._token_re.findall(text)
+        if self.stop_words is not None:
+            tokens = [token for token in tokens if token not in self.stop_words]
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        # Same n-gram order as sklearn's _word_ngrams
+        terms = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            for i in range(len(tokens) - n + 1):
+                terms.append(" ".join(tokens[i:i + n]))
+        return terms
+
+    def encode(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """One query as sorted feature indices and their TF-IDF values."""
+        counts = {}
+        vocabulary = self.vocabulary
+        for term in self._terms(text):
+            index = vocabulary.get(term)
+            if index is not None:
+                counts[index] = counts.get(index, 0) + 1
+        indices = sorted(counts)
+        if self.binary:
+            values = [1.0] * len(indices)
+        else:
+            values = [float(counts[index]) for index in indices]
+        if self.sublinear_tf and values:
+            values = (np.log(values) + 1).tolist()
+        if self.idf is not None:
+            idf = self.idf
+            values = [value * idf[index] for value, index in zip(values, indices)]
+
+        # sklearn normalizes the row left by the sparse IDF product, whose entries
+        # are stored in descending index order; summing in the same order keeps
+        # the result bit-identical
+        if self.norm == "l2":
+            total = 0.0
+            for value in reversed(values):
+                total += value * value
+            total = math.sqrt(total)
+        elif self.norm == "l1":
+            total = 0.0
+            for value in reversed(values):
+                total += abs(value)
+        else:
+            total = 0.0
+        if total:
+            values = [value / total for value in values]
+        return np.asarray(indices, dtype=np.int32), np.asarray(values, dtype=np.float64)
+
+    def encode_dense(self, text: str, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        One query as a dense (1, n_features) row, accepted by sklearn models and
+        app.flat_forest.FlatForest alike. Pass ``out`` to reuse a buffer.
+        """
+        if out is None:
+            out = np.zeros((1, self.n_features), dtype=np.float64)
+        else:
+            out.fill(0.0)
+        indices, values = self.encode(text)
+        out[0, indices] = values
+        return out
+
+    def encode_batch(self, texts: Iterable[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Several queries as CSR (data, indices, indptr) arrays."""
+        data, indices, indptr = [], [], [0]
+        for text in texts:
+            row_indices, row_values = self.encode(text)
+            indices.append(row_indices)
+            data.append(row_values)
+            indptr.append(indptr[-1] + len(row_indices))
+        if not data:
+            return np.zeros(0, dtype=np.float64), np.zeros(0, dtype=np.int32), np.asarray(indptr, dtype=np.int32)
+        return np.concatenate(data), np.concatenate(indices), np.asarray(indptr, dtype=np.int32)
+
+    def transform(self, texts: Iterable[str]):
+        """Drop-in for ``vectorizer.transform``: a scipy CSR matrix."""
+        from scipy.sparse import csr_matrix
+
+        data, indices, indptr = self.encode_batch(texts)
+        return csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, self.n_features))
+
+
+def make_query_encoder(vectorizer) -> Optional[TfidfQueryEncoder]:
+    """An encoder for ``vectorizer``, or None if its settings aren't supported."""
+    try:
+        return TfidfQueryEncoder.from_vectorizer(vectorizer)
+    except (AttributeError, ValueError):
+        return None
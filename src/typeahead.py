@@ -0,0 +1,167 @@
+# src/typeahead.py
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import math
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from src.utils import normalize_food_name
+
+# Match kinds, best first
+EXACT = "exact"
+PREFIX = "prefix"
+WORD_PREFIX = "word_prefix"
+FUZZY = "fuzzy"
+
+# Sorts after every character that can follow a prefix
+_PREFIX_END = "\U0010ffff"
+
+
+def trigrams(key: str) -> set:
+    """Character trigrams of a normalized name, padded so word starts weigh more."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TypeaheadIndex:
+    """
+    Read-only autocomplete index over a fixed list of names.
+
+    Names are normalized (lowercase, single spaces) and numbered in sorted
+    order. Prefix lookups use that sorted array as a flattened trie: every
+    trie node is a contiguous id range found with two binary searches, and
+    since the range is already alphabetical the first ``limit`` ids are the
+    answer. A second sorted array of word suffixes ("wat" for "doro wat")
+    answers prefixes of later words. When those give fewer than ``limit``
+    matches, character-trigram postings rank the remaining names by trigram
+    Jaccard similarity, which tolerates typos ("injra").
+
+    ``values`` (e.g. precomputed glucose) are returned alongside each match.
+    """
+
+    def __init__(self, names: Iterable[str], values: Optional[Iterable[float]] = None,
+                 min_similarity: float = 0.3):
+        names = list(names)
+        values = [None] * len(names) if values is None else list(values)
+        if len(values) != len(names):
+            raise ValueError("names and values must have the same length")
+        self.min_similarity = min_similarity
+
+        # First occurrence wins for names that normalize to the same key
+        by_key = {}
+        for name, value in zip(names, values):
+            key = normalize_food_name(name)
+            if key and key not in by_key:
+                by_key[key] = (name, value)
+        self._keys = sorted(by_key)
+        self.names = [by_key[key][0] for key in self._keys]
+        self.values = [by_key[key][1] for key in self._keys]
+
+        word_suffixes = []
+        postings: Dict[str, array] = {}
+        trigram_counts = np.empty(len(self._keys), dtype=np.int32)
+        for i, key in enumerate(self._keys):
+            start = key.find(" ")
+            while start != -1:
+                word_suffixes.append((key[start + 1:], i))
+                start = key.find(" ", start + 1)
+            grams = trigrams(key)
+            trigram_counts[i] = len(grams)
+            for gram in grams:
+                ids = postings.get(gram)
+                if ids is None:
+                    ids = postings[gram] = array("i")
+                ids.append(i)
+        word_suffixes.sort()
+        self._word_keys = [suffix for suffix, _ in word_suffixes]
+        self._word_ids = np.fromiter((i for _, i in word_suffixes), dtype=np.int32, count=len(word_suffixes))
+        # Posting entries are (trigram count << 32 | id), sorted, so a query can
+        # slice each list to the names whose length could be similar enough
+        self._postings = {}
+        for gram, ids in postings.items():
+            ids = np.frombuffer(ids, dtype=np.int32).astype(np.int64)
+            self._postings[gram] = np.sort((trigram_counts[ids].astype(np.int64) << 32) | ids)
+
+    def __len__(self):
+        return len(self._keys)
+
+    @staticmethod
+    def _prefix_range(keys: List[str], prefix: str):
+        return bisect_left(keys, prefix), bisect_left(keys, prefix + _PREFIX_END)
+
+    def _fuzzy(self, query: str, exclude: set, limit: int):
+        grams = trigrams(query)
+        # Jaccard similarity >= t needs t*|q| <= |name| <= |q|/t trigrams, and at
+        # least `needed` trigrams in common. A name sharing that many must appear
+        # in one of the len(lists) - needed + 1 shortest (length-sliced) posting
+        # lists, so only those are merged; the rest are probed for the candidates.
+        t = self.min_similarity
+        needed = max(math.ceil(t * len(grams) - 1e-9), 1)
+        low = np.int64(needed) << 32
+        high = np.int64(math.floor(len(grams) / t + 1e-9) + 1) << 32
+        lists = []
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                lists.append(postings[np.searchsorted(postings, low):np.searchsorted(postings, high)])
+        lists = sorted((postings for postings in lists if len(postings)), key=len)
+        if len(lists) < needed:
+            return []
+        split = len(lists) - needed + 1
+        keys, shared = np.unique(np.concatenate(lists[:split]), return_counts=True)
+        for postings in lists[split:]:
+            positions = np.minimum(np.searchsorted(postings, keys), len(postings) - 1)
+            shared += postings[positions] == keys
+        ids = keys & 0xFFFFFFFF
+        similarity = shared / (len(grams) + (keys >> 32) - shared)
+        keep = similarity >= self.min_similarity
+        ids, similarity = ids[keep], similarity[keep]
+        # Highest similarity first, ties alphabetical (id order)
+        order = np.lexsort((ids, -similarity))
+        matches = []
+        for i in order:
+            if int(ids[i]) not in exclude:
+                matches.append((int(ids[i]), float(similarity[i])))
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> List[dict]:
+        """
+        Ranked matches for a partial name: the exact name, then names starting
+        with the query, then names with a later word starting with it, then
+        (if ``fuzzy``) the most trigram-similar names. Each match is a dict of
+        ``name``, ``value``, ``match`` (one of the match kinds) and ``score``
+        in (0, 1].
+        """
+        query = normalize_food_name(query)
+        if not query or limit < 1:
+            return []
+        matches = []
+        seen = set()
+
+        lo, hi = self._prefix_range(self._keys, query)
+        for i in range(lo, min(hi, lo + limit)):
+            kind = EXACT if self._keys[i] == query else PREFIX
+            matches.append((i, kind, len(query) / len(self._keys[i])))
+            seen.add(i)
+
+        if len(matches) < limit:
+            lo, hi = self._prefix_range(self._word_keys, query)
+            for j in range(lo, hi):
+                i = int(self._word_ids[j])
+                if i not in seen:
+                    matches.append((i, WORD_PREFIX, len(query) / len(self._keys[i])))
+                    seen.add(i)
+                    if len(matches) == limit:
+                        break
+
+        if fuzzy and len(matches) < limit:
+            for i, similarity in self._fuzzy(query, seen, limit - len(matches)):
+                matches.append((i, FUZZY, similarity))
+
+        return [{"name": self.names[i], "value": self.values[i], "match": kind, "score": round(score, 4)}
+                for i, kind, score in matches]
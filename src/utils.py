@@ -1,33 +1,213 @@
+import atexit
+import contextlib
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app.config import settings
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, rotation is single-process only
+    fcntl = None
 
-def setup_logging():
+LOGGER_NAME = "FoodGlucoseApp"
+LOG_FILENAME = "food_glucose_app.log"
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# The background writer; one per process (see _restart_in_child)
+_listener = None
+_queue_handler = None
+_setup_lock = threading.Lock()
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with any log_type/sample_rate extras."""
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key in ("log_type", "sample_rate"):
+            if hasattr(record, key):
+                entry[key] = getattr(record, key)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+class SharedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotated log file that several processes (uvicorn workers, process-pool
+    workers) can append to. Each write holds an exclusive lock on a sidecar
+    ``.lock`` file, and a process whose file was rotated by another one reopens
+    the new file instead of rotating again, so rollovers don't race.
     """
-    Set up logging configuration.
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self._lock_fd = None
+        self._lock_pid = None
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        if self._lock_pid != os.getpid():
+            # flock is per open file; a forked child needs its own
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+            self._lock_fd = os.open(f"{self.baseFilename}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            self._lock_pid = os.getpid()
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _reopen_if_rotated(self):
+        if self.stream is None:
+            return
+        try:
+            current = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            current = None
+        opened = os.fstat(self.stream.fileno())
+        if current is None or (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino):
+            self.stream.close()
+            self.stream = self._open()
+
+    def emit(self, record):
+        try:
+            with self._file_lock():
+                self._reopen_if_rotated()
+                super().emit(record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        super().close()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = self._lock_pid = None
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Merges the message like QueueHandler, but keeps exc_info for the writer's formatters."""
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep 1 in N records of each sampled message type. A record's type is its
+    ``log_type`` extra (e.g. ``logger.info(..., extra={"log_type": "prediction"})``);
+    records without one, or of a type without a rate, always pass. Kept records
+    carry their ``sample_rate``.
+    """
+    def __init__(self, rates):
+        super().__init__()
+        self.rates = {log_type: int(rate) for log_type, rate in (rates or {}).items()}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        rate = self.rates.get(getattr(record, "log_type", None), 1)
+        if rate <= 1:
+            return True
+        with self._lock:
+            count = self._counts.get(record.log_type, 0)
+            self._counts[record.log_type] = count + 1
+        if count % rate:
+            return False
+        record.sample_rate = rate
+        return True
+
+def _build_handlers(log_dir, max_bytes, backup_count, json_format):
+    os.makedirs(log_dir, exist_ok=True)
+    file_handler = SharedRotatingFileHandler(
+        os.path.join(log_dir, LOG_FILENAME), maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    console_handler = logging.StreamHandler()
+    formatter = JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+    for handler in (file_handler, console_handler):
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(formatter)
+    return file_handler, console_handler
+
+def setup_logging(log_dir=None, max_bytes=None, backup_count=None, json_format=None, sample_rates=None):
+    """
+    Set up logging configuration. Idempotent: only the first call configures the
+    logger, later calls return it as is. Records are put on a queue and written
+    to a size-rotated file and the console by a background thread, so logging
+    never blocks the caller on I/O.
+    Args:
+        log_dir (str): Directory of the log file. Defaults to settings.log_dir.
+        max_bytes (int): Rotate the file at this size. Defaults to settings.log_max_bytes.
+        backup_count (int): Rotated files to keep. Defaults to settings.log_backup_count.
+        json_format (bool): Write JSON lines. Defaults to settings.log_json.
+        sample_rates (dict): log_type -> keep 1 in N records. Defaults to settings.log_sample_rates.
     Returns:
         logging.Logger: Configured logger.
     """
-    logger = logging.getLogger("FoodGlucoseApp")
-    logger.setLevel(logging.INFO)
-    
-    # Create logs directory if it doesn't exist
-    os.makedirs("logs", exist_ok=True)
-    
-    # File handler
-    file_handler = logging.FileHandler("logs/food_glucose_app.log")
-    file_handler.setLevel(logging.INFO)
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    
-    # Formatter
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
-    return logger
\ No newline at end of file
+    global _listener, _queue_handler
+    logger = logging.getLogger(LOGGER_NAME)
+    with _setup_lock:
+        if _queue_handler is not None:
+            return logger
+        handlers = _build_handlers(
+            log_dir or settings.log_dir,
+            settings.log_max_bytes if max_bytes is None else max_bytes,
+            settings.log_backup_count if backup_count is None else backup_count,
+            settings.log_json if json_format is None else json_format,
+        )
+        log_queue = queue.SimpleQueue()
+        _queue_handler = _QueueHandler(log_queue)
+        _queue_handler.addFilter(SamplingFilter(settings.log_sample_rates if sample_rates is None else sample_rates))
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        logger.setLevel(logging.INFO)
+        logger.addHandler(_queue_handler)
+    return logger
+
+def shutdown_logging():
+    """Write out queued records, close the log file and detach the queue handler."""
+    global _listener, _queue_handler
+    with _setup_lock:
+        if _queue_handler is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        logging.getLogger(LOGGER_NAME).removeHandler(_queue_handler)
+        _listener = _queue_handler = None
+
+def normalize_food_name(food_name):
+    """
+    Normalize a food name for exact-match lookups (case and whitespace insensitive).
+    Args:
+        food_name (str): Name of the food.
+    Returns:
+        str: Lowercased name with runs of whitespace collapsed.
+    """
+    return " ".join(food_name.lower().split())
+
+def _restart_in_child():
+    # A forked worker inherits the queue handler but not the listener thread;
+    # give it its own queue and writer so its records aren't stranded
+    global _listener
+    if _queue_handler is None:
+        return
+    log_queue = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _listener = logging.handlers.QueueListener(log_queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_in_child)
+atexit.register(shutdown_logging)
@@ -0,0 +1,9 @@
+from app.config import settings
+import pytest
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    # Before any test module imports src.* (which sets up logging at import
+    # time), so the tracked logs/ directory is never written to. The factory
+    # is what the tmp_path_factory fixture returns.
+    settings.log_dir = str(config._tmp_path_factory.mktemp("logs"))
@@ -0,0 +1,45 @@
+from src.aggregation import NUTRIENT_COLUMNS, box_figure, box_stats, histogram_bins, histogram_figure, summarize_dataset
+from src.data_generation import NUTRIENT_COLUMNS as ALL_NUTRIENTS, generate_food_dataset_vectorized, to_float64
+import numpy as np
+import pytest
+
+@pytest.fixture(scope="module")
+def df():
+    df = generate_food_dataset_vectorized(20000, seed=0)
+    # Summaries are computed on the exact 2-decimal values
+    df[ALL_NUTRIENTS] = df[ALL_NUTRIENTS].apply(to_float64)
+    return df
+
+def test_histogram_matches_numpy(df):
+    column = "Glucose_g_per_100g"
+    hist = histogram_bins(df, column, nbins=30)
+    edges = np.linspace(df[column].min(), df[column].max(), 31)
+    for category, rows in df.groupby("Category"):
+        expected, _ = np.histogram(rows[column], bins=edges)
+        np.testing.assert_array_equal(hist.loc[hist["Category"] == category, "count"], expected)
+    assert hist["count"].sum() == len(df)
+
+def test_box_stats_match_pandas(df):
+    column = "Calories_kcal_per_100g"
+    stats = box_stats(df, column).set_index("Category")
+    grouped = df.groupby("Category")[column]
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    np.testing.assert_allclose(stats[["q1", "median", "q3"]].to_numpy(), quartiles.to_numpy())
+    for category, values in grouped:
+        q1, q3 = quartiles.loc[category, 0.25], quartiles.loc[category, 0.75]
+        inside = values[(values >= q1 - 1.5 * (q3 - q1)) & (values <= q3 + 1.5 * (q3 - q1))]
+        assert stats.loc[category, "lowerfence"] == inside.min()
+        assert stats.loc[category, "upperfence"] == inside.max()
+
+def test_summaries_are_consistent_and_figures_stay_small(df):
+    summaries = summarize_dataset(df)
+    assert set(summaries) == set(NUTRIENT_COLUMNS)
+    column = "Fat_g_per_100g"
+    assert summaries[column]["box"].equals(box_stats(df, column))
+    sizes = []
+    for rows in (2000, len(df)):
+        summary = summarize_dataset(df.iloc[:rows], [column])[column]
+        sizes.append(len(histogram_figure(summary["histogram"], column).to_json())
+                     + len(box_figure(summary["box"], column).to_json()))
+    # The payload depends on bins and categories, not on the number of rows
+    assert sizes[1] < 2 * sizes[0]
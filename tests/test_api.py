@@ -33,4 +33,51 @@ def test_create_patient():
     response = client.post("/patients/", json=patient_data)
     assert response.status_code == 201
     assert "id" in response.json()
-    
\ No newline at end of file
+
+def test_predict_batch_endpoint():
+    """Batch endpoint scores valid items in order and reports invalid ones per item"""
+    payload = [
+        {"patient_id": "p1", "glucose_level": 90},
+        {"patient_id": "p2", "glucose_level": -5},
+        {"patient_id": "p3", "glucose_level": 230},
+        "not an object",
+    ]
+    response = client.post("/api/v1/predict_risk_batch_for_nodejs/", json=payload)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == 2
+    assert body["failed"] == 2
+    results = body["results"]
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert results[0]["patient_id"] == "p1"
+    assert results[0]["ml_predicted_risk_level"] == 0
+    assert results[0]["error"] is None
+    assert results[1]["patient_id"] == "p2"
+    assert results[1]["ml_predicted_risk_level"] is None
+    assert "glucose_level" in results[1]["error"]
+    assert results[2]["ml_predicted_risk_level"] == 3
+    assert results[3]["error"] is not None
+
+def test_admin_endpoints_disabled_without_token(monkeypatch):
+    """Admin endpoints are refused until an admin token is configured"""
+    from app.config import settings
+    monkeypatch.setattr(settings, "admin_token", None)
+    assert client.post("/admin/reload_model").status_code == 403
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    assert client.post("/admin/reload_model", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+def test_admin_reload_rejects_unknown_version(monkeypatch, tmp_path):
+    from app.config import settings
+    from app.model_registry import ModelRegistry
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    headers = {"X-Admin-Token": "secret"}
+    # Without a registry there are no versions to choose from
+    monkeypatch.setattr(settings, "model_registry_dir", None)
+    assert client.post("/admin/reload_model?version=0001", headers=headers).status_code == 400
+    model = tmp_path / "model.joblib"
+    model.write_text("x")
+    ModelRegistry(tmp_path / "registry").publish("diabetes_risk", {"model": model}, version="0001")
+    monkeypatch.setattr(settings, "model_registry_dir", str(tmp_path / "registry"))
+    for version in ("0002", "../../ml", "0001/../0001"):
+        response = client.post("/admin/reload_model", params={"version": version}, headers=headers)
+        assert response.status_code == 404
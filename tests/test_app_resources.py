@@ -0,0 +1,53 @@
+from src.app_resources import TrainingJob, content_digest, ensure_dataset, save_model_artifacts
+import os
+import pickle
+import threading
+import pytest
+
+def test_content_digest_tracks_contents(tmp_path):
+    a, b = tmp_path / "a.bin", tmp_path / "b.bin"
+    a.write_bytes(b"model")
+    assert content_digest(str(a), str(b)) is None
+    b.write_bytes(b"vectorizer")
+    digest = content_digest(str(a), str(b))
+    assert digest == content_digest(str(a), str(b))
+    # Touching a file without changing it keeps the digest; changing it doesn't
+    os.utime(a, ns=(1, 1))
+    assert content_digest(str(a), str(b)) == digest
+    a.write_bytes(b"model v2")
+    assert content_digest(str(a), str(b)) != digest
+
+def test_training_job_runs_once_for_concurrent_callers():
+    release = threading.Event()
+    runs = []
+    def train(tag):
+        runs.append(tag)
+        release.wait(5)
+    job = TrainingJob(train)
+    assert job.start("first")
+    assert not job.start("second")
+    assert job.running and not job.wait(timeout=0.01)
+    release.set()
+    assert job.wait(timeout=5)
+    assert runs == ["first"] and not job.running
+
+def test_training_job_reraises_errors_and_can_restart():
+    def fail():
+        raise RuntimeError("boom")
+    job = TrainingJob(fail)
+    job.start()
+    with pytest.raises(RuntimeError):
+        job.wait(timeout=5)
+    job._target = lambda: None
+    assert job.start() and job.wait(timeout=5)
+
+def test_artifacts_and_dataset_are_written_atomically(tmp_path):
+    model_path, vectorizer_path = tmp_path / "model.pkl", tmp_path / "vectorizer.pkl"
+    save_model_artifacts({"trees": 1}, {"vocab": 2}, str(model_path), str(vectorizer_path))
+    with open(model_path, "rb") as f:
+        assert pickle.load(f) == {"trees": 1}
+    dataset_path = tmp_path / "foods.csv"
+    dataset_path.write_text("existing")
+    ensure_dataset(str(dataset_path))
+    assert dataset_path.read_text() == "existing"
+    assert sorted(os.listdir(tmp_path)) == ["foods.csv", "model.pkl", "vectorizer.pkl"]
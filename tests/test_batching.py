@@ -0,0 +1,54 @@
+from app.batching import MicroBatcher
+import asyncio
+import pytest
+
+def _run(coro):
+    return asyncio.run(coro)
+
+def test_concurrent_requests_share_one_batch():
+    """Requests arriving within the window are scored by a single call"""
+    calls = []
+    def predict_batch(values):
+        calls.append(list(values))
+        return [v * 2 for v in values]
+
+    batcher = MicroBatcher(predict_batch, window_ms=20, max_batch_size=100)
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.submit(v) for v in range(10)))
+
+    assert _run(scenario()) == [v * 2 for v in range(10)]
+    assert calls == [list(range(10))]
+    stats = batcher.stats()
+    assert stats["batches"] == 1
+    assert stats["requests"] == 10
+    assert stats["batch_size_histogram"]["<=16"] == 1
+
+def test_max_batch_size_flushes_early():
+    """A full batch is flushed without waiting for the window"""
+    calls = []
+    def predict_batch(values):
+        calls.append(len(values))
+        return list(values)
+
+    batcher = MicroBatcher(predict_batch, window_ms=10000, max_batch_size=4)
+
+    async def scenario():
+        return await asyncio.wait_for(asyncio.gather(*(batcher.submit(v) for v in range(8))), timeout=1)
+
+    assert _run(scenario()) == list(range(8))
+    assert calls == [4, 4]
+    assert batcher.stats()["largest_batch"] == 4
+
+def test_errors_propagate_to_every_caller():
+    """A failing batch call raises in each waiting request"""
+    def predict_batch(values):
+        raise ValueError("model unavailable")
+
+    batcher = MicroBatcher(predict_batch, window_ms=1, max_batch_size=10)
+
+    async def scenario():
+        return await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+    results = _run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
@@ -0,0 +1,49 @@
+from app.cache import LRUCache, NullCache, make_cache
+import pytest
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_lru_eviction_order():
+    """Least recently used entries are evicted first"""
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = LRUCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+def test_clear_keeps_counters():
+    cache = LRUCache(max_size=10)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+
+def test_make_cache_disabled():
+    cache = make_cache(0)
+    assert isinstance(cache, NullCache)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats() == {"enabled": False}
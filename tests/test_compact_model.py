@@ -0,0 +1,39 @@
+from ml.compact_model import build_candidate, build_candidates, choose_candidate, measure
+from ml.data_generator import generate_synthetic_data
+from app.risk_table import compile_risk_table
+from sklearn.ensemble import RandomForestClassifier
+import numpy as np
+
+def test_candidates_are_measured_and_servable():
+    data = generate_synthetic_data(num_samples=4000)
+    X = data[['glucose_level']].values
+    y = data['risk_level'].values
+    baseline = RandomForestClassifier(n_estimators=30, random_state=42).fit(X[:3000], y[:3000])
+    baseline_predictions = baseline.predict(X[3000:])
+
+    report, report_models = {}, {}
+    for name, _, model in build_candidates(baseline, X[:3000], y[:3000]):
+        report_models[name] = model
+        report[name] = measure(model, X[3000:], y[3000:], baseline_predictions, repeats=1, single_calls=5)
+        # Every candidate still compiles into the serving threshold table
+        table = compile_risk_table(model)
+        np.testing.assert_array_equal(table.predict(X[3000:, 0]), model.predict(X[3000:]))
+
+    assert {"baseline", "trees_10", "depth_4", "leaf_50", "distilled_8"} <= set(report)
+    assert report["baseline"]["agreement_with_baseline"] == 1.0
+    assert report["distilled_8"]["size_bytes"] < report["baseline"]["size_bytes"]
+    # The chosen candidate is rebuilt by name (on the full training split)
+    assert build_candidate(baseline, X[:3000], y[:3000], "trees_10").estimators_ == baseline.estimators_[:10]
+    assert build_candidate(baseline, X[:3000], y[:3000], "baseline") is baseline
+    distilled = build_candidate(baseline, X[:3000], y[:3000], "distilled_32")
+    np.testing.assert_array_equal(distilled.predict(X[3000:]), report_models["distilled_32"].predict(X[3000:]))
+
+def test_choose_candidate_respects_tolerance():
+    report = {
+        "baseline": {"accuracy": 0.90, "size_bytes": 1000},
+        "small": {"accuracy": 0.85, "size_bytes": 10},
+        "medium": {"accuracy": 0.899, "size_bytes": 100},
+    }
+    assert choose_candidate(report, tolerance=0.005) == "medium"
+    assert choose_candidate(report, tolerance=0.1) == "small"
+    assert choose_candidate(report, tolerance=0.0) == "baseline"
@@ -0,0 +1,56 @@
+from src.data_generation import (
+    DATASET_COLUMNS, FOOD_CATALOG, NUTRIENT_COLUMNS, food_dataset_dtypes, generate_food_dataset,
+    generate_food_dataset_vectorized, iter_food_dataset_chunks, load_food_dataset, memory_report,
+    to_float64, write_food_dataset
+)
+import numpy as np
+import pandas as pd
+
+def test_vectorized_matches_loop_schema():
+    """Vectorized generator keeps the original columns and dtypes"""
+    loop = generate_food_dataset(50)
+    vectorized = generate_food_dataset_vectorized(50, seed=0)
+    assert list(vectorized.columns) == list(loop.columns) == DATASET_COLUMNS
+    assert vectorized.dtypes.tolist() == loop.dtypes.tolist()
+    assert len(vectorized) == 50
+
+def test_vectorized_values_within_catalog_ranges():
+    df = generate_food_dataset_vectorized(2000, seed=1)
+    df[NUTRIENT_COLUMNS] = df[NUTRIENT_COLUMNS].apply(to_float64)
+    catalog = {food["name"].lower(): food for food in FOOD_CATALOG}
+    for row in df.itertuples(index=False):
+        food = catalog[row.Food_Name]
+        assert row.Category == food["category"]
+        assert food["carb_range"][0] <= row.Carbohydrate_g_per_100g <= food["carb_range"][1]
+        assert food["gi_range"][0] <= row.Glycemic_Index <= food["gi_range"][1]
+        assert row.Glycemic_Load == round(row.Carbohydrate_g_per_100g * row.Glycemic_Index / 100, 2)
+
+def test_chunks_are_deterministic_across_chunk_sizes():
+    chunks = list(iter_food_dataset_chunks(1000, chunk_size=300, seed=7))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    combined = pd.concat(chunks, ignore_index=True)
+    assert combined.equals(generate_food_dataset_vectorized(1000, seed=7))
+
+def test_write_food_dataset_csv(tmp_path):
+    path = tmp_path / "food.csv"
+    assert write_food_dataset(str(path), 1000, chunk_size=256, seed=3) == 1000
+    written = load_food_dataset(str(path))
+    assert written.equals(generate_food_dataset_vectorized(1000, seed=3))
+    # The float32 columns hold exactly the values a plain float64 load reads
+    plain = pd.read_csv(path)
+    for column in NUTRIENT_COLUMNS:
+        np.testing.assert_array_equal(to_float64(written[column]), plain[column].to_numpy())
+
+def test_compact_schema():
+    df = generate_food_dataset_vectorized(3000, seed=4)
+    assert df.dtypes.to_dict() == food_dataset_dtypes()
+    report = memory_report(df.astype({"Food_Name": object, "Category": object, **{c: np.float64 for c in NUTRIENT_COLUMNS}}))
+    assert report.loc["Glucose_g_per_100g", "compact_bytes"] * 2 == report.loc["Glucose_g_per_100g", "bytes"]
+    assert report.loc["Total", "saved_pct"] > 50
+
+def test_load_keeps_names_outside_catalog(tmp_path):
+    path = tmp_path / "custom.csv"
+    generate_food_dataset_vectorized(10, seed=0).assign(Food_Name="grandma's stew").to_csv(path, index=False)
+    loaded = load_food_dataset(str(path))
+    assert list(loaded["Food_Name"].cat.categories) == ["grandma's stew"]
+    assert loaded["Category"].dtype == food_dataset_dtypes()["Category"]
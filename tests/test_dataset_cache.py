@@ -0,0 +1,52 @@
+from ml.dataset_cache import cache_dir_for, is_cache_valid, load_dataset_arrays
+from ml.data_generator import generate_synthetic_data
+import numpy as np
+import os
+
+def _write_csv(path, seed):
+    data = generate_synthetic_data(num_samples=500, seed=seed)
+    data.to_csv(path, index=False)
+    return data
+
+def test_cache_roundtrip(tmp_path):
+    """Cached arrays are typed, memory-mapped and match the CSV"""
+    csv_path = tmp_path / "data.csv"
+    data = _write_csv(csv_path, seed=1)
+    glucose, labels = load_dataset_arrays(csv_path, cache_root=tmp_path / "cache")
+    assert glucose.dtype == np.float32 and labels.dtype == np.int8
+    assert isinstance(glucose, np.memmap)
+    np.testing.assert_allclose(glucose, data["glucose_level"].astype(np.float32))
+    np.testing.assert_array_equal(labels, data["risk_level"].astype(np.int8))
+
+def test_cache_invalidation(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    cache_root = tmp_path / "cache"
+    _write_csv(csv_path, seed=1)
+    load_dataset_arrays(csv_path, cache_root=cache_root)
+    cache_dir = cache_dir_for(csv_path, cache_root)
+    assert is_cache_valid(csv_path, cache_dir)
+
+    # Touching the file without changing it keeps the cache
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert is_cache_valid(csv_path, cache_dir)
+
+    # New content invalidates it and the next load rebuilds
+    data = _write_csv(csv_path, seed=2)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert not is_cache_valid(csv_path, cache_dir)
+    glucose, _ = load_dataset_arrays(csv_path, cache_root=cache_root, mmap=False)
+    np.testing.assert_allclose(glucose, data["glucose_level"].astype(np.float32))
+
+def test_same_named_csvs_get_separate_caches(tmp_path):
+    cache_root = tmp_path / "cache"
+    first, second = tmp_path / "a" / "data.csv", tmp_path / "b" / "data.csv"
+    for path in (first, second):
+        path.parent.mkdir()
+    data = {path: _write_csv(path, seed) for path, seed in ((first, 1), (second, 2))}
+    assert cache_dir_for(first, cache_root) != cache_dir_for(second, cache_root)
+    for path in (first, second, first):
+        glucose, _ = load_dataset_arrays(path, cache_root=cache_root)
+        np.testing.assert_allclose(glucose, data[path]["glucose_level"].astype(np.float32))
+    # A cache is only valid for the file it was built from
+    assert not is_cache_valid(second, cache_dir_for(first, cache_root))
@@ -0,0 +1,40 @@
+from src.dataset_explorer import DatasetIndex, get_export, get_page, iter_csv_chunks, page_count
+from src.data_generation import generate_food_dataset_vectorized, to_float64
+import gzip
+import io
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+@pytest.fixture(scope="module")
+def df():
+    return generate_food_dataset_vectorized(5000, seed=0)
+
+def test_query_matches_pandas_filters(df):
+    index = DatasetIndex(df)
+    rows = index.query(["Stew", "Bread"], "  WAT ", {"Glucose_g_per_100g": (2.0, 8.5), "Fat_g_per_100g": (0, 100)})
+    expected = df[df["Category"].isin(["Stew", "Bread"])
+                  & df["Food_Name"].str.lower().str.contains("wat")
+                  & (to_float64(df["Glucose_g_per_100g"]) >= 2.0)
+                  & (to_float64(df["Glucose_g_per_100g"]) <= 8.5)]
+    np.testing.assert_array_equal(rows, np.flatnonzero(df.index.isin(expected.index)))
+    assert len(index.query()) == len(df)
+    assert len(index.query(["No Such Category"])) == 0
+
+def test_pages_cover_all_rows(df):
+    rows = DatasetIndex(df).query(name_contains="injera")
+    pages = page_count(len(rows), 100)
+    combined = pd.concat(get_page(df, rows, page, 100) for page in range(1, pages + 1))
+    assert combined.equals(df.iloc[rows])
+    assert page_count(0, 100) == 1 and get_page(df, rows[:0], 1, 100).empty
+
+def test_export_is_chunked_cached_and_pruned(df, tmp_path):
+    assert "".join(iter_csv_chunks(df, chunk_rows=700)) == df.to_csv(index=False)
+    path = get_export(df, "v1", str(tmp_path), compress=True)
+    with gzip.open(path, "rt") as f:
+        assert pd.read_csv(f).equals(pd.read_csv(io.StringIO(df.to_csv(index=False))))
+    mtime = os.stat(path).st_mtime_ns
+    assert get_export(df, "v1", str(tmp_path), compress=True) == path and os.stat(path).st_mtime_ns == mtime
+    plain = get_export(df, "v2", str(tmp_path))
+    assert os.listdir(tmp_path) == [os.path.basename(plain)]
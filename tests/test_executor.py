@@ -0,0 +1,42 @@
+from app.executor import InferenceExecutor
+import asyncio
+import threading
+import pytest
+
+def test_runs_off_the_event_loop_thread():
+    """Calls execute on a pool thread and return their result"""
+    executor = InferenceExecutor(max_workers=2)
+
+    async def scenario():
+        return await executor.run(lambda: threading.get_ident())
+
+    try:
+        assert asyncio.run(scenario()) != threading.get_ident()
+        assert executor.stats()["completed"] == 1
+    finally:
+        executor.shutdown()
+
+def test_queue_depth_reports_saturation():
+    """Submissions beyond max_workers are counted as queued"""
+    executor = InferenceExecutor(max_workers=1)
+    release = threading.Event()
+
+    async def scenario():
+        tasks = [asyncio.ensure_future(executor.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        depth = executor.queue_depth
+        release.set()
+        await asyncio.gather(*tasks)
+        return depth
+
+    try:
+        assert asyncio.run(scenario()) == 2
+        stats = executor.stats()
+        assert stats["peak_queue_depth"] == 2
+        assert stats["in_flight"] == 0
+    finally:
+        executor.shutdown()
+
+def test_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        InferenceExecutor(kind="gpu")
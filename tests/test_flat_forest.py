@@ -0,0 +1,70 @@
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.feature_extraction.text import TfidfVectorizer
+from app.flat_forest import export_forest, export_vectorizer, flatten_forest, load_forest, load_vectorizer
+from app.risk_table import compile_risk_table
+from ml.data_generator import generate_synthetic_data
+from src.data_generation import generate_food_dataset, get_catalog_food_names
+from src.model_training import as_inference_backend, predict_glucose
+import numpy as np
+import pytest
+
+@pytest.fixture(scope="module")
+def risk_model():
+    data = generate_synthetic_data(num_samples=4000)
+    model = RandomForestClassifier(n_estimators=15, random_state=42)
+    model.fit(data[['glucose_level']].values, data['risk_level'].values)
+    return model
+
+@pytest.fixture(scope="module")
+def food_model():
+    df = generate_food_dataset(2000)
+    vectorizer = TfidfVectorizer(max_features=500, lowercase=True, stop_words="english")
+    model = RandomForestRegressor(n_estimators=10, random_state=42)
+    model.fit(vectorizer.fit_transform(df["Food_Name"]), df["Glucose_g_per_100g"])
+    return model, vectorizer
+
+def test_classifier_round_trip(risk_model, tmp_path):
+    """Memory-mapped export predicts exactly like the sklearn forest"""
+    export_forest(risk_model, tmp_path)
+    flat = load_forest(tmp_path)
+    assert isinstance(flat.threshold, np.memmap)
+    grid = np.linspace(0, 450, 5001).reshape(-1, 1)
+    assert np.array_equal(flat.predict(grid), risk_model.predict(grid))
+    assert np.allclose(flat.predict_proba(grid), risk_model.predict_proba(grid))
+
+def test_flat_forest_compiles_to_same_risk_table(risk_model, tmp_path):
+    export_forest(risk_model, tmp_path)
+    expected = compile_risk_table(risk_model)
+    compiled = compile_risk_table(load_forest(tmp_path))
+    assert np.array_equal(compiled.breakpoints, expected.breakpoints)
+    assert np.array_equal(compiled.labels, expected.labels)
+
+def test_regressor_and_vectorizer_round_trip(food_model, tmp_path):
+    """Exported food model and vectorizer reproduce the pickled pipeline"""
+    model, vectorizer = food_model
+    export_forest(model, tmp_path)
+    export_vectorizer(vectorizer, tmp_path)
+    flat, flat_vectorizer = load_forest(tmp_path), load_vectorizer(tmp_path)
+    names = ["injera", "misir wat", "pain au chocolat", "unknown stew"]
+    X = flat_vectorizer.transform(names)
+    assert (X != vectorizer.transform(names)).nnz == 0
+    assert np.allclose(flat.predict(X), model.predict(vectorizer.transform(names)))
+
+def test_sparse_single_and_batch_rows_match_sklearn(food_model):
+    """One sparse TF-IDF row at a time or a whole batch, predictions equal model.predict"""
+    model, vectorizer = food_model
+    flat = flatten_forest(model)
+    X = vectorizer.transform(get_catalog_food_names() + ["injera pizza", "xyz"])
+    np.testing.assert_array_equal(flat.predict(X), model.predict(X))
+    for i in range(5):
+        np.testing.assert_array_equal(flat.predict(X[i]), model.predict(X[i]))
+
+def test_flat_backend_is_drop_in_for_predict_glucose(food_model):
+    model, vectorizer = food_model
+    flat = as_inference_backend(model, "flat")
+    assert as_inference_backend(flat, "flat") is flat
+    assert as_inference_backend(model, "sklearn") is model
+    for name in ["Injera", "injera pizza", "chocolate stew"]:
+        assert predict_glucose(name, flat, vectorizer) == predict_glucose(name, model, vectorizer)
+    with pytest.raises(ValueError):
+        as_inference_backend(model, "onnx")
\ No newline at end of file
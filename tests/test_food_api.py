@@ -0,0 +1,59 @@
+from fastapi.testclient import TestClient
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.feature_extraction.text import TfidfVectorizer
+from src.data_generation import generate_food_dataset
+from src.model_training import load_model_artifacts, predict_glucose
+import src.api as food_api
+import pickle
+import pytest
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """The food API serving a small regressor from temporary pickles"""
+    df = generate_food_dataset(2000)
+    vectorizer = TfidfVectorizer(max_features=500, lowercase=True, stop_words="english")
+    model = RandomForestRegressor(n_estimators=10, random_state=42).fit(vectorizer.fit_transform(df["Food_Name"]), df["Glucose_g_per_100g"])
+    artifacts = tmp_path_factory.mktemp("food_model")
+    paths = {"MODEL_PATH": str(artifacts / "model.pkl"), "VECTORIZER_PATH": str(artifacts / "vectorizer.pkl")}
+    for obj, path in ((model, paths["MODEL_PATH"]), (vectorizer, paths["VECTORIZER_PATH"])):
+        with open(path, "wb") as f:
+            pickle.dump(obj, f)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, path in paths.items():
+            monkeypatch.setattr(food_api, name, path)
+        monkeypatch.setattr(food_api, "registry", None)
+        with TestClient(food_api.app) as client:
+            yield client
+
+def test_search_ranks_exact_then_prefix(client):
+    body = client.get("/search", params={"q": "  Shiro"}).json()
+    assert body["query"] == "  Shiro"
+    assert [(r["food_name"], r["match"]) for r in body["results"][:2]] == [("Shiro", "exact"), ("Shiro Fitfit", "prefix")]
+    assert body["results"][0]["category"]
+    assert body["model_version"] == client.get("/health").json()["model_version"]
+
+def test_search_matches_later_words(client):
+    results = client.get("/search", params={"q": "wat", "limit": 20}).json()["results"]
+    word_matches = [r["food_name"] for r in results if r["match"] == "word_prefix"]
+    assert word_matches == ["Alicha Wat", "Atakilt Wat", "Dinich Wat", "Doro Wat", "Duba Wat", "Key Wat", "Misir Wat"]
+    # Word-prefix matches rank before fuzzy ones
+    kinds = [r["match"] for r in results]
+    assert kinds == sorted(kinds, key=["exact", "prefix", "word_prefix", "fuzzy"].index)
+
+def test_search_limits(client):
+    assert len(client.get("/search", params={"q": "s", "limit": 2}).json()["results"]) == 2
+    for limit in (0, 51):
+        assert client.get("/search", params={"q": "s", "limit": limit}).status_code == 422
+    assert client.get("/search", params={"q": "a" * 100}).status_code == 200
+    assert client.get("/search", params={"q": "a" * 101}).status_code == 422
+    assert client.get("/search").status_code == 422
+
+def test_predict_returns_model_prediction_and_version(client):
+    model, vectorizer = load_model_artifacts(food_api.MODEL_PATH, food_api.VECTORIZER_PATH)
+    response = client.post("/predict", json={"food_name": "Doro Wat"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["glucose_content_g_per_100g"] == predict_glucose("Doro Wat", model, vectorizer)
+    assert body["diabetic_recommendation"]["recommendation"] in ("Recommended", "Caution", "Not Recommended")
+    assert body["model_version"] == client.get("/health").json()["model_version"]
+    assert client.post("/predict", json={"food_name": "  "}).status_code == 500
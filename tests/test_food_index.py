@@ -0,0 +1,43 @@
+from src.food_index import FoodIndex, TIERS, get_food_index
+from src.data_generation import FOOD_CATALOG
+from src.model_training import get_diabetic_recommendation
+import numpy as np
+import pytest
+
+def test_index_covers_catalog():
+    index = get_food_index()
+    assert len(index) == len({food["name"].lower() for food in FOOD_CATALOG})
+    assert get_food_index() is index
+    injera = index.get("  INJERA ")
+    assert injera.glycemic_index == 53.5
+    assert injera.carbohydrate_g_per_100g == 55.0
+    assert injera.glycemic_load == 29.43
+    assert index.get("not a food") is None
+
+def test_index_is_immutable():
+    index = FoodIndex(FOOD_CATALOG)
+    with pytest.raises(TypeError):
+        index._entries["pizza"] = None
+    with pytest.raises(ValueError):
+        index._loads[0] = 0.0
+
+def test_recommendation_tiers():
+    # Injera is always recommended; high-load foods depend on the predicted glucose
+    assert get_diabetic_recommendation(40.0, "injera")["recommendation"] == "Recommended"
+    assert get_diabetic_recommendation(5.0, "Pasta")["recommendation"] == "Recommended"
+    assert get_diabetic_recommendation(10.0, "Pasta")["recommendation"] == "Caution"
+    assert get_diabetic_recommendation(30.0, "Pasta")["recommendation"] == "Not Recommended"
+    assert get_diabetic_recommendation(30.0, "tibs")["recommendation"] == "Recommended"
+    # Unknown foods fall back to GI 50, 30 g carbs
+    assert get_diabetic_recommendation(30.0, "Mystery Stew")["glycemic_load"] == 15.0
+
+def test_score_matches_recommend():
+    index = get_food_index()
+    names = index.names() + ["Mystery Stew", "PIZZA"]
+    glucose = np.random.default_rng(0).uniform(0, 20, len(names))
+    glucose[::5] = 10.0
+    codes, loads = index.score(names, glucose)
+    for name, value, code, load in zip(names, glucose, codes, loads):
+        assert (TIERS[code], load) == index.recommend(value, name)
+    with pytest.raises(ValueError):
+        index.score(["Pizza"], [1.0, 2.0])
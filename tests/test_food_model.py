@@ -0,0 +1,119 @@
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.model_selection import train_test_split
+from src.data_generation import generate_food_dataset, generate_food_dataset_vectorized, get_catalog_food_names, to_float64
+from src.model_training import (
+    build_known_food_table,
+    fit_weighted_vectorizer,
+    group_food_rows,
+    get_known_food_table,
+    load_model_artifacts,
+    predict_glucose,
+    train_model,
+)
+import os
+import pickle
+import pytest
+
+@pytest.fixture(scope="module")
+def food_model():
+    """Small food regressor trained the same way as src.model_training.train_model"""
+    df = generate_food_dataset(2000)
+    vectorizer = TfidfVectorizer(max_features=500, lowercase=True, stop_words="english")
+    X = vectorizer.fit_transform(df["Food_Name"])
+    model = RandomForestRegressor(n_estimators=10, random_state=42)
+    model.fit(X, df["Glucose_g_per_100g"])
+    return model, vectorizer
+
+def test_known_food_table_matches_model(food_model):
+    """Every precomputed entry equals the model's own prediction"""
+    model, vectorizer = food_model
+    table = build_known_food_table(model, vectorizer)
+    assert len(table) == len(set(get_catalog_food_names()))
+    for name, glucose in table.items():
+        assert glucose == round(float(model.predict(vectorizer.transform([name]))[0]), 2)
+
+def test_predict_glucose_normalizes_known_names(food_model):
+    """Case and whitespace variants of a catalog name hit the same entry"""
+    model, vectorizer = food_model
+    expected = get_known_food_table(model, vectorizer)["misir wat"]
+    assert predict_glucose("  Misir   WAT ", model, vectorizer) == expected
+
+def test_unknown_names_fall_back_to_model(food_model):
+    model, vectorizer = food_model
+    name = "injera pizza"
+    assert name not in get_known_food_table(model, vectorizer)
+    expected = round(float(model.predict(vectorizer.transform([name]))[0]), 2)
+    assert predict_glucose(name, model, vectorizer) == expected
+
+def test_unknown_names_reuse_one_row_buffer(food_model):
+    """Consecutive unknown names share a per-thread row without leaking terms between them"""
+    from src.model_training import _get_model_state
+    model, vectorizer = food_model
+    rows = _get_model_state(model, vectorizer)["rows"]
+    row = None
+    # Names no other test predicts, so none is served from the prediction cache
+    for name in ("spicy pasta bowl", "tibs salad", "doro burger"):
+        expected = round(float(model.predict(vectorizer.transform([name]))[0]), 2)
+        assert predict_glucose(name, model, vectorizer) == expected
+        row = row if row is not None else rows.row
+        assert rows.row is row
+
+def test_changed_pickle_rebuilds_table(food_model, tmp_path):
+    """Rewriting the model pickle loads a new model with its own table"""
+    model, vectorizer = food_model
+    model_path, vectorizer_path = str(tmp_path / "model.pkl"), str(tmp_path / "vectorizer.pkl")
+    for obj, path in ((model, model_path), (vectorizer, vectorizer_path)):
+        with open(path, "wb") as f:
+            pickle.dump(obj, f)
+
+    first_model, first_vectorizer = load_model_artifacts(model_path, vectorizer_path)
+    assert load_model_artifacts(model_path, vectorizer_path)[0] is first_model
+
+    with open(model_path, "wb") as f:
+        pickle.dump(model, f)
+    stat = os.stat(model_path)
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    second_model, second_vectorizer = load_model_artifacts(model_path, vectorizer_path)
+    assert second_model is not first_model
+    assert get_known_food_table(second_model, second_vectorizer) == get_known_food_table(first_model, first_vectorizer)
+
+def test_halving_search_trains_a_model():
+    """Successive halving picks parameters from the grid and refits on the training split"""
+    df = generate_food_dataset_vectorized(1500, seed=0)
+    model, vectorizer = train_model(df, search="halving")
+    assert model.n_estimators in (50, 100, 200)
+    assert not model.warm_start
+    assert model.predict(vectorizer.transform(["injera"]))[0] > 0
+
+def test_halving_search_respects_time_budget():
+    df = generate_food_dataset_vectorized(1500, seed=0)
+    with pytest.raises(TimeoutError):
+        train_model(df, search="halving", time_budget_seconds=1e-9)
+    with pytest.raises(ValueError):
+        train_model(df, search="random")
+
+def test_weighted_vectorizer_matches_full_fit():
+    """Fitting on unique names with row counts gives the same features as fitting every row"""
+    df = generate_food_dataset_vectorized(3000, seed=2)
+    names, _, counts = group_food_rows(df)
+    assert counts.sum() == len(df)
+    weighted = fit_weighted_vectorizer(names, counts, max_features=500, lowercase=True, stop_words="english")
+    full = TfidfVectorizer(max_features=500, lowercase=True, stop_words="english").fit(df["Food_Name"])
+    assert weighted.vocabulary_ == full.vocabulary_
+    assert abs(weighted.transform(names) - full.transform(names)).max() < 1e-12
+
+def test_deduplicated_training_matches_full_path():
+    df = generate_food_dataset_vectorized(3000, seed=2)
+    # Both paths hold out the same rows
+    _, test_df = train_test_split(df, test_size=0.2, random_state=42)
+    y_test = to_float64(test_df["Glucose_g_per_100g"])
+    scores = []
+    for deduplicate in (False, True):
+        model, vectorizer = train_model(df, deduplicate=deduplicate)
+        scores.append(model.score(vectorizer.transform(test_df["Food_Name"]), y_test))
+    assert scores[1] == pytest.approx(scores[0], abs=0.01)
+    # Each name is predicted close to its mean glucose content
+    names, means, _ = group_food_rows(df)
+    assert abs(model.predict(vectorizer.transform(names)) - means).max() < 2.0
\ No newline at end of file
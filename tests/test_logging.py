@@ -0,0 +1,90 @@
+from src.utils import LOGGER_NAME, LOG_FILENAME, SamplingFilter, setup_logging, shutdown_logging
+import json
+import logging
+import os
+import pytest
+
+@pytest.fixture
+def log_dir(tmp_path):
+    # Reconfigure into tmp_path, then restore the session's setup (settings.log_dir, see conftest.py)
+    shutdown_logging()
+    yield tmp_path
+    shutdown_logging()
+    setup_logging()
+
+def read_lines(log_dir):
+    shutdown_logging()
+    return (log_dir / LOG_FILENAME).read_text(encoding="utf-8").splitlines()
+
+def test_setup_logging_is_idempotent(log_dir):
+    logger = setup_logging(log_dir=str(log_dir))
+    for _ in range(3):
+        assert setup_logging(log_dir=str(log_dir)) is logger
+    assert len(logger.handlers) == 1
+    logger.info("only once")
+    lines = read_lines(log_dir)
+    assert len(lines) == 1
+    assert lines[0].endswith(f"{LOGGER_NAME} - INFO - only once")
+
+def test_log_file_rotates_by_size(log_dir):
+    logger = setup_logging(log_dir=str(log_dir), max_bytes=1000, backup_count=2)
+    for i in range(100):
+        logger.info("line %d %s", i, "x" * 50)
+    shutdown_logging()
+    log_files = sorted(path for path in log_dir.iterdir() if path.suffix != ".lock")
+    assert [path.name for path in log_files] == [LOG_FILENAME, f"{LOG_FILENAME}.1", f"{LOG_FILENAME}.2"]
+    assert all(path.stat().st_size <= 1000 for path in log_files)
+    assert (log_dir / LOG_FILENAME).read_text(encoding="utf-8").splitlines()[-1].endswith("line 99 " + "x" * 50)
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_processes_share_rotated_file(log_dir):
+    """Forked writers rotate the shared file once per rollover and lose no lines"""
+    logger = setup_logging(log_dir=str(log_dir), max_bytes=2000, backup_count=100)
+    children = []
+    for tag in "abc":
+        pid = os.fork()
+        if pid == 0:
+            for i in range(200):
+                logger.info("%s %d", tag, i)
+            shutdown_logging()
+            os._exit(0)
+        children.append(pid)
+    for i in range(200):
+        logger.info("p %d", i)
+    for pid in children:
+        os.waitpid(pid, 0)
+    shutdown_logging()
+    lines = [line.rsplit(" - ", 1)[1] for path in log_dir.iterdir() if path.suffix != ".lock"
+             for line in path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(lines) == sorted(f"{tag} {i}" for tag in "abcp" for i in range(200))
+
+def test_json_lines(log_dir):
+    logger = setup_logging(log_dir=str(log_dir), json_format=True, sample_rates={})
+    logger.info("Prediction for '%s'", "injera", extra={"log_type": "prediction"})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+    first, second = (json.loads(line) for line in read_lines(log_dir) if line.startswith("{"))
+    assert first["message"] == "Prediction for 'injera'"
+    assert (first["logger"], first["level"], first["log_type"]) == (LOGGER_NAME, "INFO", "prediction")
+    assert (second["level"], second["message"]) == ("ERROR", "failed")
+    assert second["exception"].endswith("ValueError: boom")
+
+def test_sampling_is_per_log_type(log_dir):
+    logger = setup_logging(log_dir=str(log_dir), sample_rates={"prediction": 10})
+    for i in range(25):
+        logger.info("prediction %d", i, extra={"log_type": "prediction"})
+        logger.info("other %d", i)
+    lines = read_lines(log_dir)
+    assert [line.rsplit(" - ", 1)[1] for line in lines if "prediction" in line] == \
+        ["prediction 0", "prediction 10", "prediction 20"]
+    assert sum("other" in line for line in lines) == 25
+
+def test_sampling_filter_marks_kept_records():
+    sampler = SamplingFilter({"prediction": 3})
+    records = [logging.makeLogRecord({"msg": "x", "log_type": "prediction"}) for _ in range(6)]
+    kept = [record for record in records if sampler.filter(record)]
+    assert kept == [records[0], records[3]]
+    assert all(record.sample_rate == 3 for record in kept)
+    assert sampler.filter(logging.makeLogRecord({"msg": "untyped"}))
@@ -16,4 +16,14 @@ def test_risk_descriptions():
     assert get_risk_description(0) == "No Diabetes"
     assert get_risk_description(1) == "Diabetic, Low Risk"
     assert get_risk_description(2) == "Diabetic, Medium Risk"
-    assert get_risk_description(3) == "Diabetic, High Risk"
\ No newline at end of file
+    assert get_risk_description(3) == "Diabetic, High Risk"
+
+def test_predict_risk_matches_model_exactly():
+    """Risk is predicted on the exact glucose reading, not a rounded one"""
+    import numpy as np
+    from app.ml_model import get_served_model, predict_risk_batch
+    model = get_served_model().model
+    values = np.random.default_rng(0).uniform(40, 450, 2000)
+    expected = model.predict(values.reshape(-1, 1)).astype(int).tolist()
+    assert [predict_risk(v).value for v in values] == expected
+    assert [r.value for r in predict_risk_batch(values)] == expected
@@ -0,0 +1,76 @@
+from app.model_registry import ModelRegistry, ModelReloader
+import asyncio
+import pytest
+
+def _artifact(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+    return path
+
+def test_publish_and_resolve_current(tmp_path):
+    registry = ModelRegistry(tmp_path / "registry")
+    assert registry.current_version("food_glucose") is None
+
+    model = _artifact(tmp_path, "model.pkl", "v1")
+    vectorizer = _artifact(tmp_path, "vectorizer.pkl", "vec")
+    registry.publish("food_glucose", {"model": model, "vectorizer": vectorizer}, version="0001")
+    assert registry.current_version("food_glucose") == "0001"
+    assert registry.artifact_path("food_glucose", "0001", "model").read_text() == "v1"
+    assert len(registry.manifest("food_glucose", "0001")["artifacts"]["model"]["sha256"]) == 64
+
+    model.write_text("v2")
+    registry.publish("food_glucose", {"model": model, "vectorizer": vectorizer}, version="0002", activate=False)
+    assert registry.versions("food_glucose") == ["0001", "0002"]
+    assert registry.current_version("food_glucose") == "0001"
+    registry.activate("food_glucose", "0002")
+    assert registry.current_version("food_glucose") == "0002"
+
+    with pytest.raises(FileExistsError):
+        registry.publish("food_glucose", {"model": model}, version="0002")
+    with pytest.raises(FileNotFoundError):
+        registry.activate("food_glucose", "9999")
+    # Only listed versions resolve to paths
+    for version in ("9999", "..", "0001/../0002"):
+        with pytest.raises(FileNotFoundError):
+            registry.artifact_path("food_glucose", version, "model")
+
+def test_incomplete_versions_are_ignored(tmp_path):
+    """A version directory without its manifest is still being written"""
+    registry = ModelRegistry(tmp_path)
+    registry.publish("diabetes_risk", {"model": _artifact(tmp_path, "m.joblib", "x")}, version="0001")
+    (tmp_path / "diabetes_risk" / "0002").mkdir()
+    assert registry.versions("diabetes_risk") == ["0001"]
+
+def test_reloader_swaps_atomically():
+    """In-flight holders of the old object are unaffected by a swap"""
+    served = {"current": {"version": "0001"}}
+    wanted = {"version": "0002"}
+    reloader = ModelReloader(
+        resolve=lambda: wanted["version"],
+        load=lambda version: {"version": version or wanted["version"]},
+        swap=lambda obj: served.update(current=obj),
+        current_version=lambda: served["current"]["version"],
+    )
+
+    in_flight = served["current"]
+    assert asyncio.run(reloader.reload()) == "0002"
+    assert in_flight["version"] == "0001"
+    assert served["current"]["version"] == "0002"
+
+def test_reloader_watch_picks_up_new_version():
+    served = {"current": {"version": "0001"}}
+    reloader = ModelReloader(
+        resolve=lambda: "0002",
+        load=lambda version: {"version": version},
+        swap=lambda obj: served.update(current=obj),
+        current_version=lambda: served["current"]["version"],
+        poll_seconds=0.01,
+    )
+
+    async def scenario():
+        reloader.start()
+        await asyncio.sleep(0.1)
+        await reloader.stop()
+
+    asyncio.run(scenario())
+    assert served["current"]["version"] == "0002"
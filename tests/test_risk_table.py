@@ -0,0 +1,41 @@
+from sklearn.ensemble import RandomForestClassifier
+from app.risk_table import RiskThresholdTable, compile_risk_table
+from ml.data_generator import generate_synthetic_data
+import numpy as np
+import pytest
+
+@pytest.fixture(scope="module")
+def model():
+    """Small forest trained on the same synthetic distribution as the serving model"""
+    data = generate_synthetic_data(num_samples=4000)
+    model = RandomForestClassifier(n_estimators=20, random_state=42)
+    model.fit(data[['glucose_level']].values, data['risk_level'].values)
+    return model
+
+def test_parity_on_dense_grid(model):
+    """Compiled table matches model.predict over a dense glucose grid"""
+    table = compile_risk_table(model)
+    grid = np.linspace(0, 450, 200001)
+    assert np.array_equal(table.predict(grid), model.predict(grid.reshape(-1, 1)))
+
+def test_parity_on_thresholds(model):
+    """Inputs sitting exactly on, or next to, a split threshold agree too"""
+    table = compile_risk_table(model)
+    thresholds = np.concatenate([e.tree_.threshold[e.tree_.feature >= 0] for e in model.estimators_])
+    points = np.concatenate([thresholds, np.nextafter(thresholds, np.inf), np.nextafter(thresholds, -np.inf)])
+    assert np.array_equal(table.predict(points), model.predict(points.reshape(-1, 1)))
+
+def test_scalar_matches_batch(model):
+    """bisect scalar path agrees with the searchsorted batch path"""
+    table = compile_risk_table(model)
+    values = [50.0, 90, 130.5, 175.25, 230.0, 1000.0]
+    assert [table.predict_one(v) for v in values] == table.predict(values).tolist()
+
+def test_save_and_load(model, tmp_path):
+    """Compiled table round-trips through .npz"""
+    table = compile_risk_table(model)
+    path = tmp_path / "table.npz"
+    table.save(path)
+    loaded = RiskThresholdTable.load(path)
+    assert np.array_equal(loaded.breakpoints, table.breakpoints)
+    assert np.array_equal(loaded.labels, table.labels)
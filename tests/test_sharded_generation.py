@@ -0,0 +1,36 @@
+from ml.sharded_generation import generate_shards, read_shards, shard_sizes
+from ml.data_generator import generate_synthetic_data, write_synthetic_data_shards
+from src.data_generation import write_food_dataset_shards
+import numpy as np
+
+def _read_bytes(directory):
+    return {p.name: p.read_bytes() for p in sorted(directory.iterdir())}
+
+def test_shard_sizes():
+    assert shard_sizes(10, 3) == [4, 3, 3]
+    assert sum(shard_sizes(1001, 8)) == 1001
+
+def test_food_shards_identical_for_any_worker_count(tmp_path):
+    """Output depends only on seed and shard count, not on the number of workers"""
+    manifest = write_food_dataset_shards(tmp_path / "one", 1000, n_shards=4, seed=11, workers=1)
+    write_food_dataset_shards(tmp_path / "many", 1000, n_shards=4, seed=11, workers=2)
+    assert manifest["n_samples"] == 1000
+    assert len(manifest["shards"]) == 4
+    assert _read_bytes(tmp_path / "one") == _read_bytes(tmp_path / "many")
+    assert len(read_shards(tmp_path / "one")) == 1000
+
+def test_risk_shards_identical_for_any_worker_count(tmp_path):
+    write_synthetic_data_shards(tmp_path / "one", 1001, n_shards=3, seed=5, workers=1)
+    write_synthetic_data_shards(tmp_path / "many", 1001, n_shards=3, seed=5, workers=3)
+    assert _read_bytes(tmp_path / "one") == _read_bytes(tmp_path / "many")
+    data = read_shards(tmp_path / "one")
+    assert len(data) == 1001
+    assert set(data["risk_level"].unique()) == {0, 1, 2, 3}
+
+def test_synthetic_data_leaves_global_rng_alone():
+    np.random.seed(0)
+    expected = np.random.random()
+    np.random.seed(0)
+    first = generate_synthetic_data(400)
+    assert np.random.random() == expected
+    assert first.equals(generate_synthetic_data(400))
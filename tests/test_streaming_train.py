@@ -0,0 +1,35 @@
+from ml.streaming_train import (
+    evaluate_streaming, iter_dataset_chunks, iter_split_chunks, in_test_split, train_streaming_forest
+)
+from ml.data_generator import generate_synthetic_data, write_synthetic_data_shards
+import numpy as np
+import pytest
+
+@pytest.fixture(scope="module")
+def dataset_csv(tmp_path_factory):
+    path = tmp_path_factory.mktemp("data") / "diabetes.csv"
+    generate_synthetic_data(num_samples=4000).to_csv(path, index=False)
+    return path
+
+def test_row_hash_split_is_stable_across_chunk_sizes(dataset_csv):
+    mask = in_test_split(np.arange(100000), test_size=0.2, seed=1)
+    assert 0.19 < mask.mean() < 0.21
+    small = np.concatenate([g for g, _ in iter_split_chunks(dataset_csv, chunk_size=300, split='test')])
+    large = np.concatenate([g for g, _ in iter_split_chunks(dataset_csv, chunk_size=4000, split='test')])
+    np.testing.assert_array_equal(small, large)
+
+def test_chunks_from_shard_directory(dataset_csv, tmp_path):
+    write_synthetic_data_shards(tmp_path / "shards", 1000, n_shards=3, workers=1)
+    chunks = list(iter_dataset_chunks(tmp_path / "shards", chunk_size=200))
+    assert sum(len(labels) for _, labels in chunks) == 1000
+    assert all(g.dtype == np.float32 and l.dtype == np.int8 for g, l in chunks)
+
+def test_streaming_forest_is_a_usable_classifier(dataset_csv):
+    """Trees from per-chunk samples form a working RandomForestClassifier"""
+    model = train_streaming_forest(dataset_csv, chunk_size=1000, n_estimators=12, trees_per_chunk=5)
+    assert len(model.estimators_) == 12
+    assert list(model.classes_) == [0, 1, 2, 3]
+    assert model.predict(np.array([[85.0], [300.0]])).tolist() == [0, 3]
+    report = evaluate_streaming(model, dataset_csv, chunk_size=1000)
+    assert report["accuracy"] > 0.75
+    assert report["rows"] == sum(len(l) for _, l in iter_split_chunks(dataset_csv, 1000, split='test'))
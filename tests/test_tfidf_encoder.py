@@ -0,0 +1,47 @@
+from src.tfidf_encoder import TfidfQueryEncoder, make_query_encoder
+from sklearn.feature_extraction.text import TfidfVectorizer
+from src.data_generation import get_catalog_food_names
+import numpy as np
+import pytest
+import random
+
+def _queries():
+    random.seed(0)
+    words = " ".join(get_catalog_food_names()).split() + ["the", "and", "of", "xyz", "Crème", "brûlée!"]
+    random_names = [" ".join(random.choice(words) for _ in range(random.randint(0, 6))) for _ in range(500)]
+    return get_catalog_food_names() + ["", "   ", "INJERA injera, Injera", "doro-wat & tibs"] + random_names
+
+def _assert_identical(vectorizer, queries):
+    expected = vectorizer.transform(queries)
+    expected.sort_indices()
+    actual = TfidfQueryEncoder.from_vectorizer(vectorizer).transform(queries)
+    np.testing.assert_array_equal(actual.indptr, expected.indptr)
+    np.testing.assert_array_equal(actual.indices, expected.indices)
+    # Bit-identical, not just close
+    np.testing.assert_array_equal(actual.data, expected.data)
+
+@pytest.mark.parametrize("params", [
+    {"max_features": 500, "lowercase": True, "stop_words": "english"},
+    {"ngram_range": (1, 2)},
+    {"ngram_range": (2, 3), "sublinear_tf": True},
+    {"binary": True, "norm": "l1"},
+    {"use_idf": False, "norm": None},
+])
+def test_encoder_matches_vectorizer_transform(params):
+    queries = _queries()
+    vectorizer = TfidfVectorizer(**params).fit(get_catalog_food_names() * 3)
+    _assert_identical(vectorizer, queries)
+
+def test_encode_dense_and_buffer_reuse():
+    vectorizer = TfidfVectorizer(stop_words="english").fit(get_catalog_food_names())
+    encoder = TfidfQueryEncoder.from_vectorizer(vectorizer)
+    buffer = encoder.encode_dense("injera pizza")
+    expected = vectorizer.transform(["doro wat"]).toarray()
+    assert encoder.encode_dense("Doro Wat", out=buffer) is buffer
+    np.testing.assert_array_equal(buffer, expected)
+
+def test_unsupported_vectorizers_fall_back():
+    char_vectorizer = TfidfVectorizer(analyzer="char").fit(["injera"])
+    assert make_query_encoder(char_vectorizer) is None
+    accents = TfidfVectorizer(strip_accents="unicode").fit(["injera"])
+    assert make_query_encoder(accents) is None
@@ -0,0 +1,52 @@
+from src.typeahead import TypeaheadIndex, trigrams, EXACT, PREFIX, WORD_PREFIX, FUZZY
+from src.food_index import build_food_search_index
+from src.data_generation import get_catalog_food_names
+import random
+import pytest
+
+NAMES = ["Injera", "Injera Firfir", "Barley Injera", "Doro Wat", "Misir Wat", "Pizza", "Pasta"]
+
+def test_ranking_exact_then_prefix_then_word_prefix():
+    index = TypeaheadIndex(NAMES, range(len(NAMES)))
+    results = index.search("  INJERA ", limit=10)
+    assert [(r["name"], r["match"]) for r in results[:3]] == [
+        ("Injera", EXACT), ("Injera Firfir", PREFIX), ("Barley Injera", WORD_PREFIX)
+    ]
+    assert results[0]["value"] == 0 and results[0]["score"] == 1.0
+    assert [r["name"] for r in index.search("wat", fuzzy=False)] == ["Doro Wat", "Misir Wat"]
+    assert [r["name"] for r in index.search("p", limit=1)] == ["Pasta"]
+    assert index.search("") == [] and index.search("pizza", limit=0) == []
+
+def test_fuzzy_fallback_tolerates_typos():
+    index = TypeaheadIndex(NAMES)
+    results = index.search("injra")
+    assert results[0]["name"] == "Injera" and results[0]["match"] == FUZZY
+    assert index.search("qqqq") == []
+    with pytest.raises(ValueError):
+        TypeaheadIndex(NAMES, [1.0])
+
+@pytest.mark.parametrize("min_similarity", [0.2, 0.3, 0.5])
+def test_fuzzy_matches_brute_force(min_similarity):
+    # The length and shared-trigram filters must not drop any qualifying name
+    rng = random.Random(0)
+    words = " ".join(get_catalog_food_names()).lower().split()
+    names = list(get_catalog_food_names()) + [" ".join(rng.sample(words, rng.randint(1, 4))) for _ in range(500)]
+    index = TypeaheadIndex(names, min_similarity=min_similarity)
+    queries = ["injra", "dro wat", "x", "spicy pza"] + [rng.choice(names).lower()[:rng.randint(2, 20)] for _ in range(50)]
+    for query in queries:
+        query = " ".join(query.split())
+        query_grams = trigrams(query)
+        expected = []
+        for i, key in enumerate(index._keys):
+            grams = trigrams(key)
+            shared = len(query_grams & grams)
+            similarity = shared / (len(query_grams) + len(grams) - shared)
+            if similarity >= min_similarity:
+                expected.append((-similarity, i))
+        assert [i for i, _ in index._fuzzy(query, set(), len(names))] == [i for _, i in sorted(expected)]
+
+def test_food_search_index_uses_catalog_names():
+    index = build_food_search_index({"doro wat": 4.3})
+    results = index.search("doro")
+    assert results[0]["name"] == "Doro Wat" and results[0]["value"] == 4.3
+    assert len(index) == len({name.lower() for name in get_catalog_food_names()})